@@ -1,4 +1,4 @@
-from fastapi import APIRouter, HTTPException, Depends
+from fastapi import APIRouter, HTTPException, Depends, Request
 from pydantic import BaseModel
 from sqlalchemy.orm import Session
 from typing import Optional
@@ -66,4 +66,12 @@ async def login(req: LoginRequest, db: Session = Depends(get_db)):
 
 @router.get("/health")
 async def health_check():
-    return {"status": "online", "game": "AETERNUS", "version": "0.8.3"}
\ No newline at end of file
+    return {"status": "online", "game": "AETERNUS", "version": "0.8.3"}
+
+@router.get("/metrics/time")
+async def time_metrics(request: Request):
+    """Telemetria do relógio: histogramas por tick/tarefa/inscrito, estouros e lag."""
+    time_engine = getattr(request.app.state, "time", None)
+    if not time_engine:
+        raise HTTPException(status_code=503, detail="TimeEngine offline.")
+    return time_engine.metrics.snapshot()
\ No newline at end of file
@@ -30,4 +30,18 @@ LOG_LEVEL = os.getenv("LOG_LEVEL", "INFO")
 LOG_FILE = os.path.join(BASE_DIR, "aeternus.log")
 
 # 7. Debug
-DEBUG_MODE = os.getenv("DEBUG", "True").lower() == "true"
\ No newline at end of file
+DEBUG_MODE = os.getenv("DEBUG", "True").lower() == "true"
+# Nomes (separados por vírgula) com papel de administrador (comandos lag, eventos...)
+ADMIN_PLAYERS = {n.strip().lower() for n in os.getenv("ADMIN_PLAYERS", "").split(",") if n.strip()}
+
+# 8. Determinismo e Replay de Combate
+# Semente raiz dos fluxos de RNG (vazio = aleatória, registrada no log)
+WORLD_SEED = int(os.environ["WORLD_SEED"]) if os.getenv("WORLD_SEED") else None
+# Grava cada sessão de combate em disco para re-simulação offline (replay_combat.py)
+COMBAT_REPLAY_ENABLED = os.getenv("COMBAT_REPLAY", "False").lower() == "true"
+COMBAT_REPLAY_DIR = os.getenv("COMBAT_REPLAY_DIR", os.path.join(BASE_DIR, "replays"))
+# Só persiste sessões com pelo menos N rounds (0 = todas)
+COMBAT_REPLAY_MIN_ROUNDS = int(os.getenv("COMBAT_REPLAY_MIN_ROUNDS", 0))
+# 9. Persistência de Estado (gamestate.json, grimoire.json)
+# Compacta os arquivos de estado com gzip (a leitura detecta o formato sozinha)
+STATE_COMPRESS = os.getenv("STATE_COMPRESS", "False").lower() == "true"
@@ -0,0 +1,39 @@
+# backend/game/commands/admin.py
+"""
+Comandos de administração e diagnóstico do servidor.
+"""
+
+
+def _is_admin(ctx) -> bool:
+    """Só o papel de admin (ADMIN_PLAYERS); o modo debug não libera nada."""
+    return bool(ctx.player and ctx.player.is_admin)
+
+
+async def cmd_lag(ctx) -> str:
+    """
+    Mostra a telemetria do relógio do mundo (custo dos ticks, estouros, lag).
+    Uso: lag
+    """
+    if not _is_admin(ctx):
+        return "Comando desconhecido."
+
+    time_engine = getattr(ctx.world, "time", None)
+    if not time_engine:
+        return "O relógio do mundo não está acessível (TimeEngine offline)."
+    return time_engine.metrics.format_report()
+
+
+async def cmd_eventos(ctx) -> str:
+    """
+    Mostra o tráfego do barramento de eventos (publicados, fundidos, latência).
+    Uso: eventos
+    """
+    if not _is_admin(ctx):
+        return "Comando desconhecido."
+    return ctx.world.events.format_report()
+
+
+def register_admin_commands(command_handler):
+    """Registro no handler principal."""
+    command_handler.register("lag", cmd_lag, ["metricas", "ticks"])
+    command_handler.register("eventos", cmd_eventos, ["barramento", "events"])
@@ -16,7 +16,13 @@ def cmd_look(ctx) -> str:
 
     buffer = []
     buffer.append(f"== {room.title} ==")
-    buffer.append(room.get_description(False)) 
+    buffer.append(room.get_description(not ctx.world.is_daytime))
+
+    # Tempo da zona (em cache no WeatherEngine)
+    weather = getattr(ctx.world, "weather", None)
+    if weather and not room.has_flag("INDOOR"):
+        line = weather.line(room.zone_id)
+        if line: buffer.append(line)
 
     # Entidades
     for uid in room.npcs_here:
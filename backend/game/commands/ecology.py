@@ -2,6 +2,7 @@
 """
 Comandos de interação com o sistema ecológico.
 """
+from backend.game.engines.time.climate import CLIMATE_NAMES
 
 async def cmd_fauna(ctx) -> str:
     """
@@ -45,12 +46,25 @@ async def cmd_clima(ctx) -> str:
     """
     Verifica o clima detalhado.
     """
-    if not hasattr(ctx.world, 'ecology') or not ctx.world.ecology:
+    weather = getattr(ctx.world, 'weather', None)
+    if not weather:
         return "Olhe para o céu... nada acontece."
-    
-    # Reutiliza o relatório da zona que já tem cabeçalho de clima
-    # Futuramente pode ser separado
-    return ctx.world.ecology.get_zone_report(1).split("-" * 40)[0] + "..."
+
+    zone_id = 1
+    current_room = ctx.world.get_room(ctx.player.location_vnum)
+    if current_room:
+        zone_id = current_room.zone_id
+
+    state = weather.get(zone_id)
+    if not state:
+        return "Olhe para o céu... nada acontece."
+
+    date = ctx.world.time.get_current_date() if getattr(ctx.world, 'time', None) else None
+    lines = [f"🌍 Clima da Zona {zone_id}: {CLIMATE_NAMES.get(state.climate, state.climate)}"]
+    if date:
+        lines.append(f"📅 {date} | 🍂 {date.season_name}")
+    lines.append(state.line)
+    return "\n".join(lines)
 
 def register_ecology_commands(command_handler):
     """Registro no handler principal."""
@@ -4,7 +4,6 @@ Comandos para interagir com o Grimório Vivo.
 """
 
 from typing import List
-import random
 
 async def cmd_lendas(ctx) -> str:
     """
@@ -19,21 +18,25 @@ async def cmd_lendas(ctx) -> str:
     # Filtros
     if ctx.args and ctx.args[0].lower() == "sobre" and len(ctx.args) > 1:
         target_name = " ".join(ctx.args[1:])
-        legends = grimoire.get_legends_about_player(target_name)
+        legends = grimoire.get_legends_about_player(target_name, limit=10)
         
         if not legends:
             return f"Nenhuma lenda existe sobre {target_name}... ainda."
         
         buffer = [f"=== LENDAS SOBRE {target_name.upper()} ===\n"]
-        for legend in sorted(legends, key=lambda l: l.epic_score, reverse=True):
+        for legend in legends:  # Já vêm da mais épica para a menos
             epic_bar = "★" * (legend.epic_score // 20)
             buffer.append(
                 f"{epic_bar} {legend.title}\n"
                 f"   Categoria: {legend.category.capitalize()} | "
                 f"Épica: {legend.epic_score}/100 | "
-                f"Conhecida por {len(legend.believers)} almas"
+                f"Conhecida por {grimoire.believer_count(legend.id)} almas"
             )
         
+        hidden = grimoire.protagonist_stats(target_name).count - len(legends)
+        if hidden > 0:
+            buffer.append(f"\n...e outras {hidden} lendas menores.")
+        
         return "\n".join(buffer)
     
     elif ctx.args and ctx.args[0].lower() == "zona":
@@ -41,24 +44,20 @@ async def cmd_lendas(ctx) -> str:
         room = ctx.world.get_room(ctx.player.location_vnum)
         zone_id, _ = ctx.world.factory._parse_vnum(room.vnum)
         
-        legends = grimoire.get_zone_legends(zone_id)
+        legends = grimoire.get_zone_legends(zone_id, limit=5)
         
         if not legends:
             return "Esta região ainda não tem lendas próprias."
         
         buffer = [f"=== LENDAS DESTA REGIÃO ===\n"]
-        for legend in legends[:5]:  # Top 5
+        for legend in legends:  # Top 5
             buffer.append(f"• {legend.title} ({legend.category})")
         
         return "\n".join(buffer)
     
     else:
         # Lista geral (top 10 mais épicas)
-        top_legends = sorted(
-            grimoire.legends.values(), 
-            key=lambda l: l.epic_score, 
-            reverse=True
-        )[:10]
+        top_legends = grimoire.top_legends(10)
         
         buffer = ["=== O GRIMÓRIO DAS GRANDES LENDAS ===\n"]
         
@@ -102,13 +101,13 @@ async def cmd_ouvir(ctx) -> str:
         return "Não vejo esse contador de histórias por aqui."
     
     # Verifica se o NPC conhece alguma lenda
-    memory = grimoire.npc_memories.get(target_npc.uid)
+    known = grimoire.known_legends(target_npc.uid)
     
-    if not memory or not memory.known_legends:
+    if not known:
         return f"{target_npc.name} olha para você sem entender. Talvez não saiba histórias."
     
     # Escolhe lenda aleatória que o NPC conhece
-    legend_id = random.choice(memory.known_legends)
+    legend_id = ctx.world.rng.stream("lore").choice(known)
     
     # NPC conta a história
     narrative = await grimoire.npc_tell_legend(target_npc.uid, legend_id)
@@ -128,9 +127,9 @@ async def cmd_reputacao(ctx) -> str:
     
     target_name = " ".join(ctx.args) if ctx.args else ctx.player.name
     
-    legends = grimoire.get_legends_about_player(target_name)
+    stats = grimoire.protagonist_stats(target_name)
     
-    if not legends:
+    if not stats:
         if target_name.lower() == ctx.player.name.lower():
             return (
                 "Sua história ainda está sendo escrita.\n"
@@ -139,10 +138,9 @@ async def cmd_reputacao(ctx) -> str:
         else:
             return f"{target_name} ainda não é conhecido nas canções."
     
-    # Calcula estatísticas
-    total_epic = sum(l.epic_score for l in legends)
-    avg_epic = total_epic // len(legends)
-    total_spread = sum(l.spread_count for l in legends)
+    # Estatísticas (agregados mantidos pelo índice do grimório)
+    avg_epic = stats.epic_avg
+    total_spread = stats.spread_sum
     
     # Classifica reputação
     if avg_epic >= 80:
@@ -158,26 +156,21 @@ async def cmd_reputacao(ctx) -> str:
         reputation_tier = "INICIANTE"
         emoji = "🌱"
     
-    # Categorias de lendas
-    categories = {}
-    for legend in legends:
-        categories[legend.category] = categories.get(legend.category, 0) + 1
-    
     buffer = [
         f"=== REPUTAÇÃO DE {target_name.upper()} ===",
         f"{emoji} Status: {reputation_tier}",
-        f"Lendas Registradas: {len(legends)}",
+        f"Lendas Registradas: {stats.count}",
         f"Épica Média: {avg_epic}/100",
         f"Vezes Contada: {total_spread}",
         "",
         "Tipos de Lendas:"
     ]
     
-    for cat, count in categories.items():
+    for cat, count in stats.categories.items():
         buffer.append(f"  • {cat.capitalize()}: {count}")
     
     buffer.append("\nLendas Mais Épicas:")
-    top_3 = sorted(legends, key=lambda l: l.epic_score, reverse=True)[:3]
+    top_3 = grimoire.get_legends_about_player(target_name, limit=3)
     
     for i, legend in enumerate(top_3, 1):
         buffer.append(f"  {i}. {legend.title} ({legend.epic_score}/100)")
@@ -195,19 +188,19 @@ async def cmd_mitos(ctx) -> str:
     if not grimoire.legends:
         return "O grimório está vazio. O mundo aguarda seus heróis."
     
-    legends = list(grimoire.legends.values())
+    index = grimoire.index
     
-    # Estatísticas
-    total_legends = len(legends)
-    total_spread = sum(l.spread_count for l in legends)
-    most_epic = max(legends, key=lambda l: l.epic_score)
-    most_told = max(legends, key=lambda l: l.spread_count)
+    # Estatísticas (agregados mantidos a cada mutação)
+    total_legends = len(grimoire.legends)
+    total_spread = index.total_spread
+    most_epic = grimoire.top_legends(1)[0]
+    most_told = (grimoire.top_legends(1, by="spread") or [most_epic])[0]
     
     # Protagonistas únicos
-    protagonists = set(l.protagonist for l in legends)
+    protagonists = index.by_protagonist
     
     # Lenda mais antiga
-    oldest = min(legends, key=lambda l: l.timestamp)
+    oldest = grimoire.oldest_legend()
     
     import datetime
     age_days = (datetime.datetime.utcnow().timestamp() - oldest.timestamp) / 86400
@@ -229,9 +222,7 @@ async def cmd_mitos(ctx) -> str:
         "Categorias:"
     ]
     
-    categories = {}
-    for legend in legends:
-        categories[legend.category] = categories.get(legend.category, 0) + 1
+    categories = index.category_counts()
     
     for cat, count in sorted(categories.items(), key=lambda x: x[1], reverse=True):
         buffer.append(f"  • {cat.capitalize()}: {count}")
@@ -2,6 +2,7 @@
 from typing import List, Dict
 from backend.models.character import Character
 from backend.game.utils.vnum import VNum
+from backend.game.engines.events.types import PlayerRemorted
 
 # Definição hardcoded das classes para o protótipo.
 # Futuramente isso deve ser lido de data/classes.json via Factory.
@@ -90,25 +91,18 @@ async def cmd_remort(ctx) -> str:
         10
     )
     
-    # NOVO: Registra Remort no Grimório (Memória do Mundo)
-    if hasattr(ctx.world, 'grimoire') and ctx.world.grimoire:
-        # Pega o nome da sala de forma segura
-        loc_name = "Desconhecido"
-        current_room = ctx.world.get_room(player.location_vnum)
-        if current_room:
-            loc_name = current_room.title
-
-        await ctx.world.grimoire.witness_event("remort", {
-            "player_name": player.name,
-            "player_level": 100,  # O nível que ele tinha antes do reset
-            "old_class": old_class,
-            "new_class": target_class_key,
-            "remort_count": player.remort_count,
-            "skill_kept": skill_to_keep,
-            "location_vnum": player.location_vnum,
-            "location_name": loc_name,
-            "year": 1000 # Pegar do TimeEngine se disponível no futuro
-        })
+    # Registra Remort no mundo (o Grimório assina o evento)
+    current_room = ctx.world.get_room(player.location_vnum)
+    ctx.world.events.publish(PlayerRemorted(
+        player_id=str(player.id),
+        player_name=player.name,
+        old_class=old_class,
+        new_class=target_class_key,
+        remort_count=player.remort_count,
+        skill_kept=skill_to_keep,
+        location_vnum=player.location_vnum,
+        location_name=current_room.title if current_room else "Desconhecido"
+    ))
     
     # Mensagem de Retorno
     return (
@@ -0,0 +1,243 @@
+# backend/game/engines/ai/brain.py
+"""
+CÉREBRO DOS NPCs (Agenda de Decisões por Heap)
+
+Cada NPC vivo tem um horário de próxima decisão num heap indexado (uid -> instante).
+A cada tick só os NPCs vencidos são acordados (pop_due), decidem por regras de
+forma síncrona e são reagendados: custo O(k log n) para k decisões, sem varrer
+os 50k NPCs do mundo.
+
+Regras (AI_BEHAVIOR.md), em ordem de prioridade:
+1. FUGIR: HP < 25% com inimigo na sala (combate ou predador).
+2. CURAR ALIADO: NPCs HEALER curam aliado (mesmo template) ferido na sala.
+3. ATACAR: AGGRESSIVE ataca um jogador presente na sala.
+4. PATRULHAR: NPCs PATROL seguem por uma saída aleatória.
+5. EMOTE: raramente, com jogador presente. É a única decisão que vai ao LLM:
+   entra numa fila assíncrona limitada; fila cheia ou LLM fora = emote por regra.
+"""
+import asyncio
+import logging
+import time
+from typing import List, Optional
+
+from backend.config.game_config import GAME_CONSTANTS
+from backend.game.utils.indexed_heap import IndexedHeap
+from backend.game.utils.vnum import VNum
+
+logger = logging.getLogger(__name__)
+
+# Tick do cérebro (segundos reais) e teto de decisões por tick (o resto fica vencido
+# no heap e sai no tick seguinte, em ordem de atraso)
+BRAIN_TICK = 1.0
+BRAIN_MAX_DECISIONS = 5000
+
+# Em combate o NPC reavalia mais rápido (fuga, cura)
+COMBAT_DECISION_INTERVAL = (2.0, 4.0)
+
+FLEE_HP_RATIO = 0.25
+HEAL_HP_RATIO = 0.5
+HEAL_AMOUNT_RATIO = 0.2
+
+# Emotes: chance por decisão com jogador na sala e fila do LLM
+EMOTE_CHANCE = 0.1
+LLM_QUEUE_SIZE = 32
+LLM_WORKERS = 2
+
+FALLBACK_EMOTES = (
+    "{name} observa ao redor, atento.",
+    "{name} fareja o ar.",
+    "{name} se move inquieto.",
+    "{name} encara você por um instante.",
+)
+
+
+class BrainEngine:
+    def __init__(self, world_manager, time_engine=None, combat_manager=None, ollama_service=None):
+        self.world = world_manager
+        self.time = time_engine
+        self.combat = combat_manager
+        self.ollama = ollama_service
+        self.enabled = True
+
+        self.agenda = IndexedHeap()
+        self.decisions = 0
+        self.llm_dropped = 0
+
+        self._llm_queue: Optional[asyncio.Queue] = None
+        self._llm_workers: List[asyncio.Task] = []
+
+        world_manager.on_npc_added(self.track)
+        world_manager.on_npc_removed(self.untrack)
+        for npc in world_manager.active_npcs.values():
+            self.track(npc)
+
+        self.task = None
+        if time_engine is not None:
+            self.task = time_engine.schedule_every(BRAIN_TICK, self.tick, name="ai:brain")
+
+    # ==========================================================================
+    # AGENDA
+    # ==========================================================================
+
+    def track(self, npc):
+        """Novo NPC: primeira decisão em fase aleatória (espalha a carga)."""
+        _, high = GAME_CONSTANTS["NPC_DECISION_INTERVAL"]
+        self.agenda.push(npc.uid, time.monotonic() + self.world.rng.stream("brain").uniform(0, high))
+
+    def untrack(self, uid: str):
+        self.agenda.remove(uid)
+
+    def _reschedule(self, npc, now: float, in_combat: bool):
+        low, high = COMBAT_DECISION_INTERVAL if in_combat else GAME_CONSTANTS["NPC_DECISION_INTERVAL"]
+        self.agenda.push(npc.uid, now + self.world.rng.stream("brain").uniform(low, high))
+
+    async def tick(self, now: Optional[float] = None) -> int:
+        """Acorda os NPCs vencidos. Retorna quantas decisões foram tomadas."""
+        if not self.enabled:
+            return 0
+        now = now if now is not None else time.monotonic()
+        due = self.agenda.pop_due(now, BRAIN_MAX_DECISIONS)
+        for uid, _ in due:
+            npc = self.world.active_npcs.get(uid)
+            if npc is None or not npc.is_alive():
+                continue
+            try:
+                in_combat = await self.decide(npc)
+            except Exception as e:
+                logger.error(f"🧠 Erro na decisão de {npc.name} ({uid}): {e}")
+                in_combat = False
+            # Pode ter morrido/sumido durante a decisão (untrack já rodou)
+            if uid in self.world.active_npcs:
+                self._reschedule(npc, now, in_combat)
+        self.decisions += len(due)
+        return len(due)
+
+    # ==========================================================================
+    # DECISÕES (REGRAS)
+    # ==========================================================================
+
+    async def decide(self, npc) -> bool:
+        """Toma uma decisão por regras. Retorna se o NPC segue em combate."""
+        room = self.world.get_room(npc.room_vnum)
+        if room is None:
+            return False
+        in_combat = bool(self.combat and self.combat.is_fighting(npc))
+        rng = self.world.rng.stream("brain")
+
+        hp_ratio = npc.current_hp / npc.total_hp if npc.total_hp else 1.0
+        if hp_ratio < FLEE_HP_RATIO and (in_combat or self._threatened(npc)):
+            if self._flee(npc, rng):
+                return False
+
+        if npc.has_flag("HEALER") and self._heal_ally(npc, room):
+            return in_combat
+
+        if in_combat:
+            return True
+
+        if npc.has_flag("AGGRESSIVE") and room.players_here and self.combat:
+            target = self.world.get_player(rng.choice(room.players_here))
+            if target:
+                await self.combat.start_combat(npc, target)
+                return True
+
+        if npc.has_flag("PATROL") and not npc.has_flag("SENTINEL"):
+            if self._step(npc, rng):
+                return False
+
+        if room.players_here and rng.random() < EMOTE_CHANCE:
+            self._request_emote(npc)
+        return False
+
+    def _threatened(self, npc) -> bool:
+        if self.world.is_predator(npc):
+            return False
+        return bool(self.world.room_predators.get(npc.room_vnum))
+
+    def _heal_ally(self, npc, room) -> bool:
+        for uid in room.npcs_here:
+            ally = self.world.get_npc(uid)
+            if (ally is None or ally is npc or ally.template_vnum != npc.template_vnum
+                    or not ally.total_hp or not ally.is_alive()):
+                continue
+            if ally.current_hp / ally.total_hp < HEAL_HP_RATIO:
+                amount = max(1, int(ally.total_hp * HEAL_AMOUNT_RATIO))
+                ally.current_hp = min(ally.total_hp, ally.current_hp + amount)
+                self._broadcast(room.vnum, f"✨ {npc.name} cuida dos ferimentos de {ally.name}.")
+                return True
+        return False
+
+    def _flee(self, npc, rng) -> bool:
+        exits = self._exits(npc)
+        if not exits:
+            return False
+        origin = npc.room_vnum
+        if self.combat:
+            self.combat.disengage(npc)
+        self.world.move_npc(npc.uid, rng.choice(exits))
+        self._broadcast(origin, f"🏃 {npc.name} foge em pânico!")
+        return True
+
+    def _step(self, npc, rng) -> bool:
+        exits = self._exits(npc)
+        return bool(exits) and self.world.move_npc(npc.uid, rng.choice(exits))
+
+    def _exits(self, npc) -> List[int]:
+        """Saídas abertas da sala do NPC (STAY_ZONE não cruza a zona)."""
+        room = self.world.get_room(npc.room_vnum)
+        zone_id, _ = VNum.parse(npc.room_vnum)
+        stay_zone = npc.has_flag("STAY_ZONE")
+        return [e.target_vnum for e in room.exits.values()
+                if not e.is_locked and e.target_vnum in self.world.rooms
+                and not (stay_zone and VNum.parse(e.target_vnum)[0] != zone_id)]
+
+    # ==========================================================================
+    # LLM (FILA LIMITADA)
+    # ==========================================================================
+
+    def _request_emote(self, npc):
+        if self.ollama is None:
+            self._fallback_emote(npc)
+            return
+        if self._llm_queue is None:
+            # Criados sob demanda: exige loop rodando
+            self._llm_queue = asyncio.Queue(maxsize=LLM_QUEUE_SIZE)
+            self._llm_workers = [asyncio.create_task(self._llm_worker()) for _ in range(LLM_WORKERS)]
+        try:
+            self._llm_queue.put_nowait(npc.uid)
+        except asyncio.QueueFull:
+            self.llm_dropped += 1
+            self._fallback_emote(npc)
+
+    async def _llm_worker(self):
+        while True:
+            uid = await self._llm_queue.get()
+            npc = None
+            try:
+                npc = self.world.get_npc(uid)
+                room = self.world.get_room(npc.room_vnum) if npc else None
+                # Jogadores podem ter saído enquanto esperava na fila
+                if not npc or not room or not room.players_here:
+                    continue
+                prompt = (
+                    f"Você é {npc.name}, uma criatura num mundo de fantasia sombria. "
+                    f"Descreva em uma frase curta, na terceira pessoa, uma ação que você faz agora."
+                )
+                text = (await self.ollama.generate(prompt)).strip()
+                if text:
+                    self._broadcast(room.vnum, text)
+                else:
+                    self._fallback_emote(npc)
+            except Exception as e:
+                logger.warning(f"🧠 LLM indisponível para emote ({e}); usando regra.")
+                if npc:
+                    self._fallback_emote(npc)
+            finally:
+                self._llm_queue.task_done()
+
+    def _fallback_emote(self, npc):
+        line = self.world.rng.stream("brain").choice(FALLBACK_EMOTES)
+        self._broadcast(npc.room_vnum, line.format(name=npc.name))
+
+    def _broadcast(self, room_vnum: int, message: str):
+        logger.info(f"[ROOM {room_vnum}] {message.strip()}")
@@ -1,11 +1,11 @@
 # backend/game/engines/ai/ecosystem.py
-import random
 import logging
 from typing import List, Optional
 from backend.models.npc import NPCInstance
 from backend.models.room import Room
 from backend.game.engines.ai.nemesis import NemesisEngine
 from backend.game.utils.vnum import VNum
+from backend.game.engines.events.types import NPCProgressed, NPCEvolved, ZoneAlphaCrowned
 
 logger = logging.getLogger(__name__)
 
@@ -19,10 +19,12 @@ class EcosystemEngine:
 
     async def run_simulation_cycle(self, game_date=None):
         """Executado periodicamente pelo servidor (TimeEngine)."""
-        # Itera sobre todas as salas ativas no mundo
-        for room in self.world.rooms.values():
-            # Pega o estado da zona desta sala
-            zone_id, _ = VNum.parse(room.vnum)
+        # Só salas disputadas (>= 1 predador + outro NPC), mantidas pelo WorldManager
+        for room_vnum in list(self.world.contested_rooms):
+            room = self.world.get_room(room_vnum)
+            if not room:
+                continue
+            zone_id, _ = VNum.parse(room_vnum)
             zone_alpha = self.world.get_zone_alpha(zone_id)
             
             await self._process_room_ecology(room, zone_alpha)
@@ -31,44 +33,43 @@ class EcosystemEngine:
         """
         Simula a violência dentro de uma sala.
         """
-        # Converte lista de UUIDs para Objetos NPC reais
-        npcs_in_room = []
-        for uid in room.npcs_here:
-            npc_obj = self.world.get_npc(uid)
-            if npc_obj:
-                npcs_in_room.append(npc_obj)
-        
-        if len(npcs_in_room) < 2:
-            # Lógica de migração poderia entrar aqui (mover NPC para sala vizinha)
-            return
+        # Partição predador/presa em cache; relida a cada predador porque
+        # cada combate mata alguém
+        predator_uids, _ = self.world.get_room_partition(room.vnum)
 
-        # Separa predadores e presas
-        predators = [n for n in npcs_in_room if n.has_flag("PREDATOR") or n.has_flag("AGGRESSIVE")]
-        potential_victims = [n for n in npcs_in_room if n not in predators]
+        rng = self.world.rng.stream("ecology")
+        for predator_uid in predator_uids:
+            predator = self.world.get_npc(predator_uid)
+            if not predator or predator.room_vnum != room.vnum:
+                continue
 
-        for predator in predators:
             # O Alpha não tolera concorrência do mesmo tipo
             if zone_alpha and predator.uid != zone_alpha.uid and predator.name == zone_alpha.name: # Simplificação por nome/tipo
                  await self._resolve_background_combat(zone_alpha, predator, room)
                  continue
 
+            predators, prey = self.world.get_room_partition(room.vnum)
+
             # Predador caça presa
-            if potential_victims:
-                victim = random.choice(potential_victims)
-                await self._resolve_background_combat(predator, victim, room)
+            if prey:
+                victim = self.world.get_npc(rng.choice(prey))
+                if victim:
+                    await self._resolve_background_combat(predator, victim, room)
                 
             # Canibalismo (Se não há comida)
             elif len(predators) > 1:
-                rival = random.choice([p for p in predators if p != predator])
-                await self._resolve_background_combat(predator, rival, room)
+                rival = self.world.get_npc(rng.choice([uid for uid in predators if uid != predator.uid]))
+                if rival:
+                    await self._resolve_background_combat(predator, rival, room)
 
     async def _resolve_background_combat(self, attacker: NPCInstance, defender: NPCInstance, room: Room):
         """
         Resolve combate rápido (simulado).
         """
         # Power Rating simplificado
-        attacker_power = attacker.total_hp * random.uniform(0.8, 1.2)
-        defender_power = defender.total_hp * random.uniform(0.8, 1.2)
+        rng = self.world.rng.stream("ecology")
+        attacker_power = attacker.total_hp * rng.uniform(0.8, 1.2)
+        defender_power = defender.total_hp * rng.uniform(0.8, 1.2)
 
         if attacker_power > defender_power:
             winner = attacker
@@ -95,6 +96,9 @@ class EcosystemEngine:
         # 3. Evolução
         if self.nemesis._check_evolution_threshold(winner):
             self.nemesis._evolve_npc(winner)
+            self.world.events.publish(NPCEvolved(winner.uid, winner.name,
+                                                 winner.progression.evolution_stage, room.vnum))
+        self.world.events.publish(NPCProgressed(winner.uid))
 
         # 4. Checagem de Alpha da Zona
         if winner.progression.kills_count > 10 and not winner.has_flag("ZONE_ALPHA"):
@@ -108,4 +112,5 @@ class EcosystemEngine:
         
         npc.flags.append("ZONE_ALPHA")
         npc.progression.dynamic_titles.append("o Apex da Região")
+        self.world.events.publish(ZoneAlphaCrowned(zone_id, npc.uid, npc.full_name))
         logger.info(f"👑 NOVO ALPHA: {npc.full_name} assumiu a Zona {zone_id}!")
\ No newline at end of file
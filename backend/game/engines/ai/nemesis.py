@@ -1,9 +1,9 @@
 # backend/game/engines/ai/nemesis.py
-import random
 import logging
 from datetime import datetime
 from backend.models.npc import NPCInstance
 from backend.models.character import Character
+from backend.game.engines.events.types import EntityKilled, NPCProgressed, NPCEvolved
 
 logger = logging.getLogger(__name__)
 
@@ -21,7 +21,27 @@ class NemesisEngine:
         "poison": ["o Peçonhento", "Língua Podre", "o Tocado pela Peste"]
     }
 
-    async def register_player_death(self, killer_npc: NPCInstance, victim: Character, damage_type: str, zone_state: dict):
+    def __init__(self, world_manager=None):
+        self.world = world_manager
+        if world_manager is not None:
+            world_manager.events.subscribe(EntityKilled, self._on_entity_killed)
+
+    async def _on_entity_killed(self, event: EntityKilled):
+        """Só interessa NPC matando jogador."""
+        if not event.killer_uid or not event.victim.is_player:
+            return
+        killer = self.world.get_npc(event.killer_uid)
+        victim = self.world.get_entity(event.victim)
+        if killer is None or victim is None:
+            return
+        stage = killer.progression.evolution_stage
+        await self.register_player_death(killer, victim, event.damage_type or "", self.world.zones.get(event.zone_id))
+        if killer.progression.evolution_stage != stage:
+            self.world.events.publish(NPCEvolved(killer.uid, killer.name,
+                                                 killer.progression.evolution_stage, killer.room_vnum))
+        self.world.events.publish(NPCProgressed(killer.uid))
+
+    async def register_player_death(self, killer_npc: NPCInstance, victim: Character, damage_type: str, zone_state=None):
         """
         Chamado quando um NPC mata um jogador.
         """
@@ -55,11 +75,12 @@ class NemesisEngine:
 
     def _generate_title(self, damage_type: str, victim_name: str) -> str:
         """Gera um título ofensivo ou grandioso."""
-        if random.random() < 0.10:
+        rng = self.world.rng.stream("nemesis")
+        if rng.random() < 0.10:
             return f"o Pesadelo de {victim_name}"
         
         options = self.TITLES_BY_DAMAGE_TYPE.get(damage_type, ["o Assassino"])
-        return random.choice(options)
+        return rng.choice(options)
 
     def _check_evolution_threshold(self, npc: NPCInstance) -> bool:
         """Define se o NPC está pronto para crescer."""
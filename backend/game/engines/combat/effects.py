@@ -0,0 +1,212 @@
+# backend/game/engines/combat/effects.py
+"""
+MOTOR DE EFEITOS DE STATUS (Sangramento, Atordoamento, Pressa, Lentidão, Queimadura)
+
+Aplica as definições de COMBAT_EFFECTS sobre uma roda de tempo hierárquica.
+Cada efeito ativo tem no máximo dois timers (próximo tick de dano e expiração),
+então aplicar, renovar, tickar e expirar custam O(1) amortizado, e o custo por
+round depende só dos timers que vencem, não de quantas entidades têm efeitos.
+
+Unidade de tempo: 1 tick = 1 round de combate. Um efeito aplicado no tick t
+vale nos rounds t+1 .. t+duration e expira no início do round t+duration+1.
+"""
+import logging
+from typing import Any, Callable, Dict, List, Optional
+
+from backend.config.constants import COMBAT_EFFECTS
+from backend.game.utils.timing_wheel import HierarchicalTimingWheel, TimerHandle
+
+logger = logging.getLogger(__name__)
+
+# Verbo da narração do dano periódico ("Goblin sangra (5).", "você queima (3).")
+EFFECT_VERBS = {
+    "bleed": "sangra",
+    "burn": "queima",
+}
+
+# Efeito aplicado por um crítico, por tipo de dano
+CRIT_EFFECTS = {
+    "slash": "bleed",
+    "pierce": "bleed",
+    "blunt": "stun",
+    "fire": "burn",
+    "magic": "burn",
+}
+
+
+class ActiveEffect:
+    """Um efeito vivo numa entidade."""
+    __slots__ = ("effect_id", "target", "source", "damage", "tick_rate",
+                 "expires_at", "expiry_timer", "tick_timer")
+
+    def __init__(self, effect_id: str, target, source=None, damage: int = 0, tick_rate: int = 0):
+        self.effect_id = effect_id
+        self.target = target
+        self.source = source
+        self.damage = damage
+        self.tick_rate = tick_rate
+        self.expires_at = 0
+        self.expiry_timer: Optional[TimerHandle] = None
+        self.tick_timer: Optional[TimerHandle] = None
+
+    @property
+    def is_dot(self) -> bool:
+        return self.damage > 0 and self.tick_rate > 0
+
+
+class StatusEffectEngine:
+    """
+    Efeitos de status indexados por EntityHandle.
+    on_damage(target_handle, effect_id, amount, source_handle) é chamado a cada
+    tick de dano periódico; quem aplica o dano (CombatManager) decide o resto.
+    """
+
+    def __init__(self, world_manager, on_damage: Optional[Callable] = None,
+                 definitions: Optional[Dict[str, Dict[str, Any]]] = None):
+        self.world = world_manager
+        self.on_damage = on_damage
+        self.definitions = definitions if definitions is not None else COMBAT_EFFECTS
+        self.wheel = HierarchicalTimingWheel(slots_per_level=64, levels=3)
+        self.active: Dict[Any, Dict[str, ActiveEffect]] = {}
+
+    # ==========================================================================
+    # API
+    # ==========================================================================
+
+    def apply(self, target, effect_id: str, source=None, duration: Optional[int] = None) -> Optional[ActiveEffect]:
+        """Aplica ou renova um efeito. Renovar reinicia a duração (não acumula)."""
+        definition = self.definitions.get(effect_id)
+        if definition is None or target is None:
+            return None
+
+        effects = self.active.setdefault(target, {})
+        effect = effects.get(effect_id)
+        if effect is None:
+            effect = ActiveEffect(
+                effect_id, target, source,
+                damage=int(definition.get("damage", 0)),
+                tick_rate=int(definition.get("tick_rate", 0)),
+            )
+            effects[effect_id] = effect
+        else:
+            self._cancel_timers(effect)
+            if source is not None:
+                effect.source = source
+
+        duration = int(duration if duration is not None else definition.get("duration", 1))
+        effect.expires_at = self.wheel.current_tick + duration + 1
+        effect.expiry_timer = self.wheel.schedule_at(effect.expires_at, self._expire, effect)
+        if effect.is_dot:
+            effect.tick_timer = self.wheel.schedule(effect.tick_rate, self._tick_damage, effect)
+        return effect
+
+    def remove(self, target, effect_id: str) -> bool:
+        effects = self.active.get(target)
+        if not effects or effect_id not in effects:
+            return False
+        self._cancel_timers(effects.pop(effect_id))
+        if not effects:
+            del self.active[target]
+        return True
+
+    def clear(self, target):
+        """Remove todos os efeitos da entidade (morte, saída do jogo)."""
+        effects = self.active.pop(target, None)
+        if effects:
+            for effect in effects.values():
+                self._cancel_timers(effect)
+
+    def has(self, target, effect_id: str) -> bool:
+        effects = self.active.get(target)
+        return bool(effects) and effect_id in effects
+
+    def get_effects(self, target) -> List[str]:
+        return list(self.active.get(target, {}).keys())
+
+    def hit_chance_multiplier(self, attacker) -> float:
+        """Multiplicador da chance de acerto do atacante (stun zera, haste/slow ajustam)."""
+        effects = self.active.get(attacker)
+        if not effects:
+            return 1.0
+
+        multiplier = 1.0
+        for effect_id in effects:
+            definition = self.definitions[effect_id]
+            if "miss_chance" in definition:
+                multiplier *= max(0.0, 1.0 - definition["miss_chance"])
+            if "speed_bonus" in definition:
+                multiplier *= 1.0 + definition["speed_bonus"]
+            if "speed_penalty" in definition:
+                multiplier *= max(0.0, 1.0 - definition["speed_penalty"])
+        return multiplier
+
+    def advance(self, ticks: int = 1) -> int:
+        """Avança o relógio dos efeitos e dispara o que venceu. Retorna timers disparados."""
+        fired = 0
+        # Um tick por vez: DoTs reagendados precisam ver o relógio correto
+        for _ in range(max(0, int(ticks))):
+            for timer in self.wheel.advance(1):
+                timer.fire()
+                fired += 1
+        return fired
+
+    def snapshot(self, target) -> List[List[Any]]:
+        """[[efeito, ticks restantes, próximo tick de dano em], ...] (para replay)."""
+        now = self.wheel.current_tick
+        out = []
+        for effect in self.active.get(target, {}).values():
+            next_tick = effect.tick_timer.deadline - now if effect.tick_timer else 0
+            out.append([effect.effect_id, effect.expires_at - now, next_tick])
+        return out
+
+    def restore(self, target, data: List[List[Any]]):
+        """Recria efeitos de um snapshot, preservando as fases relativas dos timers."""
+        for effect_id, remaining, next_tick in data:
+            effect = self.apply(target, effect_id, duration=max(0, remaining - 1))
+            if effect is None:
+                continue
+            self.wheel.cancel(effect.tick_timer)
+            effect.tick_timer = None
+            if next_tick:
+                effect.tick_timer = self.wheel.schedule(next_tick, self._tick_damage, effect)
+
+    def __len__(self) -> int:
+        return sum(len(effects) for effects in self.active.values())
+
+    # ==========================================================================
+    # TIMERS
+    # ==========================================================================
+
+    def _tick_damage(self, effect: ActiveEffect):
+        effect.tick_timer = None
+        if not self._is_current(effect):
+            return
+        if self.world.entities.resolve(effect.target) is None:
+            # Entidade sumiu (morreu, deslogou): o handle antigo não resolve mais
+            self.clear(effect.target)
+            return
+
+        if self.on_damage:
+            self.on_damage(effect.target, effect.effect_id, effect.damage, effect.source)
+
+        # O callback pode ter matado a entidade e limpado os efeitos
+        if not self._is_current(effect):
+            return
+        next_tick = self.wheel.current_tick + effect.tick_rate
+        if next_tick < effect.expires_at:
+            effect.tick_timer = self.wheel.schedule_at(next_tick, self._tick_damage, effect)
+
+    def _expire(self, effect: ActiveEffect):
+        effect.expiry_timer = None
+        if self._is_current(effect):
+            self.remove(effect.target, effect.effect_id)
+
+    def _is_current(self, effect: ActiveEffect) -> bool:
+        """Timers de um efeito removido/renovado podem já ter vencido no mesmo tick."""
+        return self.active.get(effect.target, {}).get(effect.effect_id) is effect
+
+    def _cancel_timers(self, effect: ActiveEffect):
+        self.wheel.cancel(effect.tick_timer)
+        self.wheel.cancel(effect.expiry_timer)
+        effect.tick_timer = None
+        effect.expiry_timer = None
@@ -1,6 +1,8 @@
 # backend/game/engines/combat/flavor.py
 import random
 
+from backend.game.engines.combat.narration import CompiledTemplate, compile_all
+
 class CombatNarrator:
     """
     Gera descrições viscerais para momentos extremos do combate.
@@ -50,19 +52,29 @@ class CombatNarrator:
         "{att} hesita no último segundo, transformando um ataque promissor em um movimento desajeitado.",
     ]
 
+    # Versões pré-compiladas (parse único no import)
+    COMPILED_FATALITIES = {key: compile_all(templates) for key, templates in FATALITIES.items()}
+    COMPILED_FUMBLES = compile_all(FUMBLES)
+
+    @staticmethod
+    def pick_fatality(dmg_type, rng=random) -> CompiledTemplate:
+        """Sorteia o template de Fatality (sem renderizar)."""
+        # Tenta pegar específico do tipo, senão vai pro default
+        key = dmg_type if dmg_type in CombatNarrator.COMPILED_FATALITIES else "default"
+        return rng.choice(CombatNarrator.COMPILED_FATALITIES[key])
+
+    @staticmethod
+    def pick_fumble(rng=random) -> CompiledTemplate:
+        """Sorteia o template de Falha Crítica (sem renderizar)."""
+        return rng.choice(CombatNarrator.COMPILED_FUMBLES)
+
     @staticmethod
     def get_fatality(attacker_name, defender_name, dmg_type):
         """Retorna uma descrição de Fatality formatada."""
-        # Tenta pegar específico do tipo, senão vai pro default
-        key = dmg_type if dmg_type in CombatNarrator.FATALITIES else "default"
-        templates = CombatNarrator.FATALITIES[key]
-        
-        template = random.choice(templates)
         # CORREÇÃO: Usando 'defender' como chave para evitar conflito com keyword 'def'
-        return template.format(att=attacker_name, defender=defender_name)
+        return CombatNarrator.pick_fatality(dmg_type).render({"att": attacker_name, "defender": defender_name})
 
     @staticmethod
     def get_fumble(attacker_name):
         """Retorna uma descrição de Falha Crítica."""
-        template = random.choice(CombatNarrator.FUMBLES)
-        return template.format(att=attacker_name)
\ No newline at end of file
+        return CombatNarrator.pick_fumble().render({"att": attacker_name})
@@ -40,7 +40,7 @@ class CombatFormulas:
         return max(5.0, min(95.0, base_chance + diff)) / 100.0
 
     @staticmethod
-    def select_body_part(defender) -> Tuple[str, Optional[BodyPartInstance]]:
+    def select_body_part(defender, rng=random) -> Tuple[str, Optional[BodyPartInstance]]:
         anatomy = defender.anatomy_state if isinstance(defender, NPCInstance) else defender.anatomy
         if not anatomy: return "body", None
 
@@ -54,11 +54,11 @@ class CombatFormulas:
 
         if not choices: return "torso", None
         
-        selected_id = random.choices(choices, weights=weights, k=1)[0]
+        selected_id = rng.choices(choices, weights=weights, k=1)[0]
         return selected_id, anatomy[selected_id]
 
     @staticmethod
-    def calculate_damage(attacker, weapon_tmpl: Optional[ItemTemplate], is_crit: bool) -> Dict[str, Any]:
+    def calculate_damage(attacker, weapon_tmpl: Optional[ItemTemplate], is_crit: bool, rng=random) -> Dict[str, Any]:
         """
         Calcula o dano base.
         Crítico (5% chance): Dano x1.5
@@ -77,7 +77,7 @@ class CombatFormulas:
             dmg_max = 3 + int(str_stat / 4)
             dmg_type = "blunt"
 
-        base_dmg = random.randint(dmg_min, dmg_max)
+        base_dmg = rng.randint(dmg_min, dmg_max)
         attribute_bonus = str_stat * 0.5 
         
         total_damage = base_dmg + attribute_bonus
@@ -2,12 +2,22 @@
 import logging
 import random
 import asyncio
-from typing import Dict, List, Optional, Set
+from typing import Dict, List, Optional
 
+from backend.config.server_config import (
+    COMBAT_REPLAY_ENABLED, COMBAT_REPLAY_DIR, COMBAT_REPLAY_MIN_ROUNDS
+)
 from backend.game.world.world_manager import WorldManager
+from backend.game.world.entities import EntityHandle, EntityKind
 from backend.game.engines.combat.formulas import CombatFormulas
 from backend.game.engines.combat.flavor import CombatNarrator
+from backend.game.engines.combat.effects import StatusEffectEngine, EFFECT_VERBS, CRIT_EFFECTS
+from backend.game.engines.combat.narration import (
+    NarrationEvent, render_round, EV_MISS, EV_FUMBLE, EV_HIT, EV_FATALITY, EV_EFFECT
+)
+from backend.game.engines.combat.replay import CombatRecorder, snapshot_entity, state_digest
 from backend.game.engines.leveling.leveling import LevelingEngine
+from backend.game.engines.events.types import EntityKilled, PlayerLeveledUp, CatalystDropped
 from backend.models.character import Character
 from backend.models.npc import NPCInstance, BodyPartInstance
 from backend.models.item import ItemInstance, ItemTemplate, ItemDamage
@@ -15,19 +25,41 @@ from backend.models.item import ItemInstance, ItemTemplate, ItemDamage
 logger = logging.getLogger(__name__)
 
 class CombatSession:
-    def __init__(self, room_vnum: int):
+    def __init__(self, room_vnum: int, seed: Optional[int] = None):
         self.room_vnum = room_vnum
-        self.participants: Set[str] = set() 
-        self.targets: Dict[str, str] = {}
-        self.round_log: List[str] = []
-
-    def add_participant(self, entity_id: str, target_id: str):
-        self.participants.add(entity_id)
-        self.participants.add(target_id)
+        # Dict como conjunto ordenado: a ordem de ataque é a ordem de entrada
+        self.participants: Dict[EntityHandle, None] = {}
+        self.targets: Dict[EntityHandle, EntityHandle] = {}
+        # Eventos do round; o texto só é montado se houver quem leia
+        self.round_log: List[NarrationEvent] = []
+
+        # RNG próprio: a sessão é reproduzível a partir da semente
+        self.seed = seed if seed is not None else random.getrandbits(64)
+        self.rng = random.Random(self.seed)
+        self.recorder: Optional[CombatRecorder] = None
+
+    def add_participant(self, entity_id: EntityHandle, target_id: EntityHandle):
+        self.participants[entity_id] = None
+        self.participants[target_id] = None
         self.targets[entity_id] = target_id
         if target_id not in self.targets:
             self.targets[target_id] = entity_id
 
+    def remove_participant(self, entity_id: EntityHandle):
+        """Tira alguém da luta (fuga). Quem mirava nele troca de alvo ou sai."""
+        self.participants.pop(entity_id, None)
+        self.targets.pop(entity_id, None)
+        for attacker_id, target_id in list(self.targets.items()):
+            if target_id != entity_id:
+                continue
+            # Revida quem ainda o ataca; sem inimigos, deixa o combate
+            enemy = next((a for a, t in self.targets.items() if t == attacker_id), None)
+            if enemy is not None:
+                self.targets[attacker_id] = enemy
+            else:
+                del self.targets[attacker_id]
+                self.participants.pop(attacker_id, None)
+
     def is_active(self):
         return len(self.participants) >= 2
 
@@ -35,32 +67,64 @@ class CombatManager:
     def __init__(self, world_manager: WorldManager):
         self.world = world_manager
         self.sessions: Dict[int, CombatSession] = {}
+        # Sangramento, atordoamento etc. (1 tick da roda = 1 round)
+        self.effects = StatusEffectEngine(world_manager, on_damage=self._apply_effect_damage)
+        self.replay_enabled = COMBAT_REPLAY_ENABLED
 
     async def start_combat(self, attacker, defender):
         att_id = self._get_id(attacker)
         def_id = self._get_id(defender)
-        room_vnum = attacker.location_vnum if isinstance(attacker, Character) else attacker.room_vnum
+        room_vnum = attacker.location_vnum if att_id.is_player else attacker.room_vnum
         
         session = self.sessions.get(room_vnum)
         if not session:
-            session = CombatSession(room_vnum)
+            session = CombatSession(room_vnum, seed=self.world.rng.spawn_seed("combat"))
+            if self.replay_enabled:
+                session.recorder = CombatRecorder(room_vnum, session.seed, self.world.rng.root_seed)
             self.sessions[room_vnum] = session
-            
+
+        if session.recorder:
+            for entity in (attacker, defender):
+                if entity.handle not in session.recorder.ordinals:
+                    session.recorder.record_entity(entity, snapshot_entity(self.world, entity, self.effects))
+            session.recorder.record_engage(att_id, def_id)
+
         session.add_participant(att_id, def_id)
-        name_att = attacker.name
-        name_def = defender.name
-        self._broadcast_to_room(room_vnum, f"\n⚔️ {name_att} INICIOU COMBATE CONTRA {name_def}!\n")
+        if self._get_recipients(room_vnum):
+            self._broadcast_to_room(room_vnum, f"\n⚔️ {attacker.name} INICIOU COMBATE CONTRA {defender.name}!\n")
+
+    def is_fighting(self, entity) -> bool:
+        room_vnum = entity.location_vnum if entity.handle.is_player else entity.room_vnum
+        session = self.sessions.get(room_vnum)
+        return bool(session and entity.handle in session.participants)
+
+    def disengage(self, entity):
+        """Remove a entidade da sessão da sala atual (antes de ela sair da sala)."""
+        room_vnum = entity.location_vnum if entity.handle.is_player else entity.room_vnum
+        session = self.sessions.get(room_vnum)
+        if session and entity.handle in session.participants:
+            session.remove_participant(entity.handle)
 
     async def process_round(self):
+        for session in self.sessions.values():
+            session.round_log.clear()
+
+        # Efeitos andam mesmo sem combate ativo (DoT continua após a fuga)
+        self.effects.advance(1)
+
         if not self.sessions: return
         for room_vnum in list(self.sessions.keys()):
             session = self.sessions[room_vnum]
             await self._resolve_session(session)
+            if session.recorder:
+                session.recorder.record_round(
+                    state_digest(session.recorder.entities, session.round_log), len(session.round_log)
+                )
             if not session.is_active():
                 del self.sessions[room_vnum]
+                self._save_replay(session)
 
     async def _resolve_session(self, session: CombatSession):
-        session.round_log.clear()
         dead_entities = set()
 
         for entity_id in list(session.participants):
@@ -70,7 +134,7 @@ class CombatManager:
             defender = self._get_entity(target_id)
 
             if not attacker or not defender:
-                session.participants.discard(entity_id)
+                session.participants.pop(entity_id, None)
                 continue
                 
             if not self._is_alive(attacker) or not self._is_alive(defender):
@@ -79,36 +143,67 @@ class CombatManager:
             self._execute_attack(attacker, defender, session, dead_entities)
 
         if session.round_log:
-            msg = "\n".join(session.round_log)
-            self._broadcast_to_room(session.room_vnum, msg)
+            self._deliver_round(session)
+
+    def _deliver_round(self, session: CombatSession):
+        """Renderiza o round por destinatário. Sala sem jogadores = zero formatação."""
+        recipients = self._get_recipients(session.room_vnum)
+        if not recipients:
+            return
+
+        shared_cache = {}
+        for player in recipients:
+            settings = player.settings
+            text = render_round(session.round_log, player.handle,
+                                settings.compact_combat, settings.brief_mode, shared_cache)
+            if text:
+                self._send_to_player(player, text)
+
+    def _save_replay(self, session: CombatSession):
+        recorder = session.recorder
+        if not recorder or recorder.rounds < COMBAT_REPLAY_MIN_ROUNDS:
+            return
+        try:
+            name = f"combat_{session.room_vnum}_{session.seed:016x}.arp"
+            path = recorder.save(COMBAT_REPLAY_DIR, name)
+            logger.info(f"🎞️ Replay de combate salvo: {path} ({recorder.rounds} rounds)")
+        except OSError as e:
+            logger.error(f"Erro ao salvar replay de combate: {e}")
 
     def _execute_attack(self, attacker, defender, session, dead_set):
-        weapon_tmpl = self._determine_attack_source(attacker)
-        weapon_name = weapon_tmpl.name
+        rng = session.rng
+        weapon_tmpl = self._determine_attack_source(attacker, rng)
         weapon_flags = weapon_tmpl.flags
+        att_id = attacker.handle
+        def_id = defender.handle
 
         hit_chance = CombatFormulas.calculate_hit_chance(attacker, defender, weapon_tmpl)
-        roll = random.random()
+        hit_chance = min(0.95, hit_chance * self.effects.hit_chance_multiplier(att_id))
+        roll = rng.random()
 
         if roll >= 0.95:
-            fumble_msg = CombatNarrator.get_fumble(attacker.name)
-            session.round_log.append(f"❌ {fumble_msg}")
+            session.round_log.append(NarrationEvent(
+                EV_FUMBLE, att_id, def_id, attacker.name, defender.name,
+                flavor=CombatNarrator.pick_fumble(rng)
+            ))
             return
 
         if roll > hit_chance:
-            session.round_log.append(f"{attacker.name} tenta atacar com {weapon_name}, mas {defender.name} esquiva!")
+            session.round_log.append(NarrationEvent(
+                EV_MISS, att_id, def_id, attacker.name, defender.name, weapon=weapon_tmpl.name
+            ))
             return
 
-        part_id, body_part = CombatFormulas.select_body_part(defender)
+        part_id, body_part = CombatFormulas.select_body_part(defender, rng)
         part_name = body_part.name if body_part else "o corpo"
 
         is_crit = (roll <= 0.05)
-        dmg_info = CombatFormulas.calculate_damage(attacker, weapon_tmpl, is_crit)
+        dmg_info = CombatFormulas.calculate_damage(attacker, weapon_tmpl, is_crit, rng)
         final_damage = CombatFormulas.calculate_mitigation(defender, dmg_info, body_part)
 
         is_fatality = False
         if is_crit:
-            if isinstance(defender, Character):
+            if defender.handle.is_player:
                 hp, max_hp = defender.hp.current, defender.hp.maximum
             else:
                 hp, max_hp = defender.current_hp, defender.total_hp
@@ -119,33 +214,74 @@ class CombatManager:
 
         self._apply_damage(defender, body_part, final_damage, attacker)
 
-        severed_msg = ""
+        severed_part = ""
         if body_part and CombatFormulas.check_severing(final_damage, body_part, weapon_flags):
             body_part.is_severed = True
-            severed_msg = f" DECEPANDO {part_name.upper()}!"
+            severed_part = part_name
+
+        # Sequelas: membro decepado sangra; críticos aplicam efeito pelo tipo de dano
+        if self._is_alive(defender):
+            if severed_part:
+                self.effects.apply(def_id, "bleed", source=att_id)
+            elif is_crit and dmg_info['type'] in CRIT_EFFECTS:
+                self.effects.apply(def_id, CRIT_EFFECTS[dmg_info['type']], source=att_id)
 
         if is_fatality:
-            flavor = CombatNarrator.get_fatality(attacker.name, defender.name, dmg_info['type'])
-            log_entry = f"🩸 FATALITY! {flavor} ({final_damage} dano!){severed_msg}"
+            event = NarrationEvent(
+                EV_FATALITY, att_id, def_id, attacker.name, defender.name,
+                flavor=CombatNarrator.pick_fatality(dmg_info['type'], rng),
+                damage=final_damage, is_crit=True, severed=severed_part
+            )
         else:
-            crit_str = " CRITICAMENTE" if is_crit else ""
             verb = weapon_tmpl.attack_verb or self._get_damage_verb(dmg_info['type'], final_damage)
-            log_entry = f"{attacker.name} {verb} {part_name} de {defender.name}{crit_str} ({final_damage}){severed_msg}."
+            event = NarrationEvent(
+                EV_HIT, att_id, def_id, attacker.name, defender.name,
+                verb=verb, part=part_name, damage=final_damage, is_crit=is_crit, severed=severed_part
+            )
         
-        session.round_log.append(log_entry)
+        session.round_log.append(event)
 
         if not self._is_alive(defender):
             dead_set.add(self._get_id(defender))
-            asyncio.create_task(self._handle_death(self._get_id(defender), session, killer=attacker))
+            asyncio.create_task(self._handle_death(self._get_id(defender), session, killer=attacker,
+                                                   damage_type=dmg_info['type']))
+
+    def _apply_effect_damage(self, target_id: EntityHandle, effect_id: str, amount: int,
+                             source_id: Optional[EntityHandle] = None):
+        """Callback do StatusEffectEngine: dano periódico (sangramento, queimadura)."""
+        entity = self._get_entity(target_id)
+        if not entity or not self._is_alive(entity):
+            return
+        source = self._get_entity(source_id)
+        self._apply_damage(entity, None, amount, source)
+
+        room_vnum = entity.location_vnum if target_id.is_player else entity.room_vnum
+        session = self.sessions.get(room_vnum)
+        if session is not None:
+            session.round_log.append(NarrationEvent(
+                EV_EFFECT, source_id, target_id, source.name if source else "", entity.name,
+                verb=EFFECT_VERBS.get(effect_id, "sofre"), damage=amount
+            ))
+
+        if self._is_alive(entity):
+            return
+        self.effects.clear(target_id)
+        if session is not None and target_id in session.participants:
+            asyncio.create_task(self._handle_death(target_id, session, killer=source, damage_type=effect_id))
+        elif target_id.is_npc:
+            if self._get_recipients(room_vnum):
+                self._broadcast_to_room(room_vnum, f"\n💀 {entity.name} CAIU MORTO!\n")
+            self._publish_death(entity, source, room_vnum, effect_id)
+            self.world.kill_npc(entity.uid)
 
-    def _determine_attack_source(self, attacker) -> ItemTemplate:
+    def _determine_attack_source(self, attacker, rng=random) -> ItemTemplate:
         real_weapon = self._get_equipped_weapon(attacker)
         if real_weapon: return real_weapon
 
-        if isinstance(attacker, NPCInstance):
+        if attacker.handle.is_npc:
             template = self.world.factory._npc_templates.get(attacker.template_vnum)
             if template and template.natural_attacks:
-                nat = random.choice(template.natural_attacks)
+                nat = rng.choice(template.natural_attacks)
                 base_min = max(1, int(attacker.level * 1.5))
                 base_max = max(2, int(attacker.level * 2.5))
                 
@@ -167,48 +303,77 @@ class CombatManager:
         )
 
     def _apply_damage(self, entity, body_part: Optional[BodyPartInstance], amount: int, attacker=None):
-        if isinstance(entity, Character):
+        is_player = entity.handle.is_player
+        if is_player:
             entity.hp.current = max(0, entity.hp.current - amount)
         else:
             entity.current_hp = max(0, entity.current_hp - amount)
+            # Ódio: o NPC lembra quem o feriu
+            if attacker is not None and attacker.handle is not None:
+                entity.aggro_list[attacker.handle] = entity.aggro_list.get(attacker.handle, 0) + amount
         
         if body_part:
             body_part.hp_current = max(0, body_part.hp_current - amount)
             if body_part.hp_current == 0 and not body_part.is_broken:
                 body_part.is_broken = True
 
-        if attacker and isinstance(attacker, Character):
+        if attacker and attacker.handle.is_player:
             target_lvl = getattr(entity, 'level', 1)
             xp = LevelingEngine.calculate_xp_gain(attacker, "damage", amount, target_lvl)
-            msgs = LevelingEngine.award_xp(attacker, xp)
-            if msgs: logger.info(f"LEVEL UP: {attacker.name} -> {attacker.level}")
+            if self._award_xp(attacker, xp): logger.info(f"LEVEL UP: {attacker.name} -> {attacker.level}")
 
-        if isinstance(entity, Character) and self._is_alive(entity):
+        if is_player and self._is_alive(entity):
             attacker_lvl = getattr(attacker, 'level', 1)
             xp = LevelingEngine.calculate_xp_gain(entity, "tank", amount, attacker_lvl)
-            LevelingEngine.award_xp(entity, xp)
-
-    async def _handle_death(self, entity_id: str, session: CombatSession, killer=None):
+            self._award_xp(entity, xp)
+
+    def _award_xp(self, player, xp: int) -> list:
+        """award_xp + evento de level up (fundido por jogador no tick)."""
+        old_level = player.level
+        msgs = LevelingEngine.award_xp(player, xp)
+        if player.level != old_level:
+            self.world.events.publish(PlayerLeveledUp(str(player.id), player.name, player.level))
+        return msgs
+
+    def _publish_death(self, entity, killer, room_vnum: int, damage_type: Optional[str] = None):
+        room = self.world.get_room(room_vnum)
+        self.world.events.publish(EntityKilled(
+            victim=entity.handle,
+            victim_name=entity.name,
+            victim_level=entity.level,
+            room_vnum=room_vnum,
+            zone_id=room.zone_id if room else room_vnum // 100000,
+            killer=killer.handle if killer else None,
+            killer_name=killer.name if killer else "",
+            killer_level=killer.level if killer else 0,
+            killer_uid=killer.uid if killer is not None and killer.handle.is_npc else None,
+            room_name=room.title if room else "",
+            damage_type=damage_type,
+        ))
+
+    async def _handle_death(self, entity_id: EntityHandle, session: CombatSession, killer=None,
+                            damage_type: Optional[str] = None):
         entity = self._get_entity(entity_id)
         if not entity: return
         if entity_id not in session.participants: return
 
         room_vnum = session.room_vnum
-        session.participants.discard(entity_id)
+        self.effects.clear(entity_id)
+        session.participants.pop(entity_id, None)
         if entity_id in session.targets:
             del session.targets[entity_id]
 
-        self._broadcast_to_room(room_vnum, f"\n💀 {entity.name} CAIU MORTO!\n")
+        if self._get_recipients(room_vnum):
+            self._broadcast_to_room(room_vnum, f"\n💀 {entity.name} CAIU MORTO!\n")
 
-        if killer and isinstance(killer, Character) and isinstance(entity, NPCInstance):
+        if killer and killer.handle.is_player and entity_id.is_npc:
             xp = LevelingEngine.calculate_xp_gain(killer, "kill", 0, entity.level)
-            msgs = LevelingEngine.award_xp(killer, xp)
+            msgs = self._award_xp(killer, xp)
             logger.info(f"KILL XP: {killer.name} ganhou {xp} XP. Msgs: {msgs}")
             
             # === [MODIFICADO] DROP DE CATALISADORES ===
             # Adiciona chance de drop de item mágico ao matar mob
-            import random
-            if random.random() < 0.4:
+            if self.world.rng.stream("loot").random() < 0.4:
                 sys = self.world.magic_manager.catalyst_system
                 
                 # Lógica simples de drop por nome
@@ -222,26 +387,25 @@ class CombatManager:
                 sys.give_catalyst(killer.id, item, 1)
                 # Opcional: Feedback visual ao jogador seria ideal aqui
                 logger.info(f"LOOT: {killer.name} obteve catalisador {item}")
+                self.world.events.publish(CatalystDropped(str(killer.id), killer.name, item, entity.name, room_vnum))
             # ==========================================
 
-        if isinstance(entity, NPCInstance):
+        # Publicado antes de liberar o handle: assinantes síncronos ainda resolvem a vítima
+        self._publish_death(entity, killer, room_vnum, damage_type)
+        if entity_id.is_npc:
             self.world.kill_npc(entity.uid)
 
-    def _get_entity(self, entity_id: str):
-        if isinstance(entity_id, int): return self.world.get_player(str(entity_id)) # Assume conversão segura
-        if isinstance(entity_id, str) and entity_id.isdigit(): return self.world.get_player(entity_id)
-        return self.world.get_npc(entity_id)
+    def _get_entity(self, entity_id: Optional[EntityHandle]):
+        return self.world.entities.resolve(entity_id)
 
-    def _get_id(self, entity):
-        if isinstance(entity, Character): return str(entity.id)
-        return entity.uid
+    def _get_id(self, entity) -> EntityHandle:
+        return entity.handle
 
     def _is_alive(self, entity) -> bool:
-        if isinstance(entity, Character): return entity.hp.current > 0
         return entity.is_alive()
 
     def _get_equipped_weapon(self, entity) -> Optional[ItemTemplate]:
-        if isinstance(entity, Character):
+        if entity.handle.is_player:
             item_uid = entity.equipment.get("main_hand")
             if item_uid:
                 instance = self.world.active_items.get(item_uid)
@@ -254,5 +418,20 @@ class CombatManager:
         if amount > 20: return "DESTROÇA"
         return "atinge"
 
+    def _get_recipients(self, room_vnum: int) -> list:
+        """Jogadores conectados presentes na sala."""
+        room = self.world.get_room(room_vnum)
+        if not room or not room.players_here:
+            return []
+        recipients = []
+        for pid in room.players_here:
+            player = self.world.get_player(pid)
+            if player:
+                recipients.append(player)
+        return recipients
+
     def _broadcast_to_room(self, room_vnum: int, message: str):
-        logger.info(f"[ROOM {room_vnum}] {message.strip()}")
\ No newline at end of file
+        logger.info(f"[ROOM {room_vnum}] {message.strip()}")
+
+    def _send_to_player(self, player, message: str):
+        logger.info(f"[PLAYER {player.name}] {message.strip()}")
\ No newline at end of file
@@ -0,0 +1,191 @@
+# backend/game/engines/combat/narration.py
+"""
+NARRAÇÃO COMPILADA DE COMBATE
+
+Os templates são pré-processados uma única vez (literais + campos), e o round
+guarda apenas eventos baratos. O texto só é montado na hora da entrega, se
+houver pelo menos um destinatário na sala, e em variantes por destinatário:
+- Perspectiva: observador, atacante ("Você ...") ou defensor ("... você").
+- Estilo: completo, compacto (PlayerSettings.compact_combat) e breve
+  (PlayerSettings.brief_mode, omite erros alheios e o texto de ambientação).
+"""
+from string import Formatter
+from typing import Any, Dict, List, Optional, Tuple
+
+_FORMATTER = Formatter()
+_SENTENCE_ENDS = (".", "!", "?", "\n")
+
+# Perspectivas
+OBSERVER = 0
+ATTACKER = 1
+DEFENDER = 2
+
+# Tipos de evento
+EV_MISS = 0
+EV_FUMBLE = 1
+EV_HIT = 2
+EV_FATALITY = 3
+EV_EFFECT = 4
+
+YOU = "você"
+
+
+class CompiledTemplate:
+    """Template pré-parseado: renderizar é só concatenar pedaços."""
+    __slots__ = ("source", "parts")
+
+    def __init__(self, source: str):
+        self.source = source
+        parts: List[Tuple[str, Optional[str], bool]] = []
+        for i, (literal, field_name, _spec, _conv) in enumerate(_FORMATTER.parse(source)):
+            # Campo no início de frase deve ser capitalizado ("Você ...")
+            stripped = literal.rstrip(" ")
+            at_start = (i == 0 and not stripped) or stripped.endswith(_SENTENCE_ENDS)
+            parts.append((literal, field_name, at_start))
+        self.parts = tuple(parts)
+
+    def render(self, values: Dict[str, Any]) -> str:
+        out = []
+        append = out.append
+        for literal, field_name, at_start in self.parts:
+            if literal:
+                append(literal)
+            if field_name is not None:
+                value = str(values[field_name])
+                if at_start and value:
+                    value = value[0].upper() + value[1:]
+                append(value)
+        return "".join(out)
+
+
+def compile_template(source: str) -> CompiledTemplate:
+    return CompiledTemplate(source)
+
+
+def compile_all(sources: List[str]) -> List[CompiledTemplate]:
+    return [CompiledTemplate(s) for s in sources]
+
+
+# ==============================================================================
+# LINHAS DO ROUND (Perspectiva x Estilo)
+# ==============================================================================
+
+_MISS = compile_template("{att} tenta atacar com {weapon}, mas {defender} esquiva!")
+_FUMBLE = compile_template("❌ {flavor}")
+_HIT = compile_template("{att} {verb} {part} de {defender}{crit} ({damage}){severed}.")
+_HIT_ON_YOU = compile_template("{att} {verb} você ({part}){crit} ({damage}){severed}.")
+_FATALITY = compile_template("🩸 FATALITY! {flavor} ({damage} dano!){severed}")
+_EFFECT = compile_template("{defender} {verb} ({damage}).")
+
+# Indexado por perspectiva: (OBSERVER, ATTACKER, DEFENDER)
+_FULL = {
+    EV_MISS: (_MISS, _MISS, _MISS),
+    EV_FUMBLE: (_FUMBLE, _FUMBLE, _FUMBLE),
+    EV_HIT: (_HIT, _HIT, _HIT_ON_YOU),
+    EV_FATALITY: (_FATALITY, _FATALITY, _FATALITY),
+    EV_EFFECT: (_EFFECT, _EFFECT, _EFFECT),
+}
+
+_COMPACT = {
+    EV_MISS: compile_template("{att} erra {defender}."),
+    EV_FUMBLE: compile_template("{att} falha!"),
+    EV_HIT: compile_template("{att} > {defender}: {damage}{crit_mark}{severed_mark}"),
+    EV_FATALITY: compile_template("☠ {att} executa {defender} ({damage})"),
+    EV_EFFECT: compile_template("{defender} ~ {damage}"),
+}
+
+_BRIEF_FLAVOR = {
+    EV_FUMBLE: compile_template("❌ {att} se atrapalha no ataque!"),
+    EV_FATALITY: compile_template("🩸 FATALITY! {att} executa {defender} ({damage} dano!){severed}"),
+}
+
+
+class NarrationEvent:
+    """
+    Um acontecimento do round, ainda sem texto.
+    Guarda os nomes no momento do golpe (a entidade pode sumir depois).
+    """
+    __slots__ = ("kind", "actor", "target", "actor_name", "target_name",
+                 "flavor", "weapon", "verb", "part", "damage", "is_crit", "severed")
+
+    def __init__(self, kind: int, actor, target, actor_name: str, target_name: str,
+                 flavor: Optional[CompiledTemplate] = None, weapon: str = "", verb: str = "",
+                 part: str = "", damage: int = 0, is_crit: bool = False, severed: str = ""):
+        self.kind = kind
+        self.actor = actor
+        self.target = target
+        self.actor_name = actor_name
+        self.target_name = target_name
+        self.flavor = flavor
+        self.weapon = weapon
+        self.verb = verb
+        self.part = part
+        self.damage = damage
+        self.is_crit = is_crit
+        self.severed = severed
+
+    def perspective_for(self, recipient_handle) -> int:
+        if recipient_handle == self.actor:
+            return ATTACKER
+        if recipient_handle == self.target:
+            return DEFENDER
+        return OBSERVER
+
+    def render(self, perspective: int = OBSERVER, compact: bool = False, brief: bool = False) -> Optional[str]:
+        """Monta a linha para um destinatário. None = nada a mostrar."""
+        if brief and self.kind == EV_MISS and perspective == OBSERVER:
+            return None
+
+        att = YOU if perspective == ATTACKER else self.actor_name
+        defender = YOU if perspective == DEFENDER else self.target_name
+
+        if compact:
+            return _COMPACT[self.kind].render({
+                "att": att, "defender": defender, "damage": self.damage,
+                "crit_mark": "!" if self.is_crit else "",
+                "severed_mark": " ✂" if self.severed else "",
+            })
+
+        severed = f" DECEPANDO {self.severed.upper()}!" if self.severed else ""
+
+        if brief and self.kind in _BRIEF_FLAVOR:
+            return _BRIEF_FLAVOR[self.kind].render({
+                "att": att, "defender": defender, "damage": self.damage, "severed": severed
+            })
+
+        values = {"att": att, "defender": defender, "damage": self.damage, "severed": severed}
+        if self.kind == EV_MISS:
+            values["weapon"] = self.weapon
+        elif self.kind == EV_EFFECT:
+            values["verb"] = self.verb
+        elif self.kind == EV_HIT:
+            values["verb"] = self.verb
+            values["part"] = self.part
+            values["crit"] = " CRITICAMENTE" if self.is_crit else ""
+        else:
+            values["flavor"] = self.flavor.render({"att": att, "defender": defender})
+
+        return _FULL[self.kind][perspective].render(values)
+
+
+def render_round(events: List[NarrationEvent], recipient_handle=None,
+                 compact: bool = False, brief: bool = False,
+                 cache: Optional[Dict] = None) -> str:
+    """
+    Renderiza o round inteiro para um destinatário.
+    O cache compartilha as linhas de observador entre destinatários de mesmo estilo.
+    """
+    lines = []
+    for idx, event in enumerate(events):
+        perspective = event.perspective_for(recipient_handle)
+        if cache is not None and perspective == OBSERVER:
+            key = (idx, compact, brief)
+            if key in cache:
+                line = cache[key]
+            else:
+                line = cache[key] = event.render(perspective, compact, brief)
+        else:
+            line = event.render(perspective, compact, brief)
+        if line:
+            lines.append(line)
+    return "\n".join(lines)
@@ -0,0 +1,247 @@
+# backend/game/engines/combat/replay.py
+"""
+REPLAY DE COMBATE (Log Binário Compacto)
+
+Grava as ENTRADAS de uma sessão de combate (semente da sessão, instantâneo
+dos participantes com equipamento e efeitos ativos, cada engajamento) e um CRC
+do estado ao fim de cada round. Com isso uma luta da produção pode ser
+re-simulada offline, bit a bit, e perfilada à vontade (ver replay_combat.py).
+
+Formato (little-endian):
+    Cabeçalho: b"AERP" | versão u16 | semente raiz do mundo u64
+    Registro:  tipo u8 | tamanho u32 | payload
+      SESSION  sala i32 | semente da sessão u64
+      ENTITY   round u32 | ordinal u16 | tipo u8 | JSON zlib (instantâneo)
+      ENGAGE   round u32 | atacante u16 | defensor u16
+      ROUND    round u32 | crc32 u32 | eventos u16
+      END      rounds u32
+"""
+import json
+import logging
+import os
+import struct
+import zlib
+from dataclasses import asdict, dataclass, field
+from typing import Any, Dict, List, Optional, Tuple
+
+from backend.models.character import Attribute, Character, ResourcePool
+from backend.models.item import ItemAttribute, ItemDamage, ItemInstance, ItemTemplate
+from backend.models.player import PlayerSettings
+from backend.models.npc import BodyPartInstance, NPCInstance, NPCKillRecord, NPCProgression, NaturalAttack
+
+logger = logging.getLogger(__name__)
+
+MAGIC = b"AERP"
+VERSION = 1
+
+REC_SESSION = 1
+REC_ENTITY = 2
+REC_ENGAGE = 3
+REC_ROUND = 4
+REC_END = 5
+
+_HEADER = struct.Struct("<4sHQ")
+_RECORD = struct.Struct("<BI")
+_SESSION = struct.Struct("<iQ")
+_ENTITY = struct.Struct("<IHB")
+_ENGAGE = struct.Struct("<IHH")
+_ROUND = struct.Struct("<IIH")
+_END = struct.Struct("<I")
+_PART_STATE = struct.Struct("<iBB")
+_ENTITY_STATE = struct.Struct("<Bii")
+_EVENT_STATE = struct.Struct("<Bi")
+
+
+# ==============================================================================
+# INSTANTÂNEOS (Entidade -> dict JSON e de volta)
+# ==============================================================================
+
+def snapshot_entity(world, entity, effects=None) -> Dict[str, Any]:
+    """Captura tudo que o combate lê de uma entidade (inclui arma e efeitos)."""
+    if entity.handle.is_player:
+        data = asdict(entity)
+        data.pop("handle", None)
+        data["life_journal"] = []
+        snap = {"player": data}
+
+        weapon_uid = entity.equipment.get("main_hand")
+        instance = world.active_items.get(weapon_uid) if weapon_uid else None
+        template = world.factory._item_templates.get(instance.template_vnum) if instance else None
+        if template:
+            snap["weapon"] = {"uid": weapon_uid, "template": asdict(template)}
+    else:
+        data = asdict(entity)
+        data.pop("handle", None)
+        data["aggro_list"] = {}
+        snap = {"npc": data}
+
+        template = world.factory._npc_templates.get(entity.template_vnum)
+        if template:
+            snap["natural_attacks"] = [asdict(a) for a in template.natural_attacks]
+
+    if effects is not None:
+        snap["effects"] = effects.snapshot(entity.handle)
+    return snap
+
+
+def restore_entity(world, snap: Dict[str, Any], effects=None):
+    """Recria a entidade de um instantâneo e a registra no mundo."""
+    if "player" in snap:
+        data = dict(snap["player"])
+        for pool in ("hp", "mana", "stamina", "sanity"):
+            data[pool] = ResourcePool(**data[pool])
+        data["attributes"] = {k: Attribute(**v) for k, v in data["attributes"].items()}
+        data["settings"] = PlayerSettings.from_dict(data.get("settings"))
+        entity = Character(**data)
+
+        weapon = snap.get("weapon")
+        if weapon:
+            tmpl = dict(weapon["template"])
+            tmpl["damage"] = ItemDamage(**tmpl["damage"]) if tmpl.get("damage") else None
+            tmpl["attributes"] = [ItemAttribute(**a) for a in tmpl.get("attributes", [])]
+            template = ItemTemplate(**tmpl)
+            world.factory._item_templates[template.vnum] = template
+            world.active_items[weapon["uid"]] = ItemInstance(uid=weapon["uid"], template_vnum=template.vnum)
+        world.add_player(entity)
+    else:
+        data = dict(snap["npc"])
+        data["anatomy_state"] = {k: BodyPartInstance(**v) for k, v in data["anatomy_state"].items()}
+        data["progression"] = NPCProgression(**data["progression"])
+        data["kill_history"] = [NPCKillRecord(**k) for k in data["kill_history"]]
+        entity = NPCInstance(**data)
+
+        template = world.factory._npc_templates.get(entity.template_vnum)
+        if template is not None and "natural_attacks" in snap:
+            template.natural_attacks = [NaturalAttack(**a) for a in snap["natural_attacks"]]
+
+        world.add_npc(entity)
+
+    if effects is not None and snap.get("effects"):
+        effects.restore(entity.handle, snap["effects"])
+    return entity
+
+
+def state_digest(entities: List[Any], events) -> int:
+    """CRC32 do estado relevante após um round (HP, anatomia e eventos)."""
+    crc = 0
+    for entity in entities:
+        if entity is None:
+            crc = zlib.crc32(b"\x00", crc)
+            continue
+        if entity.handle.is_player:
+            hp, hp_max, anatomy = entity.hp.current, entity.hp.maximum, None
+        else:
+            hp, hp_max, anatomy = entity.current_hp, entity.total_hp, entity.anatomy_state
+        crc = zlib.crc32(_ENTITY_STATE.pack(entity.handle.kind, hp, hp_max), crc)
+        if anatomy:
+            for part in anatomy.values():
+                crc = zlib.crc32(_PART_STATE.pack(part.hp_current, part.is_severed, part.is_broken), crc)
+    for event in events:
+        crc = zlib.crc32(_EVENT_STATE.pack(event.kind, event.damage), crc)
+    return crc
+
+
+# ==============================================================================
+# GRAVAÇÃO
+# ==============================================================================
+
+class CombatRecorder:
+    """Log de uma sessão, acumulado em memória e gravado ao fim da luta."""
+
+    def __init__(self, room_vnum: int, session_seed: int, root_seed: int = 0):
+        self.buffer = bytearray(_HEADER.pack(MAGIC, VERSION, root_seed & 0xFFFFFFFFFFFFFFFF))
+        self.ordinals: Dict[Any, int] = {}
+        # Objetos na ordem dos ordinais (o CRC não depende do handle ainda resolver)
+        self.entities: List[Any] = []
+        self.rounds = 0
+        self._write(REC_SESSION, _SESSION.pack(room_vnum, session_seed))
+
+    def _write(self, rec_type: int, payload: bytes):
+        self.buffer += _RECORD.pack(rec_type, len(payload))
+        self.buffer += payload
+
+    def record_entity(self, entity, snapshot: Dict[str, Any]) -> int:
+        handle = entity.handle
+        if handle in self.ordinals:
+            return self.ordinals[handle]
+        ordinal = self.ordinals[handle] = len(self.ordinals)
+        self.entities.append(entity)
+        blob = zlib.compress(json.dumps(snapshot, separators=(",", ":"), default=str).encode("utf-8"))
+        self._write(REC_ENTITY, _ENTITY.pack(self.rounds, ordinal, handle.kind) + blob)
+        return ordinal
+
+    def record_engage(self, attacker, defender):
+        """Espelha CombatSession.add_participant (ordem e alvos ficam idênticos no replay)."""
+        self._write(REC_ENGAGE, _ENGAGE.pack(self.rounds, self.ordinals[attacker], self.ordinals[defender]))
+
+    def record_round(self, crc: int, event_count: int):
+        self.rounds += 1
+        self._write(REC_ROUND, _ROUND.pack(self.rounds, crc, min(event_count, 0xFFFF)))
+
+    def finish(self) -> bytes:
+        self._write(REC_END, _END.pack(self.rounds))
+        return bytes(self.buffer)
+
+    def save(self, directory: str, name: str) -> str:
+        os.makedirs(directory, exist_ok=True)
+        path = os.path.join(directory, name)
+        with open(path, "wb") as f:
+            f.write(self.finish())
+        return path
+
+
+# ==============================================================================
+# LEITURA
+# ==============================================================================
+
+@dataclass
+class CombatReplay:
+    """Conteúdo decodificado de um arquivo de replay."""
+    root_seed: int
+    room_vnum: int = 0
+    session_seed: int = 0
+    # (round de entrada, ordinal, tipo, instantâneo)
+    entities: List[Tuple[int, int, int, Dict[str, Any]]] = field(default_factory=list)
+    # (round, ordinal do atacante, ordinal do defensor)
+    engagements: List[Tuple[int, int, int]] = field(default_factory=list)
+    # round -> (crc, nº de eventos)
+    checkpoints: Dict[int, Tuple[int, int]] = field(default_factory=dict)
+    rounds: int = 0
+
+
+def read_replay(data: bytes) -> CombatReplay:
+    magic, version, root_seed = _HEADER.unpack_from(data, 0)
+    if magic != MAGIC:
+        raise ValueError("Arquivo não é um replay de combate.")
+    if version != VERSION:
+        raise ValueError(f"Versão de replay não suportada: {version}")
+
+    replay = CombatReplay(root_seed=root_seed)
+    offset = _HEADER.size
+    while offset < len(data):
+        rec_type, size = _RECORD.unpack_from(data, offset)
+        offset += _RECORD.size
+        payload = data[offset:offset + size]
+        offset += size
+
+        if rec_type == REC_SESSION:
+            replay.room_vnum, replay.session_seed = _SESSION.unpack_from(payload)
+        elif rec_type == REC_ENTITY:
+            round_no, ordinal, kind = _ENTITY.unpack_from(payload)
+            snapshot = json.loads(zlib.decompress(payload[_ENTITY.size:]).decode("utf-8"))
+            replay.entities.append((round_no, ordinal, kind, snapshot))
+        elif rec_type == REC_ENGAGE:
+            replay.engagements.append(_ENGAGE.unpack_from(payload))
+        elif rec_type == REC_ROUND:
+            round_no, crc, events = _ROUND.unpack_from(payload)
+            replay.checkpoints[round_no] = (crc, events)
+        elif rec_type == REC_END:
+            (replay.rounds,) = _END.unpack_from(payload)
+        else:
+            logger.warning(f"Replay: registro desconhecido {rec_type} ignorado.")
+    return replay
+
+
+def load_replay(path: str) -> CombatReplay:
+    with open(path, "rb") as f:
+        return read_replay(f.read())
@@ -6,11 +6,23 @@ Integra ResourceManager, Ciclos de Tempo e IA.
 import asyncio
 import logging
 import random
-from typing import Optional
+from typing import Dict, List, Optional
 from backend.game.engines.ecology.resource_management import ResourceManager
+from backend.game.engines.ecology.lod import PopulationLOD
+from backend.game.engines.time.calendar import CAL_SEASON, TIME_MULTIPLIER
+from backend.game.utils.rng import derive_seed
 
 logger = logging.getLogger(__name__)
 
+# Escalonador de zonas: a cada slot, só as zonas cuja vez chegou são processadas
+ECOLOGY_SLOT_SECONDS = 1.0
+
+# Cadência do ciclo de cada zona (segundos reais)
+RESPAWN_INTERVAL = 60.0         # Base (zona vazia, ameaça 1)
+ZONE_CADENCE_OCCUPIED = 30.0    # Com jogadores presentes: mundo mais vivo
+ZONE_CADENCE_MIN = 15.0
+ZONE_THREAT_SPEEDUP = 0.25      # +25% de frequência por nível de ameaça acima de 1
+
 class EcologyEngine:
     def __init__(self, world_manager, time_engine, grimoire_engine, ollama_service=None):
         self.world = world_manager
@@ -20,51 +32,121 @@ class EcologyEngine:
         
         # Subsistema de Recursos
         self.resource_manager = ResourceManager(world_manager, time_engine)
+        # Zonas longe dos jogadores viram populações agregadas
+        self.lod = PopulationLOD(world_manager, self.resource_manager)
         
         self.enabled = True
-        self.ecology_tick_count = 0
+        self.season: Optional[str] = None
+
+        # Ciclo por zona: fila de slots (slot -> zonas), fase de cada zona por hash
+        self.slot = 0
+        self.zone_due: Dict[int, int] = {}
+        self.slots: Dict[int, List[int]] = {}
+
+        self.respawn_task = None
+        if time_engine is not None:
+            self.respawn_task = time_engine.schedule_every(
+                ECOLOGY_SLOT_SECONDS, self._run_zone_slot, name="ecology:zones"
+            )
+            # Tempo offline: repovoamento em forma fechada no boot
+            time_engine.on_catch_up(self.catch_up)
+            # Estação corrente: reage à virada em vez de recalcular a cada consulta
+            time_engine.on_calendar(CAL_SEASON, self._on_season_change)
+
+    # ==========================================================================
+    # ESCALONAMENTO DAS ZONAS
+    # ==========================================================================
+
+    def zone_cadence(self, zone_id: int, players: Optional[int] = None) -> float:
+        """Segundos entre ciclos da zona: jogadores presentes e ameaça aceleram."""
+        area = self.world.zones.get(zone_id)
+        if players is None:
+            players = area.ecology.player_count if area else 0
+        base = ZONE_CADENCE_OCCUPIED if players > 0 else RESPAWN_INTERVAL
+        threat = max(1, area.ecology.threat_level if area else 1)
+        return max(ZONE_CADENCE_MIN, base / (1.0 + ZONE_THREAT_SPEEDUP * (threat - 1)))
+
+    def _cadence_slots(self, zone_id: int) -> int:
+        return max(1, int(round(self.zone_cadence(zone_id) / ECOLOGY_SLOT_SECONDS)))
+
+    def _queue_zone(self, zone_id: int, slot: int):
+        self.zone_due[zone_id] = slot
+        self.slots.setdefault(slot, []).append(zone_id)
 
-    async def run_ecology_tick(self, game_date):
-        """O coração pulsante da natureza. Executado periodicamente pelo TimeEngine."""
+    def _sync_zones(self):
+        """Zonas novas entram numa fase fixa (hash do id): a carga se espalha entre os slots."""
+        for zone_id in self.world.zones:
+            if zone_id not in self.zone_due:
+                cadence = self._cadence_slots(zone_id)
+                phase = derive_seed(0, "ecology", zone_id) % cadence
+                self._queue_zone(zone_id, self.slot + 1 + phase)
+
+    async def _run_zone_slot(self):
+        """Slot do escalonador: processa só as zonas vencidas e as reagenda."""
+        self.slot += 1
+        if len(self.zone_due) != len(self.world.zones):
+            self._sync_zones()
+        if self.enabled:
+            self.lod.update()
+
+        for zone_id in self.slots.pop(self.slot, ()):
+            if zone_id not in self.world.zones:
+                self.zone_due.pop(zone_id, None)
+                continue
+            if self.enabled and self.lod.is_aggregated(zone_id):
+                self.lod.evolve(zone_id)
+            elif self.enabled:
+                await self.resource_manager.run_respawn_cycle(zone_id=zone_id)
+            # Cadência reavaliada a cada ciclo (jogadores entram e saem)
+            self._queue_zone(zone_id, self.slot + self._cadence_slots(zone_id))
+
+    def catch_up(self, offline_game_seconds: float):
+        """
+        Aplica de uma vez os ciclos de respawn que teriam rodado com o servidor
+        desligado. Custo proporcional aos NPCs repostos, não ao tempo offline.
+        """
         if not self.enabled:
             return
-        
-        self.ecology_tick_count += 1
-        
-        # 1. Ciclo de Respawn de Recursos (A cada 6 ticks ecológicos)
-        if self.ecology_tick_count % 6 == 0:
-            # Por enquanto, assumimos Zona 1 (Floresta) como principal
-            await self.resource_manager.run_respawn_cycle(zone_id=1)
-
-        # 2. IA de Comportamento (Ollama) - Processamento em Lote Opcional
-        # (Implementação simplificada para não sobrecarregar o loop)
-        if self.ollama and self.ecology_tick_count % 10 == 0:
-            # Aqui poderíamos chamar uma função assíncrona para gerar "flavor text" 
-            # de animais caçando, mas deixaremos passivo por enquanto.
-            pass
+        offline_real_seconds = offline_game_seconds / TIME_MULTIPLIER
+        for zone_id in list(self.world.zones):
+            # Servidor desligado: ninguém presente na zona
+            cycles = int(offline_real_seconds // self.zone_cadence(zone_id, players=0))
+            restored = self.resource_manager.catch_up(zone_id, cycles)
+            if restored:
+                summary = ", ".join(f"{species} +{n}" for species, n in restored.items())
+                logger.info(f"🌿 RECUPERAÇÃO OFFLINE [Zona {zone_id}]: {cycles} ciclos -> {summary}")
+
+    def _on_season_change(self, game_date):
+        previous, self.season = self.season, game_date.season_name
+        if previous is not None:
+            logger.info(f"🍂 Ecologia: a estação virou de {previous} para {self.season}.")
 
     def get_zone_report(self, zone_id: int) -> str:
         """Gera um relatório completo para o comando 'fauna'."""
         date = self.time.get_current_date()
         
-        # Dados do Clima (Simulado base)
-        weather_desc = "Céu limpo"
-        if date.season_name == "Inverno": weather_desc = "Frio cortante e neve leve"
-        elif date.season_name == "Verão": weather_desc = "Calor úmido e sol forte"
+        # Dados do Clima (em cache no WeatherEngine)
+        weather = getattr(self.world, "weather", None)
+        weather_desc = weather.describe(zone_id) if weather else "Céu limpo"
         
         # Dados de Recursos
         resources_report = self.resource_manager.get_resource_report(zone_id)
         
-        # Contagem Geral
+        # Contagem Geral (só as salas da zona)
+        area = self.world.zones.get(zone_id)
         total_npcs = 0
         active_predators = 0
-        if self.world.rooms:
-            for room in self.world.rooms.values():
-                if room.zone_id == zone_id:
-                    total_npcs += len(room.npcs)
-                    for npc in room.npcs:
-                        if npc.has_flag("AGGRESSIVE") or npc.has_flag("PREDATOR"):
-                            active_predators += 1
+        for vnum in (area.room_vnums if area else ()):
+            room = self.world.rooms.get(vnum)
+            if room:
+                total_npcs += len(room.npcs_here)
+                active_predators += len(self.world.room_predators.get(vnum, ()))
+
+        # Alpha e os mais temidos (rankings indexados, sem varrer o mundo)
+        alpha = self.world.get_zone_alpha(zone_id)
+        threat = area.ecology.threat_level if area else 1
+        feared = ", ".join(f"{npc.full_name} ({npc.progression.kills_count} abates)"
+                           for npc in self.world.top_npcs(3, zone_id)) or "Nenhum"
 
         buffer = [
             "📜 RELATÓRIO ECOLÓGICO E CLIMÁTICO",
@@ -72,7 +154,9 @@ class EcologyEngine:
             f"🍂 Estação: {date.season_name} | 🌤️ Clima: {weather_desc}",
             "-" * 40,
             f"🐾 Vida na Zona {zone_id}: {total_npcs} entidades detectadas.",
-            f"🐺 Predadores Ativos: {active_predators}",
+            f"🐺 Predadores Ativos: {active_predators} | ⚠️ Ameaça: {threat}/10",
+            f"👑 Alpha: {alpha.full_name if alpha else 'Nenhum'}",
+            f"💀 Mais temidos: {feared}",
             "-" * 40,
             resources_report,
             "-" * 40
@@ -93,11 +177,12 @@ class EcologyEngine:
         query = species_name_query.lower()
         
         for room in self.world.rooms.values():
-            for npc in room.npcs:
-                if query in npc.name.lower():
+            for uid in room.npcs_here:
+                npc = self.world.get_npc(uid)
+                if npc and query in npc.name.lower():
                     count += 1
                     if len(found_in_rooms) < 3: # Lista apenas as 3 primeiras salas
-                        found_in_rooms.append(f"[{room.vnum}] {room.name}")
+                        found_in_rooms.append(f"[{room.vnum}] {room.title}")
         
         if count == 0:
             return f"Os rastros de '{species_name_query}' desapareceram ou nunca existiram aqui."
@@ -0,0 +1,218 @@
+# backend/game/engines/ecology/lod.py
+"""
+NÍVEL DE DETALHE DA SIMULAÇÃO (LOD)
+
+Dois níveis por zona:
+- COMPLETO: zonas com jogadores ou vizinhas de uma zona com jogadores. Cada NPC
+  é um NPCInstance de verdade (anatomia, progressão, combate).
+- AGREGADO: zonas sem ninguém por perto há LOD_COLLAPSE_DELAY segundos viram um
+  vetor de população por template, evoluído por equações predador-presa baratas
+  (presas: crescimento logístico com os parâmetros do ResourceManager; predadores:
+  resposta funcional de Holling tipo II).
+
+Ao se aproximar um jogador, a zona é rematerializada de forma determinística:
+mesma semente do mundo + mesma geração = mesmos NPCs (uids inclusive) nas mesmas salas.
+NPCs notáveis (alfas, evoluídos, com abates) nunca são colapsados.
+
+As lendas que os NPCs colapsados conheciam ficam no agregado (por template) e
+voltam aos NPCs rematerializados: a zona vazia não esquece o que já ouviu.
+"""
+import logging
+import random
+import time
+import uuid
+from typing import Dict, List, Optional, Set
+
+from backend.game.utils.rng import derive_seed
+from backend.game.utils.vnum import VNum
+
+logger = logging.getLogger(__name__)
+
+# Segundos sem jogadores por perto antes de colapsar a zona (histerese)
+LOD_COLLAPSE_DELAY = 120.0
+
+# Dinâmica predador-presa (por ciclo ecológico da zona)
+ATTACK_RATE = 0.5          # Abates por predador por ciclo com presa farta
+HALF_SATURATION = 10.0     # Presas na zona para metade da taxa de abate
+PREDATOR_GAIN = 0.1        # Predadores gerados por abate
+PREDATOR_DEATH = 0.05      # Mortalidade natural dos predadores por ciclo
+
+
+class ZoneAggregate:
+    """População colapsada de uma zona: template -> quantidade (contínua)."""
+    __slots__ = ("zone_id", "populations", "generation", "collapsed_at", "lore")
+
+    def __init__(self, zone_id: int, populations: Dict[int, float], generation: int,
+                 lore: Optional[Dict[int, List[List[str]]]] = None):
+        self.zone_id = zone_id
+        self.populations = populations
+        self.generation = generation
+        self.collapsed_at = time.time()
+        self.lore = lore or {}      # template -> lendas conhecidas de cada NPC colapsado
+
+    def counts(self) -> Dict[int, int]:
+        return {vnum: int(round(n)) for vnum, n in self.populations.items() if round(n) > 0}
+
+
+class PopulationLOD:
+    def __init__(self, world_manager, resource_manager):
+        self.world = world_manager
+        self.resources = resource_manager
+        # Agregados ficam no ResourceManager: contagens e relatórios os enxergam
+        self.aggregates: Dict[int, ZoneAggregate] = resource_manager.aggregates
+        self.generations: Dict[int, int] = {}
+        self.unobserved_since: Dict[int, float] = {}
+        self._zone_neighbors: Optional[Dict[int, Set[int]]] = None
+
+    # ==========================================================================
+    # OBSERVAÇÃO
+    # ==========================================================================
+
+    def zone_neighbors(self) -> Dict[int, Set[int]]:
+        """Zonas ligadas por saídas de sala (calculado uma vez: salas são estáticas)."""
+        if self._zone_neighbors is None:
+            neighbors: Dict[int, Set[int]] = {}
+            for room in self.world.rooms.values():
+                zone_set = neighbors.setdefault(room.zone_id, set())
+                for exit_ in room.exits.values():
+                    target_zone, _ = VNum.parse(exit_.target_vnum)
+                    if target_zone != room.zone_id:
+                        zone_set.add(target_zone)
+                        neighbors.setdefault(target_zone, set()).add(room.zone_id)
+            self._zone_neighbors = neighbors
+        return self._zone_neighbors
+
+    def observed_zones(self) -> Set[int]:
+        neighbors = self.zone_neighbors()
+        observed: Set[int] = set()
+        for zone_id, area in self.world.zones.areas.items():
+            if area.ecology.player_count > 0:
+                observed.add(zone_id)
+                observed.update(neighbors.get(zone_id, ()))
+        return observed
+
+    def is_aggregated(self, zone_id: int) -> bool:
+        return zone_id in self.aggregates
+
+    def update(self, now: Optional[float] = None):
+        """Materializa o que está sendo observado e colapsa o que ficou sozinho tempo demais."""
+        now = now if now is not None else time.time()
+        observed = self.observed_zones()
+        for zone_id in self.world.zones:
+            if zone_id in observed:
+                self.unobserved_since.pop(zone_id, None)
+                if zone_id in self.aggregates:
+                    self.materialize(zone_id)
+                continue
+            since = self.unobserved_since.setdefault(zone_id, now)
+            if zone_id not in self.aggregates and now - since >= LOD_COLLAPSE_DELAY:
+                self.collapse(zone_id)
+
+    # ==========================================================================
+    # TRANSIÇÕES
+    # ==========================================================================
+
+    @staticmethod
+    def is_notable(npc) -> bool:
+        return (npc.has_flag("ZONE_ALPHA") or npc.progression.kills_count > 0
+                or npc.progression.evolution_stage > 0)
+
+    def collapse(self, zone_id: int) -> int:
+        """Troca os NPCs comuns da zona por contagens. Retorna quantos foram colapsados."""
+        populations: Dict[int, float] = {}
+        lore: Dict[int, List[List[str]]] = {}
+        collapsed: List[str] = []
+        grimoire = getattr(self.world, "grimoire", None)
+        for room in self._zone_rooms(zone_id):
+            for uid in room.npcs_here:
+                npc = self.world.get_npc(uid)
+                if npc is None or self.is_notable(npc):
+                    continue
+                populations[npc.template_vnum] = populations.get(npc.template_vnum, 0.0) + 1.0
+                collapsed.append(uid)
+                # Guardado antes do kill_npc, que tira o NPC do grimório
+                known = grimoire.known_legends(uid) if grimoire is not None else None
+                if known:
+                    lore.setdefault(npc.template_vnum, []).append(known)
+
+        for uid in collapsed:
+            self.world.kill_npc(uid)
+
+        generation = self.generations.get(zone_id, 0) + 1
+        self.generations[zone_id] = generation
+        self.aggregates[zone_id] = ZoneAggregate(zone_id, populations, generation, lore)
+        logger.debug(f"🌫️ LOD: Zona {zone_id} colapsada ({len(collapsed)} NPCs -> {len(populations)} espécies).")
+        return len(collapsed)
+
+    def materialize(self, zone_id: int) -> int:
+        """Recria os NPCs da zona a partir do agregado (determinístico)."""
+        aggregate = self.aggregates.pop(zone_id, None)
+        if aggregate is None:
+            return 0
+        zone_rooms = sorted(r.vnum for r in self._zone_rooms(zone_id))
+        if not zone_rooms:
+            return 0
+
+        rng = random.Random(derive_seed(self.world.rng.root_seed, "lod", zone_id, aggregate.generation))
+        grimoire = getattr(self.world, "grimoire", None)
+        created = 0
+        for template_vnum, count in sorted(aggregate.counts().items()):
+            # Mesmas salas do respawn; sem tabela (zona só de salas internas) vale qualquer uma
+            spawn_table = self.resources.spawn_tables.table(zone_id, template_vnum)
+            # Os primeiros da espécie herdam o que os colapsados sabiam (população menor perde o excedente)
+            lore = aggregate.lore.get(template_vnum, ())
+            for n in range(count):
+                npc = self.world.factory.create_npc_instance(template_vnum)
+                if npc is None:
+                    break
+                npc.uid = str(uuid.UUID(int=rng.getrandbits(128), version=4))
+                npc.room_vnum = spawn_table.sample(rng) if spawn_table else rng.choice(zone_rooms)
+                self.world.add_npc(npc)
+                if grimoire is not None and n < len(lore):
+                    grimoire.recall(npc.uid, lore[n])
+                created += 1
+        logger.debug(f"🌿 LOD: Zona {zone_id} rematerializada ({created} NPCs).")
+        return created
+
+    def _zone_rooms(self, zone_id: int):
+        area = self.world.zones.get(zone_id)
+        return [self.world.rooms[v] for v in (area.room_vnums if area else ()) if v in self.world.rooms]
+
+    # ==========================================================================
+    # DINÂMICA AGREGADA
+    # ==========================================================================
+
+    def evolve(self, zone_id: int, cycles: int = 1):
+        """Avança a população agregada `cycles` ciclos ecológicos. Custo O(espécies)."""
+        aggregate = self.aggregates.get(zone_id)
+        if aggregate is None:
+            return
+        pops = aggregate.populations
+        prey_species = {res.template_vnum: res for res in self.resources.species_in_zone(zone_id)
+                        if res.respawn_enabled}
+        for res in prey_species.values():
+            pops.setdefault(res.template_vnum, 0.0)
+        predators = [vnum for vnum in pops if vnum not in prey_species and self._is_predator_template(vnum)]
+
+        for _ in range(max(0, cycles)):
+            prey_total = sum(pops[vnum] for vnum in prey_species)
+            predator_total = sum(pops[vnum] for vnum in predators)
+            kills = ATTACK_RATE * predator_total * prey_total / (prey_total + HALF_SATURATION) if prey_total else 0.0
+
+            for vnum, res in prey_species.items():
+                n = pops[vnum]
+                growth = res.growth_rate * n * (1.0 - n / max(1, res.optimal_population))
+                eaten = kills * (n / prey_total) if prey_total else 0.0
+                # Proteção contra extinção: o ResourceManager garante o mínimo
+                pops[vnum] = min(res.maximum_population, max(res.minimum_population, n + growth - eaten))
+
+            for vnum in predators:
+                share = pops[vnum] / predator_total if predator_total else 0.0
+                pops[vnum] = max(0.0, pops[vnum] + PREDATOR_GAIN * kills * share - PREDATOR_DEATH * pops[vnum])
+
+    def _is_predator_template(self, template_vnum: int) -> bool:
+        template = self.world.factory._npc_templates.get(template_vnum)
+        if template is None:
+            return False
+        flags = {f.upper() for f in template.flags}
+        return "PREDATOR" in flags or "AGGRESSIVE" in flags
@@ -4,9 +4,10 @@ SISTEMA DE GESTÃO DE RECURSOS ECOLÓGICOS
 Gerencia espécies-recurso (presas) com proteção contra extinção.
 """
 import logging
-import random
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple
 from dataclasses import dataclass, field
+from backend.game.utils.vnum import VNum
+from backend.game.engines.ecology.spawn_tables import SpawnTables
 
 logger = logging.getLogger(__name__)
 
@@ -22,6 +23,15 @@ class ResourceSpecies:
     # Intervalo simples para controle interno (em ticks do ciclo)
     respawn_tick_counter: int = 0
     respawn_threshold: int = 6  # Ticks necessários para tentar respawn
+    # Zonas onde a espécie vive (vazio = a zona do próprio template)
+    habitat_zones: Tuple[int, ...] = ()
+    # Crescimento logístico por ciclo (simulação agregada, ver lod.py)
+    growth_rate: float = 0.25
+
+    def lives_in(self, zone_id: int) -> bool:
+        if self.habitat_zones:
+            return zone_id in self.habitat_zones
+        return VNum.parse(self.template_vnum)[0] == zone_id
 
 @dataclass
 class ZoneResourceState:
@@ -36,6 +46,10 @@ class ResourceManager:
         self.time = time_engine
         self.resource_species: Dict[str, ResourceSpecies] = {}
         self.zone_states: Dict[int, ZoneResourceState] = {}
+        # Zonas colapsadas pelo LOD: zone_id -> ZoneAggregate (populações contínuas)
+        self.aggregates: Dict[int, "ZoneAggregate"] = {}
+        # Salas de spawn por (zona, espécie), compiladas uma vez
+        self.spawn_tables = SpawnTables(world_manager)
         self._load_default_resources()
 
     def _load_default_resources(self):
@@ -70,38 +84,51 @@ class ResourceManager:
             self.zone_states[zone_id] = ZoneResourceState(zone_id=zone_id)
         return self.zone_states[zone_id]
 
+    def species_in_zone(self, zone_id: int) -> List[ResourceSpecies]:
+        return [res for res in self.resource_species.values() if res.lives_in(zone_id)]
+
     def _count_population(self, zone_id: int, template_vnum: int) -> int:
-        count = 0
-        if not self.world.rooms:
-            return 0
-        
-        # Otimização: Iterar apenas salas da zona se possível, mas aqui varremos tudo por segurança
-        for room in self.world.rooms.values():
-            if room.zone_id == zone_id:
-                for npc in room.npcs:
-                    if npc.vnum == template_vnum:
-                        count += 1
-        return count
+        return self._count_populations(zone_id).get(template_vnum, 0)
+
+    def _count_populations(self, zone_id: int) -> Dict[int, int]:
+        """Contagem por template de todos os NPCs da zona, numa única varredura."""
+        counts: Dict[int, int] = {}
+        aggregate = self.aggregates.get(zone_id)
+        if aggregate is not None:
+            counts.update(aggregate.counts())
+        area = self.world.zones.get(zone_id)
+        if area is None:
+            return counts
+
+        for vnum in area.room_vnums:
+            room = self.world.rooms.get(vnum)
+            if room is None:
+                continue
+            for uid in room.npcs_here:
+                npc = self.world.get_npc(uid)
+                if npc:
+                    counts[npc.template_vnum] = counts.get(npc.template_vnum, 0) + 1
+        return counts
 
     async def run_respawn_cycle(self, zone_id: int):
         """Tenta repopular espécies que estão abaixo do ideal."""
-        if not self.world.rooms:
+        if not self.world.rooms or zone_id in self.aggregates:
+            # Zona agregada: quem evolui a população é o LOD
             return
 
         state = self._get_zone_state(zone_id)
         current_date = self.time.get_current_date()
         state.last_respawn_check = str(current_date)
-        
-        # Filtra salas da zona para spawn
-        zone_rooms = [r.vnum for r in self.world.rooms.values() if r.zone_id == zone_id]
-        if not zone_rooms:
-            return
 
-        for res in self.resource_species.values():
+        counts = self._count_populations(zone_id)
+        for res in self.species_in_zone(zone_id):
             if not res.respawn_enabled:
                 continue
+            spawn_table = self.spawn_tables.table(zone_id, res.template_vnum)
+            if spawn_table is None:
+                continue
                 
-            current_pop = self._count_population(zone_id, res.template_vnum)
+            current_pop = counts.get(res.template_vnum, 0)
             
             # Lógica de Spawn: Se estiver abaixo do ideal
             if current_pop < res.optimal_population:
@@ -109,9 +136,10 @@ class ResourceManager:
                 # Spawna uma fração do déficit para não lotar de uma vez
                 to_spawn = max(1, deficit // 2)
                 
+                rng = self.world.rng.stream("ecology")
                 spawned_now = 0
                 for _ in range(to_spawn):
-                    room_vnum = random.choice(zone_rooms)
+                    room_vnum = spawn_table.sample(rng)
                     npc = self.world.spawn_npc(res.template_vnum, room_vnum)
                     if npc:
                         spawned_now += 1
@@ -119,10 +147,58 @@ class ResourceManager:
                 if spawned_now > 0:
                     logger.info(f"🌿 RESPAWN [{res.name}]: +{spawned_now} na Zona {zone_id} ({current_pop} -> {current_pop + spawned_now})")
 
+    # ==========================================================================
+    # RECUPERAÇÃO OFFLINE (forma fechada)
+    # ==========================================================================
+
+    @staticmethod
+    def deficit_after_cycles(deficit: int, cycles: int) -> int:
+        """
+        Déficit restante após `cycles` ciclos de respawn, sem simulá-los.
+        Cada ciclo repõe max(1, d // 2), ou seja d -> ceil(d / 2) (e 1 -> 0):
+        após k ciclos sobra ceil(d / 2^k), zerando em bit_length(d - 1) + 1 ciclos.
+        """
+        if deficit <= 0 or cycles <= 0:
+            return max(0, deficit)
+        if cycles > (deficit - 1).bit_length():
+            return 0
+        return -((-deficit) >> cycles)
+
+    def catch_up(self, zone_id: int, cycles: int) -> Dict[str, int]:
+        """
+        Avança a zona `cycles` ciclos de respawn de uma vez (servidor esteve
+        offline). Retorna quantos indivíduos de cada espécie foram repostos.
+        """
+        state = self._get_zone_state(zone_id)
+        if cycles <= 0 or zone_id in self.aggregates:
+            return {}
+
+        counts = self._count_populations(zone_id)
+        rng = self.world.rng.stream("ecology")
+        restored: Dict[str, int] = {}
+        for res in self.species_in_zone(zone_id):
+            spawn_table = self.spawn_tables.table(zone_id, res.template_vnum)
+            if not res.respawn_enabled or spawn_table is None:
+                continue
+            current_pop = counts.get(res.template_vnum, 0)
+            deficit = res.optimal_population - current_pop
+            to_spawn = deficit - self.deficit_after_cycles(deficit, cycles)
+
+            spawned = 0
+            for _ in range(to_spawn):
+                if self.world.spawn_npc(res.template_vnum, spawn_table.sample(rng)):
+                    spawned += 1
+            if spawned:
+                restored[res.species_id] = spawned
+
+        state.last_respawn_check = str(self.time.get_current_date())
+        return restored
+
     def get_resource_report(self, zone_id: int) -> str:
         lines = [f"=== RECURSOS NATURAIS (ZONA {zone_id}) ==="]
-        for res in self.resource_species.values():
-            count = self._count_population(zone_id, res.template_vnum)
+        counts = self._count_populations(zone_id)
+        for res in self.species_in_zone(zone_id):
+            count = counts.get(res.template_vnum, 0)
             status = "🟢" if count >= res.optimal_population else "🟡" if count >= res.minimum_population else "🔴 CRÍTICO"
             lines.append(f"{status} {res.name}: {count}/{res.optimal_population} (Mín: {res.minimum_population})")
         return "\n".join(lines)
\ No newline at end of file
@@ -0,0 +1,73 @@
+# backend/game/engines/ecology/spawn_tables.py
+"""
+TABELAS DE SPAWN POR ZONA E ESPÉCIE
+
+Para cada (zona, template) as salas candidatas são compiladas uma vez a partir de:
+- entradas "spawns" da sala (peso explícito, vale até em sala interna);
+- habitat do template (tags casando com flags da sala): se alguma sala da zona
+  casa, só elas recebem a espécie;
+- flags que vetam spawn natural (INDOOR, LABORATORY, TAVERN...).
+O resultado vira uma AliasTable (sorteio O(1)) guardada até o próximo reload.
+"""
+import logging
+from typing import Dict, List, Optional, Tuple
+
+from backend.game.utils.alias_table import AliasTable
+
+logger = logging.getLogger(__name__)
+
+# Salas que nunca recebem spawn natural (a não ser por entrada "spawns" explícita)
+NO_SPAWN_FLAGS = {"INDOOR", "LABORATORY", "CREATION_ALTAR", "TAVERN", "SAFE", "NO_MOB"}
+
+HABITAT_WEIGHT = 1.0        # Sala ao ar livre que casa com o habitat
+SPAWN_ENTRY_WEIGHT = 5.0    # Multiplicador das entradas "spawns" dos dados
+
+
+class SpawnTables:
+    def __init__(self, world_manager):
+        self.world = world_manager
+        self._tables: Dict[Tuple[int, int], Optional[AliasTable]] = {}
+
+    def invalidate(self):
+        """Salas ou templates recarregados: recompila sob demanda."""
+        self._tables.clear()
+
+    def table(self, zone_id: int, template_vnum: int) -> Optional[AliasTable]:
+        key = (zone_id, template_vnum)
+        if key not in self._tables:
+            self._tables[key] = self._compile(zone_id, template_vnum)
+        return self._tables[key]
+
+    def pick(self, zone_id: int, template_vnum: int, rng) -> Optional[int]:
+        """Sala de spawn sorteada (None se a zona não tem lugar para a espécie)."""
+        table = self.table(zone_id, template_vnum)
+        return table.sample(rng) if table else None
+
+    def _compile(self, zone_id: int, template_vnum: int) -> Optional[AliasTable]:
+        area = self.world.zones.get(zone_id)
+        template = self.world.factory._npc_templates.get(template_vnum)
+        habitat = set(template.habitat) if template else set()
+
+        rooms = [self.world.rooms[v] for v in sorted(area.room_vnums if area else ()) if v in self.world.rooms]
+        outdoor: List[int] = []
+        in_habitat: List[int] = []
+        explicit: Dict[int, float] = {}
+        for room in rooms:
+            if template_vnum in room.spawns:
+                explicit[room.vnum] = room.spawns[template_vnum] * SPAWN_ENTRY_WEIGHT
+            flags = {f.upper() for f in room.flags}
+            if flags & NO_SPAWN_FLAGS:
+                continue
+            outdoor.append(room.vnum)
+            if habitat & flags:
+                in_habitat.append(room.vnum)
+
+        weights: Dict[int, float] = {vnum: HABITAT_WEIGHT for vnum in (in_habitat or outdoor)}
+        for vnum, weight in explicit.items():
+            weights[vnum] = weights.get(vnum, 0.0) + weight
+
+        if not weights:
+            logger.debug(f"🌿 Spawn: Zona {zone_id} sem salas para o template {template_vnum}.")
+            return None
+        vnums = list(weights)
+        return AliasTable(vnums, [weights[v] for v in vnums])
@@ -0,0 +1,193 @@
+# backend/game/engines/events/bus.py
+"""
+BARRAMENTO DE EVENTOS (Integração entre Motores)
+
+Motores publicam eventos tipados (dataclasses de events/types.py) e assinam os
+que lhes interessam, sem embrulhar funções quentes uns dos outros.
+
+Dois modos de entrega por inscrito:
+- Síncrono: chamado dentro do publish (só callbacks síncronos e baratos).
+- Em lote: o evento entra na fila do tópico e é entregue no flush do tick
+  (callbacks assíncronos ou caros). Eventos com a mesma `coalesce_key` no mesmo
+  tick são fundidos: só o mais recente é entregue.
+
+Por tópico: publicados, entregues, fundidos, erros, custo dos handlers e
+latência publish -> entrega.
+"""
+import asyncio
+import inspect
+import logging
+import time
+from typing import Any, Callable, Dict, List, Optional, Type
+
+from backend.game.engines.time.metrics import LatencyHistogram, callback_name
+
+logger = logging.getLogger(__name__)
+
+# Intervalo do flush dos lotes (segundos reais)
+EVENT_FLUSH_INTERVAL = 0.5
+
+
+class TopicStats:
+    __slots__ = ("published", "delivered", "coalesced", "errors", "handler", "latency")
+
+    def __init__(self):
+        self.published = 0
+        self.delivered = 0
+        self.coalesced = 0
+        self.errors = 0
+        self.handler = LatencyHistogram()   # custo de cada chamada de handler
+        self.latency = LatencyHistogram()   # publish -> entrega (lotes)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "published": self.published,
+            "delivered": self.delivered,
+            "coalesced": self.coalesced,
+            "errors": self.errors,
+            "handler": self.handler.to_dict(),
+            "latency": self.latency.to_dict(),
+        }
+
+
+class _Subscriber:
+    __slots__ = ("callback", "batch", "is_async", "wants_list")
+
+    def __init__(self, callback: Callable, batch: bool, wants_list: bool):
+        self.callback = callback
+        self.batch = batch
+        self.is_async = inspect.iscoroutinefunction(callback)
+        self.wants_list = wants_list
+
+
+class EventBus:
+    def __init__(self):
+        self._subscribers: Dict[type, List[_Subscriber]] = {}
+        # Fila do tick por tópico: chave de fusão (ou contador) -> (evento, instante)
+        self._pending: Dict[type, Dict[Any, tuple]] = {}
+        self._seq = 0
+        self.stats: Dict[str, TopicStats] = {}
+
+    # ==========================================================================
+    # INSCRIÇÃO
+    # ==========================================================================
+
+    def subscribe(self, topic: Type, callback: Callable, batch: bool = False,
+                  wants_list: bool = False):
+        """
+        batch=False: entrega síncrona no publish (callbacks assíncronos viram lote).
+        batch=True: entrega no flush do tick. wants_list=True recebe a lista do
+        tick inteira numa só chamada, em vez de um evento por chamada.
+        """
+        batch = batch or wants_list or inspect.iscoroutinefunction(callback)
+        self._subscribers.setdefault(topic, []).append(_Subscriber(callback, batch, wants_list))
+
+    def unsubscribe(self, topic: Type, callback: Callable):
+        subs = self._subscribers.get(topic, [])
+        self._subscribers[topic] = [s for s in subs if s.callback != callback]
+
+    # ==========================================================================
+    # PUBLICAÇÃO
+    # ==========================================================================
+
+    def publish(self, event: Any):
+        topic = type(event)
+        subs = self._subscribers.get(topic)
+        stats = self._topic_stats(topic)
+        stats.published += 1
+        if not subs:
+            return
+
+        batched = False
+        for sub in subs:
+            if sub.batch:
+                batched = True
+                continue
+            self._call_sync(sub, event, stats)
+
+        if batched:
+            queue = self._pending.setdefault(topic, {})
+            key = getattr(event, "coalesce_key", None)
+            if key is None:
+                self._seq += 1
+                key = ("seq", self._seq)
+            elif key in queue:
+                # Mesmo assunto no mesmo tick: fica só o mais recente (e a ordem original)
+                stats.coalesced += 1
+                queue[key] = (event, queue[key][1])
+                return
+            queue[key] = (event, time.perf_counter())
+
+    async def flush(self):
+        """Entrega os lotes do tick (chamado pelo relógio a cada EVENT_FLUSH_INTERVAL)."""
+        if not self._pending:
+            return
+        pending, self._pending = self._pending, {}
+        for topic, queue in pending.items():
+            stats = self._topic_stats(topic)
+            entries = list(queue.values())
+            now = time.perf_counter()
+            for _, published_at in entries:
+                stats.latency.observe(now - published_at)
+            events = [event for event, _ in entries]
+
+            for sub in self._subscribers.get(topic, ()):
+                if not sub.batch:
+                    continue
+                if sub.wants_list:
+                    await self._call(sub, events, stats, len(events))
+                else:
+                    for event in events:
+                        await self._call(sub, event, stats, 1)
+
+    # ==========================================================================
+    # ENTREGA
+    # ==========================================================================
+
+    def _call_sync(self, sub: _Subscriber, event: Any, stats: TopicStats):
+        started = time.perf_counter()
+        try:
+            sub.callback(event)
+            stats.delivered += 1
+        except Exception as e:
+            stats.errors += 1
+            logger.error(f"📡 Evento {type(event).__name__} -> {callback_name(sub.callback)}: {e}")
+        stats.handler.observe(time.perf_counter() - started)
+
+    async def _call(self, sub: _Subscriber, payload: Any, stats: TopicStats, count: int):
+        started = time.perf_counter()
+        try:
+            result = sub.callback(payload)
+            if inspect.isawaitable(result):
+                await result
+            stats.delivered += count
+        except Exception as e:
+            stats.errors += 1
+            logger.error(f"📡 Lote -> {callback_name(sub.callback)}: {e}")
+        stats.handler.observe(time.perf_counter() - started)
+
+    def _topic_stats(self, topic: type) -> TopicStats:
+        stats = self.stats.get(topic.__name__)
+        if stats is None:
+            stats = self.stats[topic.__name__] = TopicStats()
+        return stats
+
+    # ==========================================================================
+    # RELATÓRIOS
+    # ==========================================================================
+
+    def snapshot(self) -> Dict[str, Any]:
+        return {name: s.to_dict() for name, s in sorted(self.stats.items())}
+
+    def format_report(self) -> str:
+        lines = ["📡 BARRAMENTO DE EVENTOS", "-" * 40]
+        for name, s in sorted(self.stats.items()):
+            subs = next((len(v) for k, v in self._subscribers.items() if k.__name__ == name), 0)
+            lines.append(
+                f"{name:<24} inscritos={subs:<3} pub={s.published:<7} entregues={s.delivered:<7} "
+                f"fundidos={s.coalesced:<5} erros={s.errors} handler p95={s.handler.percentile(95)}ms "
+                f"latência p95={s.latency.percentile(95)}ms"
+            )
+        if len(lines) == 2:
+            lines.append("Nenhum evento publicado ainda.")
+        return "\n".join(lines)
@@ -0,0 +1,83 @@
+# backend/game/engines/events/types.py
+"""
+Eventos publicados no EventBus (um tipo = um tópico).
+
+Os eventos carregam dados já resolvidos (nomes, níveis, sala): quando um lote é
+entregue no fim do tick, a entidade pode já ter saído do mundo.
+`coalesce_key` (quando existe) funde eventos do mesmo assunto no mesmo tick.
+"""
+from dataclasses import dataclass
+from typing import Any, Optional
+
+
+@dataclass
+class EntityKilled:
+    """Morte em combate (jogador ou NPC, por jogador, NPC ou efeito)."""
+    victim: Any                  # EntityHandle
+    victim_name: str
+    victim_level: int
+    room_vnum: int
+    zone_id: int
+    killer: Optional[Any] = None  # EntityHandle
+    killer_name: str = ""
+    killer_level: int = 0
+    killer_uid: Optional[str] = None  # NPC assassino (para o Nemesis)
+    room_name: str = ""
+    damage_type: Optional[str] = None
+
+
+@dataclass
+class PlayerLeveledUp:
+    player_id: str
+    player_name: str
+    level: int
+
+    @property
+    def coalesce_key(self):
+        return self.player_id
+
+
+@dataclass
+class PlayerRemorted:
+    player_id: str
+    player_name: str
+    old_class: str
+    new_class: str
+    remort_count: int
+    skill_kept: str
+    location_vnum: int
+    location_name: str
+
+
+@dataclass
+class CatalystDropped:
+    player_id: str
+    player_name: str
+    catalyst_id: str
+    source_name: str
+    room_vnum: int
+
+
+@dataclass
+class NPCProgressed:
+    """Abates/evolução de um NPC mudaram (rankings Nemesis)."""
+    npc_uid: str
+
+    @property
+    def coalesce_key(self):
+        return self.npc_uid
+
+
+@dataclass
+class NPCEvolved:
+    npc_uid: str
+    npc_name: str
+    stage: int
+    room_vnum: int
+
+
+@dataclass
+class ZoneAlphaCrowned:
+    zone_id: int
+    npc_uid: str
+    npc_name: str
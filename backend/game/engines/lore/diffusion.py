@@ -0,0 +1,115 @@
+# backend/game/engines/lore/diffusion.py
+"""
+DIFUSÃO DE LENDAS (Orçamento por Tick)
+
+A cada tick o motor percorre as salas povoadas (>= 2 NPCs, conjunto mantido
+pelo WorldManager) com um cursor round-robin e conta até DIFFUSION_BUDGET
+histórias, em muitas salas por tick.
+
+Por sala, tudo sai de operações de bitset sobre o que cada NPC sabe:
+- "novidade" de um NPC = o que ele sabe e nem todos na sala sabem;
+- o contador é sorteado entre quem tem novidade, com peso storytelling_skill;
+- cada ouvinte que não conhece a lenda aprende com chance skill/100 * LEARN_RATE.
+Com a migração levando os NPCs de sala em sala, uma lenda cobre a zona em minutos.
+"""
+import logging
+from typing import List
+
+logger = logging.getLogger(__name__)
+
+DIFFUSION_BUDGET = 200          # Histórias contadas por tick
+ROOMS_PER_STORY = 4             # Salas visitadas por história do orçamento (salas sem novidade)
+LEARN_RATE = 1.0                # Chance de aprender = skill/100 * LEARN_RATE
+DEFAULT_SKILL = 50              # NPC sem memória registrada
+
+
+class LegendDiffusion:
+    def __init__(self, grimoire, world_manager):
+        self.grimoire = grimoire
+        self.world = world_manager
+        self.budget = DIFFUSION_BUDGET
+        self._queue: List[int] = []
+        self._cursor = 0
+        self.stories_told = 0
+        self.legends_learned = 0
+
+    def tick(self) -> int:
+        """Conta até `budget` histórias. Retorna quantos NPCs aprenderam algo."""
+        knowledge = self.grimoire.knowledge
+        if not knowledge:
+            return 0
+        rng = self.world.rng.stream("lore")
+
+        told = learned = visited = quiet = 0
+        max_rooms = self.budget * ROOMS_PER_STORY
+        while told < self.budget and visited < max_rooms:
+            if self._cursor >= len(self._queue):
+                self._queue = list(self.world.populated_rooms)
+                self._cursor = 0
+                if not self._queue:
+                    break
+            if quiet >= len(self._queue):
+                break  # Todas as salas vistas em sequência, sem novidade em nenhuma
+            room = self.world.rooms.get(self._queue[self._cursor])
+            self._cursor += 1
+            visited += 1
+            if room is None or len(room.npcs_here) < 2:
+                quiet += 1
+                continue
+            result = self._tell_in_room(room, rng)
+            if result >= 0:
+                told += 1
+                learned += result
+                quiet = 0
+            else:
+                quiet += 1
+
+        self.stories_told += told
+        self.legends_learned += learned
+        return learned
+
+    def _tell_in_room(self, room, rng) -> int:
+        """Uma história na sala. -1 se ninguém tinha novidade; senão quantos aprenderam."""
+        knowledge = self.grimoire.knowledge
+        uids = room.npcs_here
+        masks = [knowledge.mask(uid) for uid in uids]
+
+        union = 0
+        common = -1
+        for mask in masks:
+            union |= mask
+            common &= mask
+        news = union & ~common
+        if not news:
+            return -1
+
+        # Contador: quem sabe algo que nem todos sabem, com peso pela habilidade
+        memories = self.grimoire.npc_memories
+        candidates, weights = [], []
+        for idx, mask in enumerate(masks):
+            if mask & news:
+                memory = memories.get(uids[idx])
+                candidates.append(idx)
+                weights.append(max(1, memory.storytelling_skill if memory else DEFAULT_SKILL))
+        teller = rng.choices(candidates, weights=weights)[0]
+        teller_news = masks[teller] & news
+
+        # Uma lenda da novidade do contador, sorteada entre os bits ligados
+        bits = []
+        while teller_news:
+            low = teller_news & -teller_news
+            bits.append(low)
+            teller_news ^= low
+        flag = rng.choice(bits)
+        legend_id = knowledge.legend_ids[flag.bit_length() - 1]
+
+        weight = weights[candidates.index(teller)]
+        chance = min(1.0, weight / 100.0 * LEARN_RATE)
+        learned = 0
+        for idx, mask in enumerate(masks):
+            if idx != teller and not mask & flag and rng.random() < chance:
+                if self.grimoire.teach(uids[idx], legend_id):
+                    learned += 1
+        if learned:
+            logger.debug(f"GRIMOIRE: {learned} ouvintes aprenderam '{legend_id}' em {room.title}")
+        return learned
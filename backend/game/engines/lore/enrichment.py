@@ -0,0 +1,116 @@
+# backend/game/engines/lore/enrichment.py
+"""
+ENRIQUECIMENTO DE LENDAS PELO LLM (Fila Priorizada)
+
+A lenda nasce só com a versão factual e já circula; a versão poética é pedida
+aqui, fora do caminho de quem testemunhou o evento (morte, renascer...).
+
+- Fila limitada com prioridade pela épica (IndexedHeap): cheia, a lenda
+  menos épica sai para dar lugar a uma mais épica (ou a nova é descartada).
+- Pedido que esperou mais que ENRICH_MAX_AGE é descartado: o LLM está atrasado
+  demais para valer a pena.
+- ENRICH_WORKERS tarefas consomem a fila; cada geração tem teto ENRICH_TIMEOUT.
+- Pronta, a versão entra em legend.versions via GrimoireEngine.add_version
+  (mesma lista, já vista por quem conta a lenda, e registrada no journal).
+"""
+import asyncio
+import logging
+import time
+from typing import Dict, List, Optional
+
+from backend.game.utils.indexed_heap import IndexedHeap
+
+logger = logging.getLogger(__name__)
+
+ENRICH_QUEUE_SIZE = 16
+ENRICH_WORKERS = 2
+ENRICH_MAX_AGE = 120.0      # Segundos na fila antes de o pedido virar lixo
+ENRICH_TIMEOUT = 60.0       # Teto por geração (o OllamaService aceita bem mais)
+
+
+class LegendEnrichment:
+    def __init__(self, grimoire, ollama_service):
+        self.grimoire = grimoire
+        self.ollama = ollama_service
+        self.queue = IndexedHeap()                  # id da lenda -> -épica
+        self._enqueued_at: Dict[str, float] = {}
+        self._ready: Optional[asyncio.Event] = None
+        self._workers: List[asyncio.Task] = []
+
+        self.enriched = 0
+        self.failed = 0
+        self.dropped_full = 0
+        self.dropped_stale = 0
+
+    # ==========================================================================
+    # FILA
+    # ==========================================================================
+
+    def request(self, legend) -> bool:
+        """Enfileira a versão poética da lenda. False se foi descartada."""
+        if self.ollama is None:
+            return False
+        if self._ready is None:
+            # Criados sob demanda: exige loop rodando
+            self._ready = asyncio.Event()
+            self._workers = [asyncio.create_task(self._worker()) for _ in range(ENRICH_WORKERS)]
+
+        if len(self.queue) >= ENRICH_QUEUE_SIZE and legend.id not in self.queue:
+            # Fila pequena: achar a menos épica por varredura é barato
+            worst = max(self.queue, key=self.queue.priority)
+            if -self.queue.priority(worst) >= legend.epic_score:
+                self.dropped_full += 1
+                return False
+            self.queue.remove(worst)
+            self._enqueued_at.pop(worst, None)
+            self.dropped_full += 1
+
+        self.queue.push(legend.id, -legend.epic_score)
+        self._enqueued_at[legend.id] = time.monotonic()
+        self._ready.set()
+        return True
+
+    async def _next(self) -> str:
+        """Próximo pedido ainda fresco, do mais épico para o menos."""
+        while True:
+            while not self.queue:
+                self._ready.clear()
+                await self._ready.wait()
+            legend_id, _ = self.queue.pop()
+            enqueued_at = self._enqueued_at.pop(legend_id, 0.0)
+            if time.monotonic() - enqueued_at > ENRICH_MAX_AGE:
+                self.dropped_stale += 1
+                continue
+            return legend_id
+
+    # ==========================================================================
+    # TRABALHADORES
+    # ==========================================================================
+
+    async def _worker(self):
+        while True:
+            legend_id = await self._next()
+            legend = self.grimoire.legends.get(legend_id)
+            if legend is None or not legend.versions:
+                continue
+            facts = legend.versions[0]
+            try:
+                poetic = await asyncio.wait_for(
+                    self.grimoire._generate_poetic_version(legend.event_type, legend.original_facts, facts),
+                    ENRICH_TIMEOUT,
+                )
+            except asyncio.TimeoutError:
+                self.failed += 1
+                logger.warning(f"GRIMOIRE: LLM não respondeu em {ENRICH_TIMEOUT:.0f}s para '{legend.title}'.")
+                continue
+            except Exception as e:
+                self.failed += 1
+                logger.error(f"GRIMOIRE: Falha ao enriquecer '{legend.title}': {e}")
+                continue
+
+            if poetic and poetic != facts:
+                self.grimoire.add_version(legend_id, poetic)
+                self.enriched += 1
+                logger.info(f"GRIMOIRE: '{legend.title}' ganhou versão poética.")
+            else:
+                self.failed += 1
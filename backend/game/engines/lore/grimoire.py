@@ -8,15 +8,26 @@ que se espalham organicamente através dos NPCs.
 
 import asyncio
 import logging
-import json
-import random
+import uuid
 from datetime import datetime
 from typing import Dict, List, Optional, Any
 from dataclasses import dataclass, field
 from pathlib import Path
 
+from backend.config.server_config import STATE_COMPRESS
+from backend.game.utils.persistence import JsonStore
+from backend.game.utils.journal import Journal
+from backend.game.engines.events.types import EntityKilled, PlayerRemorted
+from backend.game.engines.lore.index import LegendIndex, ProtagonistStats
+from backend.game.engines.lore.knowledge import LegendKnowledge
+from backend.game.engines.lore.diffusion import DEFAULT_SKILL, LegendDiffusion
+from backend.game.engines.lore.enrichment import LegendEnrichment
+
 logger = logging.getLogger(__name__)
 
+# Lote do journal gravado + fsync a cada tick (segundos reais)
+JOURNAL_FLUSH_INTERVAL = 1.0
+
 # ==============================================================================
 # ESTRUTURAS DE DADOS
 # ==============================================================================
@@ -38,8 +49,7 @@ class Legend:
     
     # Metadados
     epic_score: int = 0  # Quão épica é (0-100)
-    spread_count: int = 0  # Quantas vezes foi contada
-    believers: List[str] = field(default_factory=list)  # NPCs que conhecem
+    spread_count: int = 0  # Quantas vezes foi contada (crentes: GrimoireEngine.believer_count)
     timestamp: float = field(default_factory=lambda: datetime.utcnow().timestamp())
     
     # Efeitos no mundo
@@ -49,8 +59,7 @@ class Legend:
 @dataclass
 class NPCMemory:
     """Memória de um NPC sobre lendas."""
-    npc_uid: str
-    known_legends: List[str] = field(default_factory=list)  # IDs de lendas
+    npc_uid: str  # O que o NPC conhece fica nos bitsets (GrimoireEngine.knowledge)
     favorite_story: Optional[str] = None
     storytelling_skill: int = 50  # 0-100, afeta qualidade das variações
 
@@ -64,17 +73,34 @@ class GrimoireEngine:
     Observa o mundo e tece mitologia.
     """
     
-    def __init__(self, world_manager, ollama_service=None):
+    def __init__(self, world_manager, ollama_service=None, time_engine=None):
         self.world = world_manager
         self.ollama = ollama_service
         
         # Banco de Lendas
         self.legends: Dict[str, Legend] = {}
         self.npc_memories: Dict[str, NPCMemory] = {}
-        
-        # Configuração
+        # Índices e agregados dos comandos (protagonista, zona, rankings...)
+        self.index = LegendIndex()
+        # Quem sabe o quê (bitsets) e a difusão por orçamento que os usa
+        self.knowledge = LegendKnowledge()
+        self.diffusion = LegendDiffusion(self, world_manager)
+        # Versões poéticas pedidas ao LLM em segundo plano (fila por épica)
+        self.enrichment = LegendEnrichment(self, ollama_service)
+        # NPC removido é esquecido; o colapso do LOD guarda antes o que ele sabia (recall)
+        world_manager.on_npc_removed(self.forget_npc)
+        
+        # Configuração: snapshot compactado + journal das mutações desde ele
         self.save_path = Path("data/grimoire.json")
+        self.store = JsonStore(self.save_path, compress=STATE_COMPRESS)
+        self.journal = Journal(Path("data/grimoire.journal"), self.store, self._snapshot, self._apply)
         self.enabled = True
+
+        self.flush_task = None
+        if time_engine is not None:
+            self.flush_task = time_engine.schedule_every(
+                JOURNAL_FLUSH_INTERVAL, self.journal.flush, name="lore:journal"
+            )
         
         # Filas de eventos
         self.pending_events: List[Dict] = []
@@ -105,13 +131,16 @@ class GrimoireEngine:
         
         # Se for épico o suficiente (>30), vira lenda
         if epic_score >= 30:
-            legend = await self._create_legend(event_type, data, epic_score)
-            self.legends[legend.id] = legend
+            legend = self._create_legend(event_type, data, epic_score)
+            self.add_legend(legend)
             
             # Espalha para NPCs próximos
             await self._spread_to_witnesses(legend, data.get("location_vnum"))
             
             logger.info(f"GRIMOIRE: Nova lenda criada - '{legend.title}' (Épica: {epic_score})")
+
+            # Se temos Ollama, a versão poética chega depois (sem segurar quem testemunhou)
+            self.enrichment.request(legend)
     
     def _calculate_epic_score(self, event_type: str, data: Dict) -> int:
         """
@@ -150,11 +179,10 @@ class GrimoireEngine:
     # CRIAÇÃO DE LENDAS
     # ==========================================================================
     
-    async def _create_legend(self, event_type: str, data: Dict, epic_score: int) -> Legend:
-        """Cria uma nova lenda."""
-        import uuid
-        
-        legend_id = str(uuid.uuid4())[:8]
+    def _create_legend(self, event_type: str, data: Dict, epic_score: int) -> Legend:
+        """Cria uma nova lenda (só com a versão factual)."""
+        # Id fora dos fluxos semeados: com WORLD_SEED fixo eles recomeçam iguais a cada boot
+        legend_id = uuid.uuid4().hex
         
         # Gera título épico
         title = self._generate_title(event_type, data)
@@ -165,15 +193,6 @@ class GrimoireEngine:
         # Versão 1: Os Fatos Puros
         original_version = self._narrate_facts(event_type, data)
         
-        # Se temos Ollama, pede versão poética
-        if self.ollama:
-            try:
-                poetic_version = await self._generate_poetic_version(event_type, data, original_version)
-            except:
-                poetic_version = original_version
-        else:
-            poetic_version = original_version
-        
         legend = Legend(
             id=legend_id,
             title=title,
@@ -181,13 +200,30 @@ class GrimoireEngine:
             protagonist=data.get("player_name", "Herói Desconhecido"),
             event_type=event_type,
             original_facts=data,
-            versions=[original_version, poetic_version],
+            versions=[original_version],
             epic_score=epic_score,
             zone_modifier=data.get("zone_id")
         )
         
         return legend
     
+    def add_legend(self, legend: Legend):
+        self._store_legend(legend)
+        self.journal.append("legend", legend=self._legend_dict(legend))
+
+    def _store_legend(self, legend: Legend):
+        self.legends[legend.id] = legend
+        self.index.add(legend)
+
+    def add_version(self, legend_id: str, text: str) -> bool:
+        """Nova versão da história (a mais recente é a mais elaborada)."""
+        legend = self.legends.get(legend_id)
+        if legend is None:
+            return False
+        legend.versions.append(text)
+        self.journal.append("version", id=legend_id, text=text)
+        return True
+    
     def _generate_title(self, event_type: str, data: Dict) -> str:
         """Gera título épico."""
         player = data.get("player_name", "O Herói")
@@ -212,7 +248,7 @@ class GrimoireEngine:
         }
         
         options = templates.get(event_type, [f"A Saga de {player}"])
-        return random.choice(options)
+        return self.world.rng.stream("lore").choice(options)
     
     def _categorize_event(self, event_type: str, data: Dict) -> str:
         """Determina a categoria narrativa."""
@@ -285,102 +321,100 @@ Escreva como se estivesse contando em uma taverna lotada. Use linguagem dramáti
         # Todos os NPCs na sala "ouviram"
         for npc_uid in room.npcs_here:
             npc = self.world.get_npc(npc_uid)
-            if not npc:
-                continue
-                
-            # Cria memória se não existe
-            if npc_uid not in self.npc_memories:
-                self.npc_memories[npc_uid] = NPCMemory(npc_uid=npc_uid)
-            
-            memory = self.npc_memories[npc_uid]
-            
-            # Adiciona lenda ao conhecimento
-            if legend.id not in memory.known_legends:
-                memory.known_legends.append(legend.id)
-                legend.believers.append(npc_uid)
-                legend.spread_count += 1
-                
+            if npc and self.teach(npc_uid, legend.id):
                 logger.info(f"GRIMOIRE: {npc.name} agora conhece '{legend.title}'")
+
+    def teach(self, npc_uid: str, legend_id: str) -> bool:
+        """NPC aprende a lenda. Retorna False se já conhecia."""
+        legend = self.legends.get(legend_id)
+        if legend is None or not self.knowledge.learn(npc_uid, legend_id):
+            return False
+        legend.spread_count += 1
+        self.index.told(legend)
+        self.journal.append("learn", npc=npc_uid, id=legend_id)
+        return True
+
+    def recall(self, npc_uid: str, legend_ids: List[str]) -> int:
+        """
+        NPC rematerializado pelo LOD volta a saber o que o colapsado sabia.
+        Não é história contada: spread_count e índices ficam como estavam.
+        """
+        recalled = [legend_id for legend_id in legend_ids
+                    if legend_id in self.legends and self.knowledge.learn(npc_uid, legend_id)]
+        if recalled:
+            self.journal.append("recall", npc=npc_uid, ids=recalled)
+        return len(recalled)
+
+    def forget_npc(self, npc_uid: str):
+        """NPC saiu do mundo: some dos bitsets e das memórias."""
+        known = self.knowledge.forget(npc_uid)
+        if self.npc_memories.pop(npc_uid, None) is not None or known:
+            self.journal.append("forget", npc=npc_uid)
+
+    def prune_absent_npcs(self) -> int:
+        """
+        Esquece (e registra no journal) os NPCs que não estão no mundo. Os uids
+        mudam a cada boot: chamado depois do start_up, impede que o
+        conhecimento de sessões anteriores se acumule a cada reinício.
+        """
+        active = self.world.active_npcs
+        absent = [uid for uid in self.knowledge.npc_index if uid not in active]
+        absent.extend(uid for uid in self.npc_memories if uid not in active and uid not in self.knowledge.npc_index)
+        for uid in absent:
+            self.forget_npc(uid)
+        if absent:
+            logger.info(f"GRIMOIRE: {len(absent)} NPCs ausentes esquecidos.")
+        return len(absent)
+
+    def known_legends(self, npc_uid: str) -> List[str]:
+        return self.knowledge.legends_of(npc_uid)
+
+    def believer_count(self, legend_id: str) -> int:
+        return self.knowledge.believer_count(legend_id)
     
     async def spread_legend_naturally(self):
         """
-        Tick periódico: NPCs compartilham histórias entre si.
-        Chamado pelo TimeEngine a cada ~30 segundos.
+        Tick periódico (TimeEngine): NPCs contam histórias entre si em todas
+        as salas povoadas, até o orçamento do tick (ver diffusion.py).
         """
-        if not self.legends:
-            return
-            
-        # Escolhe uma sala aleatória com múltiplos NPCs
-        populated_rooms = [r for r in self.world.rooms.values() if len(r.npcs_here) >= 2]
-        
-        if not populated_rooms:
-            return
-            
-        room = random.choice(populated_rooms)
-        
-        # Escolhe um "contador de histórias"
-        storyteller_uid = random.choice(room.npcs_here)
-        storyteller_memory = self.npc_memories.get(storyteller_uid)
-        
-        if not storyteller_memory or not storyteller_memory.known_legends:
+        if not self.legends or not self.enabled:
             return
-            
-        # Escolhe uma história para contar
-        legend_id = random.choice(storyteller_memory.known_legends)
-        legend = self.legends.get(legend_id)
-        
-        if not legend:
-            return
-            
-        # "Conta" para outros NPCs na sala
-        for listener_uid in room.npcs_here:
-            if listener_uid == storyteller_uid:
-                continue
-                
-            if listener_uid not in self.npc_memories:
-                self.npc_memories[listener_uid] = NPCMemory(npc_uid=listener_uid)
-            
-            listener_memory = self.npc_memories[listener_uid]
-            
-            # Se já conhece, ignora
-            if legend_id in listener_memory.known_legends:
-                continue
-                
-            # Aprende a lenda (com possível distorção)
-            listener_memory.known_legends.append(legend_id)
-            legend.believers.append(listener_uid)
-            legend.spread_count += 1
-            
-            # Log imersivo
-            storyteller = self.world.get_npc(storyteller_uid)
-            listener = self.world.get_npc(listener_uid)
-            
-            if storyteller and listener:
-                logger.info(
-                    f"GRIMOIRE: {storyteller.name} conta '{legend.title}' "
-                    f"para {listener.name} em {room.title}"
-                )
+        self.diffusion.tick()
     
     # ==========================================================================
     # COMANDOS DE JOGADOR
     # ==========================================================================
     
-    def get_legends_about_player(self, player_name: str) -> List[Legend]:
-        """Retorna todas as lendas sobre um jogador."""
-        return [l for l in self.legends.values() if l.protagonist.lower() == player_name.lower()]
+    def get_legends_about_player(self, player_name: str, limit: Optional[int] = None) -> List[Legend]:
+        """Lendas sobre um jogador, da mais épica para a menos."""
+        stats = self.index.protagonist(player_name)
+        return [self.legends[lid] for lid in stats.legend_ids(limit)] if stats else []
     
-    def get_zone_legends(self, zone_id: int) -> List[Legend]:
-        """Retorna lendas de uma zona específica."""
-        return [l for l in self.legends.values() if l.zone_modifier == zone_id]
+    def get_zone_legends(self, zone_id: int, limit: Optional[int] = None) -> List[Legend]:
+        """Lendas de uma zona específica (ordem de criação)."""
+        ids = self.index.by_zone.get(zone_id, [])
+        return [self.legends[lid] for lid in (ids if limit is None else ids[:limit])]
+
+    def top_legends(self, k: int, by: str = "epic") -> List[Legend]:
+        """As k lendas mais épicas (by="epic") ou mais contadas (by="spread")."""
+        board = self.index.spread if by == "spread" else self.index.epic
+        return [self.legends[lid] for lid, _ in board.top(k)]
+
+    def protagonist_stats(self, player_name: str) -> Optional[ProtagonistStats]:
+        return self.index.protagonist(player_name)
+
+    def oldest_legend(self) -> Optional[Legend]:
+        return self.legends.get(self.index.oldest) if self.index.oldest else None
     
     async def npc_tell_legend(self, npc_uid: str, legend_id: str) -> Optional[str]:
         """
         NPC conta uma lenda (possivelmente com variação).
         Retorna o texto narrativo.
         """
-        memory = self.npc_memories.get(npc_uid)
-        if not memory or legend_id not in memory.known_legends:
+        if not self.knowledge.knows(npc_uid, legend_id):
             return None
+        memory = self.npc_memories.get(npc_uid)
+        skill = memory.storytelling_skill if memory else DEFAULT_SKILL
             
         legend = self.legends.get(legend_id)
         if not legend:
@@ -390,7 +424,7 @@ Escreva como se estivesse contando em uma taverna lotada. Use linguagem dramáti
         npc_name = npc.name if npc else "Alguém"
         
         # Escolhe versão baseada na habilidade do NPC
-        if memory.storytelling_skill > 70 and len(legend.versions) > 1:
+        if skill > 70 and len(legend.versions) > 1:
             version = legend.versions[-1]  # Versão mais elaborada
         else:
             version = legend.versions[0]  # Versão factual
@@ -403,7 +437,7 @@ Escreva como se estivesse contando em uma taverna lotada. Use linguagem dramáti
             f"{npc_name} bate na mesa e declama:"
         ]
         
-        intro = random.choice(intros)
+        intro = self.world.rng.stream("lore").choice(intros)
         
         return f'{intro}\n"{version}"'
     
@@ -411,67 +445,99 @@ Escreva como se estivesse contando em uma taverna lotada. Use linguagem dramáti
     # PERSISTÊNCIA
     # ==========================================================================
     
+    @staticmethod
+    def _legend_dict(l: Legend) -> Dict[str, Any]:
+        return {
+            "id": l.id,
+            "title": l.title,
+            "category": l.category,
+            "protagonist": l.protagonist,
+            "event_type": l.event_type,
+            "original_facts": dict(l.original_facts),
+            "versions": list(l.versions),
+            "epic_score": l.epic_score,
+            "spread_count": l.spread_count,
+            "timestamp": l.timestamp,
+            "zone_modifier": l.zone_modifier
+        }
+
+    def _snapshot(self) -> Dict[str, Any]:
+        """Cópia do estado montada no loop; a serialização roda em outra thread."""
+        return {
+            "legends": {lid: self._legend_dict(l) for lid, l in self.legends.items()},
+            "npc_memories": {
+                uid: {
+                    "npc_uid": m.npc_uid,
+                    "favorite_story": m.favorite_story,
+                    "storytelling_skill": m.storytelling_skill
+                }
+                for uid, m in self.npc_memories.items()
+            },
+            "knowledge": self.knowledge.to_dict()
+        }
+
+    def _apply(self, record: Dict[str, Any]):
+        """Reaplica um registro do journal (load)."""
+        op = record["op"]
+        if op == "legend":
+            self._store_legend(Legend(**record["legend"]))
+        elif op == "version":
+            self.add_version(record["id"], record["text"])
+        elif op == "learn":
+            self.teach(record["npc"], record["id"])
+        elif op == "recall":
+            self.recall(record["npc"], record["ids"])
+        elif op == "forget":
+            self.forget_npc(record["npc"])
+
     def save_grimoire(self):
-        """Salva todas as lendas em disco."""
+        """Compacta journal + estado num snapshot (síncrono: desligamento)."""
         try:
-            data = {
-                "legends": {
-                    lid: {
-                        "id": l.id,
-                        "title": l.title,
-                        "category": l.category,
-                        "protagonist": l.protagonist,
-                        "event_type": l.event_type,
-                        "original_facts": l.original_facts,
-                        "versions": l.versions,
-                        "epic_score": l.epic_score,
-                        "spread_count": l.spread_count,
-                        "believers": l.believers,
-                        "timestamp": l.timestamp
-                    }
-                    for lid, l in self.legends.items()
-                },
-                "npc_memories": {
-                    uid: {
-                        "npc_uid": m.npc_uid,
-                        "known_legends": m.known_legends,
-                        "favorite_story": m.favorite_story,
-                        "storytelling_skill": m.storytelling_skill
-                    }
-                    for uid, m in self.npc_memories.items()
-                }
-            }
-            
-            with open(self.save_path, 'w', encoding='utf-8') as f:
-                json.dump(data, f, indent=2, ensure_ascii=False)
-                
+            self.journal.compact_sync()
+            logger.info(f"GRIMOIRE: {len(self.legends)} lendas salvas.")
+        except Exception as e:
+            logger.error(f"Erro ao salvar grimório: {e}")
+
+    async def save_grimoire_async(self):
+        """Compacta sem travar o loop (snapshot gravado numa thread de trabalho)."""
+        try:
+            await self.journal.compact()
             logger.info(f"GRIMOIRE: {len(self.legends)} lendas salvas.")
-            
         except Exception as e:
             logger.error(f"Erro ao salvar grimório: {e}")
     
     def load_grimoire(self):
-        """Carrega lendas do disco."""
-        if not self.save_path.exists():
-            logger.info("GRIMOIRE: Nenhum histórico encontrado. Começando limpo.")
-            return
-            
+        """Carrega o snapshot e reaplica o journal gravado depois dele."""
         try:
-            with open(self.save_path, 'r', encoding='utf-8') as f:
-                data = json.load(f)
-            
-            # Restaura lendas
-            for lid, ldata in data.get("legends", {}).items():
-                self.legends[lid] = Legend(**ldata)
-            
-            # Restaura memórias
-            for uid, mdata in data.get("npc_memories", {}).items():
-                self.npc_memories[uid] = NPCMemory(**mdata)
-            
-            logger.info(f"GRIMOIRE: {len(self.legends)} lendas carregadas.")
-            
+            data = self.journal.load()
         except Exception as e:
             logger.error(f"Erro ao carregar grimório: {e}")
+            return
+
+        if data:
+            self._restore(data)
+        replayed = self.journal.replay()
+
+        if not data and not replayed:
+            logger.info("GRIMOIRE: Nenhum histórico encontrado. Começando limpo.")
+            return
+        logger.info(f"GRIMOIRE: {len(self.legends)} lendas carregadas ({replayed} registros do journal).")
+
+    def _restore(self, data: Dict[str, Any]):
+        # Restaura lendas
+        for lid, ldata in data.get("legends", {}).items():
+            believers = ldata.pop("believers", ())  # Saves antigos: listas de UIDs
+            self._store_legend(Legend(**ldata))
+            for uid in believers:
+                self.knowledge.learn(uid, lid)
+
+        # Restaura memórias
+        for uid, mdata in data.get("npc_memories", {}).items():
+            for legend_id in mdata.pop("known_legends", ()):
+                self.knowledge.learn(uid, legend_id)
+            self.npc_memories[uid] = NPCMemory(**mdata)
+
+        self.knowledge.load_dict(data.get("knowledge", {}))
 
 
 # ==============================================================================
@@ -480,38 +546,44 @@ Escreva como se estivesse contando em uma taverna lotada. Use linguagem dramáti
 
 class GrimoireIntegration:
     """
-    Hooks para integrar o Grimório com os sistemas existentes.
+    Liga o Grimório aos eventos do mundo (EventBus): nada de embrulhar funções
+    de outros motores.
     """
-    
+
     @staticmethod
-    def hook_combat_manager(combat_manager, grimoire_engine):
-        """Adiciona capturas de eventos no CombatManager."""
-        
-        original_handle_death = combat_manager._handle_death
-        
-        async def new_handle_death(entity_id, session, killer=None):
-            # Chama original
-            await original_handle_death(entity_id, session, killer)
-            
-            # Captura para Grimoire
-            if killer:
-                from backend.models.character import Character
-                from backend.models.npc import NPCInstance
-                
-                if isinstance(killer, Character) and isinstance(
-                    combat_manager._get_entity(entity_id), NPCInstance
-                ):
-                    victim = combat_manager._get_entity(entity_id)
-                    
-                    await grimoire_engine.witness_event("player_kill", {
-                        "player_name": killer.name,
-                        "player_level": killer.level,
-                        "enemy_name": victim.name,
-                        "enemy_level": victim.level,
-                        "location_vnum": session.room_vnum,
-                        "location_name": combat_manager.world.get_room(session.room_vnum).title,
-                        "zone_id": victim.room_vnum // 100000,
-                        "year": 1000  # Pegar do TimeEngine
-                    })
-        
-        combat_manager._handle_death = new_handle_death
\ No newline at end of file
+    def subscribe(events, grimoire_engine):
+        """Inscreve o Grimório nos tópicos que viram lenda."""
+
+        def current_year() -> int:
+            time_engine = getattr(grimoire_engine.world, "time", None)
+            return time_engine.get_current_date().year if time_engine else 1000
+
+        async def on_entity_killed(event: EntityKilled):
+            if event.killer is None or not event.killer.is_player or not event.victim.is_npc:
+                return
+            await grimoire_engine.witness_event("player_kill", {
+                "player_name": event.killer_name,
+                "player_level": event.killer_level,
+                "enemy_name": event.victim_name,
+                "enemy_level": event.victim_level,
+                "location_vnum": event.room_vnum,
+                "location_name": event.room_name,
+                "zone_id": event.zone_id,
+                "year": current_year()
+            })
+
+        async def on_remort(event: PlayerRemorted):
+            await grimoire_engine.witness_event("remort", {
+                "player_name": event.player_name,
+                "player_level": 100,  # O nível que ele tinha antes do reset
+                "old_class": event.old_class,
+                "new_class": event.new_class,
+                "remort_count": event.remort_count,
+                "skill_kept": event.skill_kept,
+                "location_vnum": event.location_vnum,
+                "location_name": event.location_name,
+                "year": current_year()
+            })
+
+        events.subscribe(EntityKilled, on_entity_killed)
+        events.subscribe(PlayerRemorted, on_remort)
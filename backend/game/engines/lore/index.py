@@ -0,0 +1,93 @@
+# backend/game/engines/lore/index.py
+"""
+ÍNDICES DO GRIMÓRIO (Consultas dos Comandos de Lore)
+
+Mantidos a cada mutação (lenda criada, lenda contada), para que lendas,
+reputacao e mitos não varram nem ordenem o grimório inteiro:
+- protagonista (casefold) -> ids, da mais épica para a menos;
+- zona -> ids e categoria -> ids (ordem de criação);
+- rankings por épica e por vezes contada (Leaderboard, top-k);
+- agregados: total contado, lenda mais antiga e, por protagonista,
+  soma de épica, soma de contagens e lendas por categoria.
+"""
+from bisect import insort
+from typing import Dict, List, Optional, Tuple
+
+from backend.game.world.zones import Leaderboard
+
+
+class ProtagonistStats:
+    __slots__ = ("name", "count", "epic_sum", "spread_sum", "categories", "_ranked")
+
+    def __init__(self, name: str):
+        self.name = name
+        self.count = 0
+        self.epic_sum = 0
+        self.spread_sum = 0
+        self.categories: Dict[str, int] = {}
+        self._ranked: List[Tuple[int, int, str]] = []   # (-épica, ordem, id)
+
+    @property
+    def epic_avg(self) -> int:
+        return self.epic_sum // self.count if self.count else 0
+
+    def legend_ids(self, limit: Optional[int] = None) -> List[str]:
+        ranked = self._ranked if limit is None else self._ranked[:limit]
+        return [legend_id for _, _, legend_id in ranked]
+
+
+class LegendIndex:
+    def __init__(self):
+        self.by_protagonist: Dict[str, ProtagonistStats] = {}
+        self.by_zone: Dict[int, List[str]] = {}
+        self.by_category: Dict[str, List[str]] = {}
+        self.epic = Leaderboard()
+        self.spread = Leaderboard()
+
+        self.total_spread = 0
+        self.oldest: Optional[str] = None
+        self._oldest_ts = float("inf")
+        self._indexed: Dict[str, str] = {}   # id -> protagonista (casefold)
+
+    def __len__(self) -> int:
+        return len(self._indexed)
+
+    def add(self, legend):
+        if legend.id in self._indexed:
+            return
+        key = legend.protagonist.casefold()
+        self._indexed[legend.id] = key
+
+        stats = self.by_protagonist.get(key)
+        if stats is None:
+            stats = self.by_protagonist[key] = ProtagonistStats(legend.protagonist)
+        stats.count += 1
+        stats.epic_sum += legend.epic_score
+        stats.spread_sum += legend.spread_count
+        stats.categories[legend.category] = stats.categories.get(legend.category, 0) + 1
+        insort(stats._ranked, (-legend.epic_score, len(self._indexed), legend.id))
+
+        if legend.zone_modifier is not None:
+            self.by_zone.setdefault(legend.zone_modifier, []).append(legend.id)
+        self.by_category.setdefault(legend.category, []).append(legend.id)
+
+        self.epic.update(legend.id, legend.epic_score)
+        self.spread.update(legend.id, legend.spread_count)
+        self.total_spread += legend.spread_count
+        if legend.timestamp < self._oldest_ts:
+            self._oldest_ts = legend.timestamp
+            self.oldest = legend.id
+
+    def told(self, legend, times: int = 1):
+        """A lenda foi contada `times` vezes (spread_count já atualizado)."""
+        self.spread.update(legend.id, legend.spread_count)
+        self.total_spread += times
+        key = self._indexed.get(legend.id)
+        if key is not None:
+            self.by_protagonist[key].spread_sum += times
+
+    def protagonist(self, name: str) -> Optional[ProtagonistStats]:
+        return self.by_protagonist.get(name.casefold())
+
+    def category_counts(self) -> Dict[str, int]:
+        return {category: len(ids) for category, ids in self.by_category.items()}
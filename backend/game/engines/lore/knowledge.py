@@ -0,0 +1,159 @@
+# backend/game/engines/lore/knowledge.py
+"""
+CONHECIMENTO DE LENDAS (Bitsets)
+
+Lendas e NPCs recebem índices densos. Quem sabe o quê fica em duas visões do
+mesmo conjunto de bits, ambas ints usados como bitset:
+- known[npc]: lendas que o NPC conhece (bit = índice da lenda);
+- believers[lenda]: NPCs que conhecem a lenda (bit = índice do NPC).
+Pertinência é um teste de bit, "o que a sala sabe" é um OR dos bitsets dos
+presentes e a contagem de crentes é um popcount: nada de listas de UIDs.
+
+NPC que sai do mundo é esquecido e seu índice volta para a fila de livres, então
+o tamanho acompanha os NPCs vivos e não o histórico. No disco cada bitset vai
+como hex ou, se for esparso, como lista de bits (o que for menor).
+"""
+from typing import Any, Dict, Iterator, List, Optional, Union
+
+
+def _bits(mask: int) -> Iterator[int]:
+    """Posições dos bits ligados, da menor para a maior."""
+    while mask:
+        low = mask & -mask
+        yield low.bit_length() - 1
+        mask ^= low
+
+
+def encode_mask(mask: int) -> Union[str, List[int]]:
+    """Hex para bitsets densos, lista de posições para os esparsos."""
+    hex_len = (mask.bit_length() + 3) // 4
+    if mask.bit_count() * 5 < hex_len:
+        return list(_bits(mask))
+    return format(mask, "x")
+
+
+def decode_mask(data: Union[str, List[int]]) -> int:
+    if isinstance(data, str):
+        return int(data, 16) if data else 0
+    mask = 0
+    for bit in data:
+        mask |= 1 << bit
+    return mask
+
+
+class LegendKnowledge:
+    def __init__(self):
+        self.legend_ids: List[str] = []          # bit -> id da lenda
+        self.legend_bits: Dict[str, int] = {}    # id da lenda -> bit
+        self.believers: List[int] = []           # bit da lenda -> bitset de índices de NPC
+
+        self.npc_uids: List[Optional[str]] = []  # índice -> uid (None = livre)
+        self.npc_index: Dict[str, int] = {}      # uid -> índice
+        self.known: List[int] = []               # índice do NPC -> bitset de lendas
+        self._free: List[int] = []
+
+    def __len__(self) -> int:
+        """NPCs que conhecem ao menos uma lenda."""
+        return len(self.npc_index)
+
+    # ==========================================================================
+    # ÍNDICES
+    # ==========================================================================
+
+    def bit(self, legend_id: str) -> int:
+        bit = self.legend_bits.get(legend_id)
+        if bit is None:
+            bit = self.legend_bits[legend_id] = len(self.legend_ids)
+            self.legend_ids.append(legend_id)
+            self.believers.append(0)
+        return bit
+
+    def _npc_slot(self, npc_uid: str) -> int:
+        idx = self.npc_index.get(npc_uid)
+        if idx is None:
+            if self._free:
+                idx = self._free.pop()
+                self.npc_uids[idx] = npc_uid
+            else:
+                idx = len(self.npc_uids)
+                self.npc_uids.append(npc_uid)
+                self.known.append(0)
+            self.npc_index[npc_uid] = idx
+        return idx
+
+    # ==========================================================================
+    # CONSULTA
+    # ==========================================================================
+
+    def mask(self, npc_uid: str) -> int:
+        idx = self.npc_index.get(npc_uid)
+        return 0 if idx is None else self.known[idx]
+
+    def knows(self, npc_uid: str, legend_id: str) -> bool:
+        bit = self.legend_bits.get(legend_id)
+        return bit is not None and bool(self.mask(npc_uid) >> bit & 1)
+
+    def legends_in(self, mask: int) -> Iterator[str]:
+        """Ids das lendas de um bitset (ordem dos bits)."""
+        for bit in _bits(mask):
+            yield self.legend_ids[bit]
+
+    def legends_of(self, npc_uid: str) -> List[str]:
+        return list(self.legends_in(self.mask(npc_uid)))
+
+    def believer_count(self, legend_id: str) -> int:
+        bit = self.legend_bits.get(legend_id)
+        return 0 if bit is None else self.believers[bit].bit_count()
+
+    def believers_of(self, legend_id: str) -> Iterator[str]:
+        bit = self.legend_bits.get(legend_id)
+        if bit is not None:
+            for idx in _bits(self.believers[bit]):
+                yield self.npc_uids[idx]
+
+    # ==========================================================================
+    # MUTAÇÃO
+    # ==========================================================================
+
+    def learn(self, npc_uid: str, legend_id: str) -> bool:
+        """Marca a lenda como conhecida. Retorna False se já sabia."""
+        bit = self.bit(legend_id)
+        idx = self._npc_slot(npc_uid)
+        mask = self.known[idx]
+        if mask >> bit & 1:
+            return False
+        self.known[idx] = mask | (1 << bit)
+        self.believers[bit] |= 1 << idx
+        return True
+
+    def forget(self, npc_uid: str) -> bool:
+        """NPC saiu do mundo: tira seus bits dos crentes e libera o índice."""
+        idx = self.npc_index.pop(npc_uid, None)
+        if idx is None:
+            return False
+        clear = ~(1 << idx)
+        for bit in _bits(self.known[idx]):
+            self.believers[bit] &= clear
+        self.known[idx] = 0
+        self.npc_uids[idx] = None
+        self._free.append(idx)
+        return True
+
+    # ==========================================================================
+    # PERSISTÊNCIA
+    # ==========================================================================
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Só NPCs vivos, por uid: índices livres não vão para o disco."""
+        return {
+            "legends": list(self.legend_ids),
+            "npcs": {uid: encode_mask(self.known[idx]) for uid, idx in self.npc_index.items()},
+        }
+
+    def load_dict(self, data: Dict[str, Any]):
+        legend_ids = data.get("legends", [])
+        for legend_id in legend_ids:
+            self.bit(legend_id)
+        for uid, encoded in data.get("npcs", {}).items():
+            for bit in _bits(decode_mask(encoded)):
+                self.learn(uid, legend_ids[bit])
@@ -36,6 +36,16 @@ class CatalystSystem:
                     self.catalyst_templates[k] = MagicComponent(vnum=k, **v)
         except Exception as e: logger.error(f"Erro Loading Catalysts: {e}")
 
+    # --- BOLSA DE REAGENTES ---
+
+    def give_catalyst(self, player_id, catalyst_id: str, amount: int = 1):
+        """Adiciona reagentes à bolsa do jogador (loot, recompensas)."""
+        bag = self.player_catalysts.setdefault(player_id, {})
+        bag[catalyst_id] = bag.get(catalyst_id, 0) + amount
+
+    def get_player_catalysts(self, player_id) -> Dict[str, int]:
+        return self.player_catalysts.get(player_id, {})
+
     # --- GESTÃO DE SESSÃO (INTERATIVA) ---
 
     def start_research_session(self, player) -> str:
@@ -144,11 +154,12 @@ class CatalystSystem:
         volatility = 1.0 - stability
         
         # Chance de Explosão
-        if random.random() < (volatility * 0.4):
+        rng = self.magic_manager.world.rng.stream("research")
+        if rng.random() < (volatility * 0.4):
             return "💥 **FALHA CATASTRÓFICA!** A mistura instável detonou o laboratório. Reagentes perdidos."
 
         spell_type = self._determine_type(elements, catalysts)
-        spell = self._generate_spell(player.name, elements, catalysts, spell_type, volatility)
+        spell = self._generate_spell(player.name, elements, catalysts, spell_type, volatility, rng)
         
         self.magic_manager.register_dynamic_spell(spell)
         
@@ -179,10 +190,10 @@ class CatalystSystem:
         if is_enchant: return SpellType.ENCHANTMENT
         return SpellType.OFFENSIVE
 
-    def _generate_spell(self, creator, elements, catalysts, s_type, volatility):
+    def _generate_spell(self, creator, elements, catalysts, s_type, volatility, rng=random):
         tier = len(elements)
         prim = Element(elements[0])
-        vnum = int(time.time()) + random.randint(1, 1000)
+        vnum = int(time.time()) + rng.randint(1, 1000)
         power = int(20 * tier * (1.0 + volatility))
         
         name = f"{creator}'s {prim.value.title()} {s_type.value.title()}"
@@ -57,6 +57,9 @@ class MagicManager:
         
         dmg = spell.base_power
         target.current_hp -= dmg
+        # Ódio: o alvo lembra do conjurador pelo handle tipado
+        if caster.handle is not None:
+            target.aggro_list[caster.handle] = target.aggro_list.get(caster.handle, 0) + dmg
         msg = f"🔥 **{caster.name}** lança {spell.name} em {target.name} causando **{dmg}** dano!"
         
         if target.current_hp <= 0:
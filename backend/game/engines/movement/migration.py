@@ -0,0 +1,174 @@
+# backend/game/engines/movement/migration.py
+"""
+MIGRAÇÃO DE NPCs (Movimento em Lote pelo Grafo de Salas)
+
+NPCs vagam pelas saídas das salas conforme as preferências da espécie:
+- SENTINEL nunca sai do lugar; STAY_ZONE não cruza a fronteira da zona.
+- Pressão populacional: salas lotadas empurram, salas vazias atraem.
+- Presas (TIMID) evitam salas com predadores; predadores seguem as presas.
+- Clima: flags de clima (ARCTIC, DESERT...) puxam para zonas daquele clima;
+  sem flag, a espécie evita trocar de clima.
+- NPC ocupado (em combate: a sessão é por sala) não vaga.
+
+Cada passada processa no máximo MIGRATION_BATCH NPCs (cursor round-robin) e
+aplica todos os movimentos de uma vez via WorldManager.move_npcs: ocupação e
+índices são atualizados uma vez por sala tocada, não uma vez por NPC.
+"""
+import logging
+from typing import Callable, Dict, List, Optional, Tuple
+
+from backend.game.engines.time.climate import CLIMATE_TYPES, CLIMATE_TEMPERATE
+from backend.game.utils.vnum import VNum
+
+logger = logging.getLogger(__name__)
+
+# Passadas (segundos reais) e NPCs avaliados por passada
+MIGRATION_INTERVAL = 5.0
+MIGRATION_BATCH = 2000
+
+# Chance base de um NPC considerar sair da sala numa passada
+WANDER_CHANCE = 0.15
+
+# Pesos das preferências
+STAY_WEIGHT = 1.0              # Peso de ficar (sozinho na sala)
+CROWD_PRESSURE = 0.25          # Cada NPC a mais na sala divide o peso do destino
+PREDATOR_AVOIDANCE = 0.1       # Presa entrando em sala com predador
+PREY_ATTRACTION = 3.0          # Predador entrando em sala com presa
+CLIMATE_PREFERRED = 2.0        # Destino no clima preferido
+CLIMATE_FOREIGN = 0.2          # Destino em clima diferente do atual (sem preferência)
+
+
+class SpeciesProfile:
+    """Preferências de movimento derivadas das flags (cache por template)."""
+    __slots__ = ("sentinel", "stay_zone", "predator", "timid", "climate")
+
+    def __init__(self, npc, is_predator: bool):
+        flags = {f.upper() for f in npc.flags}
+        self.sentinel = "SENTINEL" in flags
+        self.stay_zone = "STAY_ZONE" in flags
+        self.predator = is_predator
+        self.timid = "TIMID" in flags
+        self.climate = next((c for c in CLIMATE_TYPES if c in flags), None)
+
+
+class MigrationEngine:
+    def __init__(self, world_manager, time_engine=None,
+                 is_zone_blocked: Optional[Callable[[int], bool]] = None,
+                 is_busy: Optional[Callable[[object], bool]] = None):
+        self.world = world_manager
+        self.time = time_engine
+        # Zonas que não recebem NPCs concretos (ex: colapsadas pelo LOD)
+        self.is_zone_blocked = is_zone_blocked
+        # NPCs que não podem sair da sala agora (ex: CombatManager.is_fighting)
+        self.is_busy = is_busy
+        self.enabled = True
+
+        self._profiles: Dict[int, SpeciesProfile] = {}
+        self._exits: Dict[int, Tuple[int, ...]] = {}
+        self._queue: List[str] = []
+        self._cursor = 0
+
+        self.task = None
+        if time_engine is not None:
+            self.task = time_engine.schedule_every(MIGRATION_INTERVAL, self.run_pass, name="migration")
+
+    # ==========================================================================
+    # PASSADA
+    # ==========================================================================
+
+    def run_pass(self) -> int:
+        """Avalia o próximo lote de NPCs e aplica os movimentos. Retorna quantos se moveram."""
+        if not self.enabled or not self.world.active_npcs:
+            return 0
+
+        if self._cursor >= len(self._queue):
+            # Nova volta: fotografia dos NPCs vivos (ordem estável -> RNG reprodutível)
+            self._queue = list(self.world.active_npcs)
+            self._cursor = 0
+        batch = self._queue[self._cursor:self._cursor + MIGRATION_BATCH]
+        self._cursor += len(batch)
+
+        rng = self.world.rng.stream("migration")
+        moves: List[Tuple[str, int]] = []
+        for uid in batch:
+            if rng.random() >= WANDER_CHANCE:
+                continue
+            npc = self.world.active_npcs.get(uid)
+            if npc is None or (self.is_busy and self.is_busy(npc)):
+                continue
+            target = self._choose_destination(npc, rng)
+            if target is not None:
+                moves.append((uid, target))
+
+        return self.world.move_npcs(moves) if moves else 0
+
+    def _choose_destination(self, npc, rng) -> Optional[int]:
+        profile = self._profile(npc)
+        if profile.sentinel:
+            return None
+        exits = self._room_exits(npc.room_vnum)
+        if not exits:
+            return None
+
+        world = self.world
+        current_zone = VNum.parse(npc.room_vnum)[0]
+        current_climate = self._zone_climate(current_zone)
+
+        current_room = world.rooms[npc.room_vnum]
+        candidates = [None]
+        # Ficar também sofre a pressão: sala lotada empurra para fora
+        weights = [STAY_WEIGHT / (1.0 + CROWD_PRESSURE * (len(current_room.npcs_here) - 1))]
+        for target in exits:
+            target_zone = VNum.parse(target)[0]
+            if target_zone != current_zone:
+                if profile.stay_zone:
+                    continue
+                if self.is_zone_blocked and self.is_zone_blocked(target_zone):
+                    continue
+
+            weight = 1.0 / (1.0 + CROWD_PRESSURE * len(world.rooms[target].npcs_here))
+            if profile.timid and target in world.room_predators:
+                weight *= PREDATOR_AVOIDANCE
+            if profile.predator and target in world.room_prey:
+                weight *= PREY_ATTRACTION
+
+            target_climate = self._zone_climate(target_zone)
+            if profile.climate:
+                if target_climate == profile.climate:
+                    weight *= CLIMATE_PREFERRED
+            elif target_climate != current_climate:
+                weight *= CLIMATE_FOREIGN
+
+            candidates.append(target)
+            weights.append(weight)
+
+        if len(candidates) == 1:
+            return None
+        return rng.choices(candidates, weights=weights)[0]
+
+    # ==========================================================================
+    # CACHES
+    # ==========================================================================
+
+    def _profile(self, npc) -> SpeciesProfile:
+        profile = self._profiles.get(npc.template_vnum)
+        if profile is None:
+            profile = self._profiles[npc.template_vnum] = SpeciesProfile(npc, self.world.is_predator(npc))
+        return profile
+
+    def _room_exits(self, room_vnum: int) -> Tuple[int, ...]:
+        """Destinos transitáveis da sala (salas são estáticas: calculado uma vez)."""
+        exits = self._exits.get(room_vnum)
+        if exits is None:
+            room = self.world.rooms.get(room_vnum)
+            exits = tuple(
+                e.target_vnum for e in (room.exits.values() if room else ())
+                if not e.is_locked and e.target_vnum in self.world.rooms
+            )
+            self._exits[room_vnum] = exits
+        return exits
+
+    def _zone_climate(self, zone_id: int) -> str:
+        weather = getattr(self.world, "weather", None)
+        state = weather.get(zone_id) if weather else None
+        return state.climate if state else CLIMATE_TEMPERATE
@@ -11,6 +11,18 @@ MONTHS_PER_YEAR = 13
 DAYS_PER_MONTH = 28
 HOURS_PER_DAY = 24
 
+# Amanhecer e anoitecer (hora cheia em que a fase do dia muda)
+DAWN_HOUR = 6
+DUSK_HOUR = 18
+
+# Eventos discretos do calendário (emitidos pelo TimeEngine)
+CAL_HOUR = "hour"          # virou a hora
+CAL_DAWN = "dawn"          # amanheceu
+CAL_DUSK = "dusk"          # anoiteceu
+CAL_NEW_DAY = "new_day"    # virou o dia
+CAL_SEASON = "season"      # mudou a estação
+CALENDAR_EVENTS = (CAL_HOUR, CAL_DAWN, CAL_DUSK, CAL_NEW_DAY, CAL_SEASON)
+
 # Nomes dos 13 Meses
 MONTH_NAMES = [
     "Abertura dos Portões", "O Degelo", "Sementeira", "Vigília do Sol",
@@ -59,7 +71,46 @@ class GameDate:
     def season_name(self) -> str:
         # Ajusta para índice 0-12
         return MONTH_TO_SEASON.get(self.month - 1, "Desconhecido")
+
+    @property
+    def is_daytime(self) -> bool:
+        return DAWN_HOUR <= self.hour < DUSK_HOUR
         
     def __str__(self):
         m_name = MONTH_NAMES[self.month - 1] if 0 < self.month <= 13 else "???"
-        return f"{self.day} de {m_name}, Ano {self.year} ({self.hour:02d}:{self.minute:02d})"
\ No newline at end of file
+        return f"{self.day} de {m_name}, Ano {self.year} ({self.hour:02d}:{self.minute:02d})"
+
+
+def date_from_game_seconds(total_game_seconds: float, year_offset: int) -> GameDate:
+    """Traduz os segundos totais em uma Data (Ano, Mês, Dia)."""
+    total_days = int(total_game_seconds // GAME_SECONDS_PER_DAY)
+    current_second_in_day = int(total_game_seconds % GAME_SECONDS_PER_DAY)
+
+    years = total_days // (MONTHS_PER_YEAR * DAYS_PER_MONTH)
+    days_remaining = total_days % (MONTHS_PER_YEAR * DAYS_PER_MONTH)
+
+    return GameDate(
+        year=year_offset + years,
+        month=days_remaining // DAYS_PER_MONTH + 1,
+        day=days_remaining % DAYS_PER_MONTH + 1,
+        hour=current_second_in_day // 3600,
+        minute=(current_second_in_day % 3600) // 60,
+    )
+
+
+def calendar_transitions(previous: GameDate, current: GameDate) -> list:
+    """
+    Eventos entre duas leituras do relógio, em ordem. Saltos grandes (servidor
+    engasgado, volta do offline) viram UM evento de cada tipo, não um por hora perdida.
+    """
+    events = []
+    if (current.hour, current.day, current.month, current.year) != \
+            (previous.hour, previous.day, previous.month, previous.year):
+        events.append(CAL_HOUR)
+    if (current.day, current.month, current.year) != (previous.day, previous.month, previous.year):
+        events.append(CAL_NEW_DAY)
+    if current.is_daytime != previous.is_daytime:
+        events.append(CAL_DAWN if current.is_daytime else CAL_DUSK)
+    if current.season_name != previous.season_name:
+        events.append(CAL_SEASON)
+    return events
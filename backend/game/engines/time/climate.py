@@ -1,5 +1,8 @@
 # backend/game/engines/time/climate.py
-from typing import Dict
+from itertools import accumulate
+from typing import Dict, List, Tuple
+
+from .calendar import SEASONS
 
 # Tipos de Clima de Zona (Adicionar nas Flags da Zone/Room)
 CLIMATE_TEMPERATE = "TEMPERATE"  # Segue as estações normais
@@ -8,39 +11,92 @@ CLIMATE_DESERT = "DESERT"        # Varia entre quente e infernal
 CLIMATE_TROPICAL = "TROPICAL"    # Chuvoso ou Seco, sempre quente
 CLIMATE_UNDERGROUND = "UNDERGROUND" # Constante
 
+CLIMATE_TYPES = (CLIMATE_TEMPERATE, CLIMATE_ARCTIC, CLIMATE_DESERT, CLIMATE_TROPICAL, CLIMATE_UNDERGROUND)
+
+CLIMATE_NAMES = {
+    CLIMATE_TEMPERATE: "Temperado",
+    CLIMATE_ARCTIC: "Ártico",
+    CLIMATE_DESERT: "Desértico",
+    CLIMATE_TROPICAL: "Tropical",
+    CLIMATE_UNDERGROUND: "Subterrâneo",
+}
+
+# Estações quentes e frias (agrupamento usado pelos climas extremos)
+WARM_SEASONS = ("Ascensão", "Zênite", "Abrasamento")
+WET_SEASONS = ("Renascimento", "Declínio", "Penumbra")
+
+
+def _w(desc: str, temp: str, precip: str) -> Dict[str, str]:
+    return {"desc": desc, "temp": temp, "precip": precip}
+
+
+UNKNOWN_WEATHER = _w("O clima é indecifrável.", "neutral", "none")
+
+# Tempos possíveis por (estação, clima), com pesos. O primeiro é o típico.
+# Lista de (peso, tempo); tudo é pré-calculado em WEATHER_MATRIX no import.
+_TEMPERATE = {
+    "Renascimento": [(6, _w("Brisas frescas carregam o cheiro de terra molhada.", "cool", "rain")),
+                     (3, _w("Um sol tímido seca o orvalho da manhã.", "cool", "none")),
+                     (1, _w("Uma tempestade de primavera desaba sobre a região.", "cool", "storm"))],
+    "Ascensão":     [(6, _w("O sol aquece a terra agradavelmente.", "warm", "none")),
+                     (3, _w("Pancadas de chuva morna passam rápido.", "warm", "rain"))],
+    "Zênite":       [(6, _w("O calor faz o ar tremeluzir.", "hot", "none")),
+                     (2, _w("Trovões ecoam ao longe numa tarde abafada.", "hot", "storm"))],
+    "Abrasamento":  [(7, _w("A vegetação seca estala sob o sol impiedoso.", "hot", "none")),
+                     (1, _w("Um vento quente levanta poeira das trilhas.", "hot", "wind"))],
+    "Declínio":     [(5, _w("Folhas caem sob um céu cinzento.", "cool", "wind")),
+                     (3, _w("Uma garoa fina encharca tudo lentamente.", "cool", "rain"))],
+    "Penumbra":     [(5, _w("Chuvas frias anunciam o fim do ano.", "cold", "rain")),
+                     (3, _w("Uma névoa densa engole a paisagem.", "cold", "fog"))],
+    "Torpor":       [(5, _w("Geada cobre o solo endurecido.", "freezing", "snow")),
+                     (3, _w("O céu limpo não traz calor algum.", "freezing", "none"))],
+}
+
+_ARCTIC_WARM = [(6, _w("Um vento gélido sopra, mas o gelo derrete levemente.", "cold", "none")),
+                (2, _w("Neve úmida cai em flocos pesados.", "cold", "snow"))]
+_ARCTIC_COLD = [(6, _w("Uma nevasca eterna uiva, congelando a medula.", "freezing", "snow")),
+                (2, _w("O ar parado cristaliza a respiração.", "freezing", "none"))]
+
+_DESERT_WARM = [(6, _w("O sol infernal transforma a areia em brasa.", "scorching", "none")),
+                (2, _w("Uma tempestade de areia cega o horizonte.", "scorching", "sandstorm"))]
+_DESERT_COLD = [(6, _w("Dias quentes dão lugar a noites cortantes.", "hot", "none")),
+                (1, _w("Rajadas de vento arrastam dunas inteiras.", "hot", "sandstorm"))]
+
+_TROPICAL_WET = [(6, _w("Chuvas torrenciais castigam a mata fechada.", "hot", "rain")),
+                 (2, _w("O ar pesado de umidade gruda na pele.", "hot", "fog"))]
+_TROPICAL_DRY = [(6, _w("Um calor úmido e sol forte dominam o dia.", "hot", "none")),
+                 (2, _w("Um aguaceiro de fim de tarde passa rápido.", "hot", "rain"))]
+
+_UNDERGROUND = [(1, _w("O ar é estagnado e a temperatura constante.", "neutral", "none"))]
+
+
+def _options(season: str, climate_type: str) -> List[Tuple[int, Dict[str, str]]]:
+    if climate_type == CLIMATE_UNDERGROUND:
+        return _UNDERGROUND
+    if climate_type == CLIMATE_ARCTIC:
+        return _ARCTIC_WARM if season in WARM_SEASONS else _ARCTIC_COLD
+    if climate_type == CLIMATE_DESERT:
+        return _DESERT_WARM if season in WARM_SEASONS else _DESERT_COLD
+    if climate_type == CLIMATE_TROPICAL:
+        return _TROPICAL_WET if season in WET_SEASONS else _TROPICAL_DRY
+    return _TEMPERATE.get(season, _TEMPERATE["Renascimento"])
+
+
+# Matriz Estação x Clima: (tempos, pesos acumulados) prontos para rng.choices
+WEATHER_MATRIX: Dict[Tuple[str, str], Tuple[Tuple[Dict[str, str], ...], Tuple[int, ...]]] = {
+    (season, climate_type): (
+        tuple(weather for _, weather in _options(season, climate_type)),
+        tuple(accumulate(weight for weight, _ in _options(season, climate_type))),
+    )
+    for season in SEASONS
+    for climate_type in CLIMATE_TYPES
+}
+
+
 def get_zone_weather(season: str, climate_type: str) -> Dict[str, str]:
     """
-    Retorna o estado do tempo baseado na matriz Estação x Clima.
-    Retorna dict com descrição e flags de efeito.
+    Retorna o tempo típico da matriz Estação x Clima (consulta O(1)).
+    Retorna dict com descrição e flags de efeito (compartilhado: não modifique).
     """
-    
-    # 1. Zonas Subterrâneas (Ignoram o sol)
-    if climate_type == CLIMATE_UNDERGROUND:
-        return {
-            "desc": "O ar é estagnado e a temperatura constante.",
-            "temp": "neutral",
-            "precip": "none"
-        }
-
-    # 2. Zonas Árticas (O 'Verão' é apenas menos mortal)
-    if climate_type == CLIMATE_ARCTIC:
-        if season in ["Zênite", "Abrasamento"]:
-            return {"desc": "Um vento gélido sopra, mas o gelo derrete levemente.", "temp": "cold", "precip": "none"}
-        else:
-            return {"desc": "Uma nevasca eterna uiva, congelando a medula.", "temp": "freezing", "precip": "snow"}
-
-    # 3. Zonas Temperadas (Padrão)
-    if climate_type == CLIMATE_TEMPERATE:
-        mapping = {
-            "Renascimento": {"desc": "Brisas frescas carregam o cheiro de terra molhada.", "temp": "cool", "precip": "rain"},
-            "Ascensão":     {"desc": "O sol aquece a terra agradavelmente.", "temp": "warm", "precip": "none"},
-            "Zênite":       {"desc": "O calor faz o ar tremeluzir.", "temp": "hot", "precip": "none"},
-            "Abrasamento":  {"desc": "A vegetação seca estala sob o sol impiedoso.", "temp": "hot", "precip": "none"},
-            "Declínio":     {"desc": "Folhas caem sob um céu cinzento.", "temp": "cool", "precip": "wind"},
-            "Penumbra":     {"desc": "Chuvas frias anunciam o fim do ano.", "temp": "cold", "precip": "rain"},
-            "Torpor":       {"desc": "Geada cobre o solo endurecido.", "temp": "freezing", "precip": "snow"}
-        }
-        return mapping.get(season, mapping["Renascimento"])
-
-    # Fallback
-    return {"desc": "O clima é indecifrável.", "temp": "neutral", "precip": "none"}
\ No newline at end of file
+    entry = WEATHER_MATRIX.get((season, climate_type))
+    return entry[0][0] if entry else UNKNOWN_WEATHER
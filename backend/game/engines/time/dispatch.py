@@ -0,0 +1,150 @@
+# backend/game/engines/time/dispatch.py
+"""
+DESPACHO CONCORRENTE DE INSCRITOS
+
+Os inscritos de um tick (combate, global) rodam em paralelo dentro de um
+asyncio.TaskGroup, cada um com seu próprio prazo. Um inscrito lento não atrasa
+os demais:
+- Prazo estourado: o tick para de esperar por ele (ou o cancela, se pedido).
+- skip_if_running: enquanto a execução anterior não terminar, os ticks
+  seguintes pulam esse inscrito em vez de empilhar execuções.
+- executor="thread"/"process": funções síncronas pesadas em CPU saem do loop.
+  No modo "process" o callback e os argumentos precisam ser serializáveis
+  (funções de módulo) e efeitos colaterais no processo filho não voltam.
+"""
+import asyncio
+import functools
+import inspect
+import logging
+import time
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Callable, List, Optional
+
+from backend.game.engines.time.metrics import TickMetrics
+
+logger = logging.getLogger(__name__)
+
+EXECUTOR_THREAD = "thread"
+EXECUTOR_PROCESS = "process"
+
+
+class Subscription:
+    __slots__ = ("callback", "group", "deadline", "skip_if_running", "executor",
+                 "cancel_on_deadline", "in_flight")
+
+    def __init__(self, callback: Callable, group: str, deadline: float,
+                 skip_if_running: bool = True, executor: Optional[str] = None,
+                 cancel_on_deadline: bool = False):
+        if executor and inspect.iscoroutinefunction(callback):
+            raise ValueError("Inscritos assíncronos já rodam no loop; executor é só para funções síncronas.")
+        if executor not in (None, EXECUTOR_THREAD, EXECUTOR_PROCESS):
+            raise ValueError(f"Executor desconhecido: {executor}")
+        self.callback = callback
+        self.group = group
+        self.deadline = deadline
+        self.skip_if_running = skip_if_running
+        self.executor = executor
+        self.cancel_on_deadline = cancel_on_deadline
+        self.in_flight: Optional[asyncio.Future] = None
+
+    @property
+    def running(self) -> bool:
+        return self.in_flight is not None and not self.in_flight.done()
+
+
+class SubscriberGroup:
+    """Inscritos de um tipo de tick, despachados concorrentemente."""
+
+    def __init__(self, name: str, default_deadline: float, metrics: TickMetrics,
+                 executors: "ExecutorPool"):
+        self.name = name
+        self.default_deadline = default_deadline
+        self.metrics = metrics
+        self.executors = executors
+        self.subscriptions: List[Subscription] = []
+
+    def add(self, callback: Callable, deadline: Optional[float] = None, skip_if_running: bool = True,
+            executor: Optional[str] = None, cancel_on_deadline: bool = False) -> Subscription:
+        sub = Subscription(callback, self.name, deadline or self.default_deadline,
+                           skip_if_running, executor, cancel_on_deadline)
+        self.subscriptions.append(sub)
+        return sub
+
+    def remove(self, callback: Callable) -> bool:
+        before = len(self.subscriptions)
+        self.subscriptions = [s for s in self.subscriptions if s.callback != callback]
+        return len(self.subscriptions) != before
+
+    def __len__(self) -> int:
+        return len(self.subscriptions)
+
+    def __iter__(self):
+        return iter([s.callback for s in self.subscriptions])
+
+    async def dispatch(self, *args):
+        """Dispara todos os inscritos e espera cada um até o próprio prazo."""
+        async with asyncio.TaskGroup() as group:
+            for sub in self.subscriptions:
+                if sub.skip_if_running and sub.running:
+                    self.metrics.observe_skip(self.name, sub.callback)
+                    continue
+                sub.in_flight = asyncio.ensure_future(self._invoke(sub, args))
+                group.create_task(self._await_deadline(sub, sub.in_flight))
+
+    async def _await_deadline(self, sub: Subscription, future: asyncio.Future):
+        try:
+            await asyncio.wait_for(asyncio.shield(future), sub.deadline)
+        except TimeoutError:
+            self.metrics.observe_deadline_miss(self.name, sub.callback)
+            if sub.cancel_on_deadline:
+                future.cancel()
+                logger.warning(f"⏰ Inscrito {self.name} cancelado por prazo ({sub.deadline}s): {sub.callback}")
+
+    async def _invoke(self, sub: Subscription, args: tuple):
+        started = time.perf_counter()
+        failed = False
+        try:
+            if sub.executor:
+                loop = asyncio.get_running_loop()
+                call = functools.partial(sub.callback, *args)
+                await loop.run_in_executor(self.executors.get(sub.executor), call)
+            elif inspect.iscoroutinefunction(sub.callback):
+                await sub.callback(*args)
+            else:
+                result = sub.callback(*args)
+                if inspect.isawaitable(result):
+                    await result
+        except asyncio.CancelledError:
+            failed = True
+            raise
+        except Exception as e:
+            failed = True
+            logger.error(f"Erro {self.name.title()} Tick: {e}")
+        finally:
+            self.metrics.observe_subscriber(self.name, sub.callback, time.perf_counter() - started,
+                                            sub.deadline, failed)
+
+
+class ExecutorPool:
+    """Pools compartilhados, criados sob demanda."""
+
+    def __init__(self, max_threads: int = 4, max_processes: int = 2):
+        self.max_threads = max_threads
+        self.max_processes = max_processes
+        self._threads: Optional[ThreadPoolExecutor] = None
+        self._processes: Optional[ProcessPoolExecutor] = None
+
+    def get(self, kind: str) -> Executor:
+        if kind == EXECUTOR_PROCESS:
+            if self._processes is None:
+                self._processes = ProcessPoolExecutor(max_workers=self.max_processes)
+            return self._processes
+        if self._threads is None:
+            self._threads = ThreadPoolExecutor(max_workers=self.max_threads, thread_name_prefix="tick")
+        return self._threads
+
+    def shutdown(self):
+        for pool in (self._threads, self._processes):
+            if pool is not None:
+                pool.shutdown(wait=False, cancel_futures=True)
+        self._threads = self._processes = None
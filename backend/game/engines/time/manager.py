@@ -1,16 +1,32 @@
 # backend/game/engines/time/manager.py
 import asyncio
+import inspect
 import logging
 import time
-import json
 from pathlib import Path
-from typing import Callable, List, Optional
-from .calendar import GameDate, GAME_SECONDS_PER_DAY, MONTHS_PER_YEAR, DAYS_PER_MONTH, TIME_MULTIPLIER
+from typing import Callable, Dict, List, Optional, Union
+from .calendar import (
+    GameDate, GAME_SECONDS_PER_DAY, MONTHS_PER_YEAR, DAYS_PER_MONTH, TIME_MULTIPLIER,
+    CAL_DAWN, CAL_DUSK, CAL_SEASON, CALENDAR_EVENTS, calendar_transitions, date_from_game_seconds,
+)
+from .scheduler import Scheduler, ScheduledTask
+from backend.config.server_config import STATE_COMPRESS
+from backend.game.utils.persistence import JsonStore
+from .dispatch import ExecutorPool, SubscriberGroup, Subscription
 
 logger = logging.getLogger(__name__)
 
 STATE_FILE = Path("data/gamestate.json")
 
+# Intervalos das tarefas embutidas (segundos reais)
+AUTOSAVE_INTERVAL = 300.0
+COMBAT_TICK_INTERVAL = 2.0
+GLOBAL_TICK_INTERVAL = 10.0
+LEGEND_SPREAD_INTERVAL = 1.0   # Difusão com orçamento por tick (lore/diffusion.py)
+
+# Resolução da data em cache (segundos de jogo): a GameDate tem precisão de minuto
+CALENDAR_TICK_GAME_SECONDS = 60.0
+
 class TimeEngine:
     """
     O Relógio do Mundo.
@@ -26,9 +42,27 @@ class TimeEngine:
         # Ano inicial padrão (se for o primeiro boot da história)
         self.game_year_offset = 1000 
         
-        self.combat_subscribers: List[Callable] = []
-        self.global_subscribers: List[Callable] = []
         self._running = False
+
+        # Arquivo do relógio (escrita atômica)
+        self.store = JsonStore(STATE_FILE, compress=STATE_COMPRESS)
+
+        # Tempo de jogo que passou com o servidor desligado (preenchido no load_state)
+        self.offline_game_seconds = 0.0
+        # Motores que avançam o mundo em forma fechada após o boot: callback(offline_game_seconds)
+        self.catch_up_handlers: List[Callable] = []
+
+        # Agendador único: motores registram tarefas em vez de manter loops
+        self.scheduler = Scheduler()
+
+        # Inscritos dos ticks fixos, despachados em paralelo com prazo individual
+        self.executors = ExecutorPool()
+        self.combat_subscribers = SubscriberGroup("combat", COMBAT_TICK_INTERVAL, self.metrics, self.executors)
+        self.global_subscribers = SubscriberGroup("global", GLOBAL_TICK_INTERVAL, self.metrics, self.executors)
+
+        # Data em cache e ouvintes dos eventos do calendário (hora, amanhecer...)
+        self.current_date: Optional[GameDate] = None
+        self.calendar_listeners: Dict[str, List[Callable]] = {event: [] for event in CALENDAR_EVENTS}
         
         # Referência ao Mundo (Para eventos de Grimório)
         self.world = world_manager
@@ -42,45 +76,52 @@ class TimeEngine:
         Recupera o tempo perdido.
         Calcula quanto tempo passou offline e avança o relógio.
         """
-        if not STATE_FILE.exists():
+        try:
+            data = self.store.load()
+        except Exception as e:
+            logger.error(f"TimeEngine: Erro ao carregar save: {e}")
+            self.base_game_seconds = 0
+            return
+
+        if data is None:
             logger.info("TimeEngine: Nenhum estado salvo. Iniciando no Ano 1000.")
             self.base_game_seconds = 0
             return
 
+        last_game_seconds = data.get("total_game_seconds", 0)
+        last_real_timestamp = data.get("real_timestamp", time.time())
+
+        # Quanto tempo o servidor ficou desligado?
+        offline_real_seconds = time.time() - last_real_timestamp
+
+        # Converte tempo offline em tempo de jogo
+        offline_game_seconds = offline_real_seconds * TIME_MULTIPLIER
+
+        # Define o novo ponto de partida
+        self.base_game_seconds = last_game_seconds + offline_game_seconds
+        self.offline_game_seconds = max(0.0, offline_game_seconds)
+
+        logger.info(f"TimeEngine: Estado carregado. O mundo avançou {offline_game_seconds:.2f}s (jogo) enquanto offline.")
+
+    def _state_snapshot(self) -> dict:
+        return {
+            "total_game_seconds": self._get_total_game_seconds(),
+            "real_timestamp": time.time(),
+            "last_date_string": str(self.get_current_date()) # Apenas para debug humano
+        }
+
+    def save_state(self):
+        """Congela o momento atual no disco (síncrono: desligamento)."""
         try:
-            with open(STATE_FILE, 'r') as f:
-                data = json.load(f)
-                
-            last_game_seconds = data.get("total_game_seconds", 0)
-            last_real_timestamp = data.get("real_timestamp", time.time())
-            
-            # Quanto tempo o servidor ficou desligado?
-            offline_real_seconds = time.time() - last_real_timestamp
-            
-            # Converte tempo offline em tempo de jogo
-            offline_game_seconds = offline_real_seconds * TIME_MULTIPLIER
-            
-            # Define o novo ponto de partida
-            self.base_game_seconds = last_game_seconds + offline_game_seconds
-            
-            logger.info(f"TimeEngine: Estado carregado. O mundo avançou {offline_game_seconds:.2f}s (jogo) enquanto offline.")
-            
+            self.store.save(self._state_snapshot())
+            logger.info("TimeEngine: Tempo salvo com sucesso.")
         except Exception as e:
-            logger.error(f"TimeEngine: Erro ao carregar save: {e}")
-            self.base_game_seconds = 0
+            logger.error(f"TimeEngine: Erro ao salvar estado: {e}")
 
-    def save_state(self):
-        """Congela o momento atual no disco."""
+    async def save_state_async(self):
+        """Autosave: grava numa thread de trabalho, sem travar o loop."""
         try:
-            data = {
-                "total_game_seconds": self._get_total_game_seconds(),
-                "real_timestamp": time.time(),
-                "last_date_string": str(self.get_current_date()) # Apenas para debug humano
-            }
-            
-            with open(STATE_FILE, 'w') as f:
-                json.dump(data, f, indent=2)
-                
+            await self.store.save_async(self._state_snapshot())
             logger.info("TimeEngine: Tempo salvo com sucesso.")
         except Exception as e:
             logger.error(f"TimeEngine: Erro ao salvar estado: {e}")
@@ -97,91 +138,166 @@ class TimeEngine:
         return self.base_game_seconds + game_delta
 
     def get_current_date(self) -> GameDate:
-        """Traduz os segundos totais em uma Data (Ano, Mês, Dia)."""
-        total_game_seconds = self._get_total_game_seconds()
-        
-        # Cálculos de calendário
-        total_days = int(total_game_seconds // GAME_SECONDS_PER_DAY)
-        current_second_in_day = int(total_game_seconds % GAME_SECONDS_PER_DAY)
-        
-        years = total_days // (MONTHS_PER_YEAR * DAYS_PER_MONTH)
-        days_remaining = total_days % (MONTHS_PER_YEAR * DAYS_PER_MONTH)
-        
-        months = days_remaining // DAYS_PER_MONTH
-        day_of_month = days_remaining % DAYS_PER_MONTH
-        
-        hour = current_second_in_day // 3600
-        minute = (current_second_in_day % 3600) // 60
-        
-        return GameDate(
-            year=self.game_year_offset + years,
-            month=months + 1,
-            day=day_of_month + 1,
-            hour=hour,
-            minute=minute
-        )
+        """
+        Data atual do jogo. Com o relógio rodando, devolve a data em cache
+        (atualizada a cada minuto de jogo pelo agendador); antes disso, calcula.
+        """
+        if self.current_date is not None:
+            return self.current_date
+        return date_from_game_seconds(self._get_total_game_seconds(), self.game_year_offset)
 
     async def start_loop(self):
-        """Inicia os loops."""
+        """Registra as tarefas embutidas e inicia o driver do agendador."""
         self.load_state() 
         self._running = True
-        
-        asyncio.create_task(self._auto_save_loop())
-        asyncio.create_task(self._combat_tick_loop())
-        asyncio.create_task(self._global_tick_loop())
-
-    async def _auto_save_loop(self):
-        while self._running:
-            await asyncio.sleep(300) # 5 minutos
-            self.save_state()
-
-    async def _combat_tick_loop(self):
-        while self._running:
-            start_time = time.time()
-            for callback in self.combat_subscribers:
-                try:
-                    if asyncio.iscoroutinefunction(callback):
-                        await callback()
-                    else:
-                        callback()
-                except Exception as e:
-                    logger.error(f"Erro Combat Tick: {e}")
-            
-            elapsed = time.time() - start_time
-            await asyncio.sleep(max(0, 2.0 - elapsed))
-
-    async def _global_tick_loop(self):
+        await self._run_catch_up()
+
+        self.schedule_every(AUTOSAVE_INTERVAL, self.save_state_async, name="autosave")
+        self.schedule_every(COMBAT_TICK_INTERVAL, self._combat_tick, name="combat_tick")
+        self.schedule_every(GLOBAL_TICK_INTERVAL, self._global_tick, name="global_tick")
+        self.schedule_every(LEGEND_SPREAD_INTERVAL, self._spread_legends, name="legend_spread")
+        self.schedule_every(CALENDAR_TICK_GAME_SECONDS, self._advance_calendar,
+                            game_time=True, name="calendar")
+
+        # Primeira leitura: ouvintes de dia/noite e de estação recebem o estado atual
+        await self._advance_calendar()
+
+        asyncio.create_task(self.scheduler.run())
+
+    def stop(self):
+        self._running = False
+        self.scheduler.stop()
+        self.executors.shutdown()
+
+    # ==========================================================================
+    # AGENDAMENTO (API para os motores)
+    # ==========================================================================
+
+    def schedule_every(self, interval: float, callback: Callable, *args,
+                       game_time: bool = False, jitter: float = 0.0, stagger: bool = False,
+                       name: Optional[str] = None) -> ScheduledTask:
+        """
+        Repete `callback` a cada `interval` segundos.
+        game_time=True interpreta o intervalo (e o jitter) em segundos de jogo.
+        """
+        if game_time:
+            interval /= TIME_MULTIPLIER
+            jitter /= TIME_MULTIPLIER
+        return self.scheduler.schedule_every(interval, callback, *args,
+                                             jitter=jitter, stagger=stagger, name=name)
+
+    def schedule_in(self, delay: float, callback: Callable, *args,
+                    game_time: bool = False, name: Optional[str] = None) -> ScheduledTask:
+        """Executa uma vez daqui a `delay` segundos (reais ou de jogo)."""
+        if game_time:
+            delay /= TIME_MULTIPLIER
+        return self.scheduler.schedule(delay, callback, *args, name=name)
+
+    def schedule_at(self, game_time: Union[float, GameDate], callback: Callable, *args,
+                    name: Optional[str] = None) -> ScheduledTask:
+        """Executa quando o relógio do jogo atingir `game_time` (segundos totais ou GameDate)."""
+        if isinstance(game_time, GameDate):
+            game_time = self.date_to_game_seconds(game_time)
+        real_delay = (game_time - self._get_total_game_seconds()) / TIME_MULTIPLIER
+        return self.scheduler.schedule(max(0.0, real_delay), callback, *args, name=name)
+
+    def cancel(self, task: Optional[ScheduledTask]) -> bool:
+        return self.scheduler.cancel(task)
+
+    def date_to_game_seconds(self, date: GameDate) -> float:
+        days = ((date.year - self.game_year_offset) * MONTHS_PER_YEAR * DAYS_PER_MONTH
+                + (date.month - 1) * DAYS_PER_MONTH + (date.day - 1))
+        return days * GAME_SECONDS_PER_DAY + date.hour * 3600 + date.minute * 60
+
+    # ==========================================================================
+    # TAREFAS EMBUTIDAS
+    # ==========================================================================
+
+    async def _combat_tick(self):
+        await self.combat_subscribers.dispatch()
+
+    async def _global_tick(self):
         """O batimento cardíaco lento do mundo (10s)."""
-        # Contador para eventos menos frequentes (ex: lendas a cada 3 ticks = 30s)
-        tick_count = 0
-        
-        while self._running:
-            start_time = time.time()
-            current_date = self.get_current_date()
-            
-            # Callbacks padrão
-            for callback in self.global_subscribers:
-                try:
-                    if asyncio.iscoroutinefunction(callback):
-                        await callback(current_date)
-                    else:
-                        callback(current_date)
-                except Exception as e:
-                    logger.error(f"Erro Global Tick: {e}")
-            
-            # NOVO: Propagação de Lendas (A cada 3 ticks / ~30s)
-            tick_count += 1
-            if tick_count >= 3:
-                tick_count = 0
-                if self.world and hasattr(self.world, 'grimoire') and self.world.grimoire:
-                    # Executa em background para não travar o loop
-                    asyncio.create_task(self.world.grimoire.spread_legend_naturally())
-
-            elapsed = time.time() - start_time
-            await asyncio.sleep(max(0, 10.0 - elapsed))
-            
-    def register_combat_subscriber(self, callback):
-        self.combat_subscribers.append(callback)
-
-    def register_global_subscriber(self, callback):
-        self.global_subscribers.append(callback)
\ No newline at end of file
+        await self.global_subscribers.dispatch(self.get_current_date())
+
+    def on_catch_up(self, callback: Callable):
+        """Inscreve callback(offline_game_seconds), chamado uma vez no boot após o load_state."""
+        self.catch_up_handlers.append(callback)
+
+    async def _run_catch_up(self):
+        """Avança o mundo pelo tempo offline antes de o agendador começar a rodar."""
+        if self.offline_game_seconds <= 0 or not self.catch_up_handlers:
+            return
+        started = time.perf_counter()
+        for callback in self.catch_up_handlers:
+            try:
+                result = callback(self.offline_game_seconds)
+                if inspect.isawaitable(result):
+                    await result
+            except Exception as e:
+                logger.error(f"TimeEngine: Erro na recuperação offline ({callback}): {e}")
+        logger.info(f"⏩ TimeEngine: Mundo recuperado de {self.offline_game_seconds / GAME_SECONDS_PER_DAY:.1f} "
+                    f"dias offline em {(time.perf_counter() - started) * 1000:.0f}ms.")
+
+    async def _advance_calendar(self):
+        """Atualiza a data em cache e emite as transições desde a última leitura."""
+        previous = self.current_date
+        self.current_date = date_from_game_seconds(self._get_total_game_seconds(), self.game_year_offset)
+
+        if previous is None:
+            events = [CAL_DAWN if self.current_date.is_daytime else CAL_DUSK, CAL_SEASON]
+        else:
+            events = calendar_transitions(previous, self.current_date)
+
+        for event in events:
+            await self._emit_calendar(event, self.current_date)
+
+    async def _emit_calendar(self, event: str, date: GameDate):
+        for callback in list(self.calendar_listeners[event]):
+            try:
+                result = callback(date)
+                if inspect.isawaitable(result):
+                    await result
+            except Exception as e:
+                logger.error(f"Erro no ouvinte do calendário '{event}': {e}")
+
+    def on_calendar(self, event: str, callback: Callable):
+        """
+        Inscreve callback(date) num evento do calendário (CAL_HOUR, CAL_DAWN,
+        CAL_DUSK, CAL_NEW_DAY, CAL_SEASON). Aceita funções síncronas ou async.
+        """
+        if event not in self.calendar_listeners:
+            raise ValueError(f"Evento de calendário desconhecido: {event}")
+        self.calendar_listeners[event].append(callback)
+
+    def off_calendar(self, event: str, callback: Callable) -> bool:
+        listeners = self.calendar_listeners.get(event, [])
+        if callback in listeners:
+            listeners.remove(callback)
+            return True
+        return False
+
+    @property
+    def metrics(self):
+        return self.scheduler.metrics
+
+    async def _spread_legends(self):
+        """Propagação de Lendas (a cada segundo). Roda em sua própria Task do agendador."""
+        if self.world and hasattr(self.world, 'grimoire') and self.world.grimoire:
+            await self.world.grimoire.spread_legend_naturally()
+
+    # Inscrição nos ticks fixos (combate: 2s, global: 10s)
+    def register_combat_subscriber(self, callback, deadline: Optional[float] = None,
+                                   skip_if_running: bool = True, executor: Optional[str] = None,
+                                   cancel_on_deadline: bool = False) -> Subscription:
+        return self.combat_subscribers.add(callback, deadline, skip_if_running, executor, cancel_on_deadline)
+
+    def register_global_subscriber(self, callback, deadline: Optional[float] = None,
+                                   skip_if_running: bool = True, executor: Optional[str] = None,
+                                   cancel_on_deadline: bool = False) -> Subscription:
+        """
+        deadline: quanto o tick espera por este inscrito (padrão: o intervalo do tick).
+        skip_if_running: pula o tick se a execução anterior ainda não acabou.
+        executor: "thread" ou "process" para funções síncronas pesadas em CPU.
+        """
+        return self.global_subscribers.add(callback, deadline, skip_if_running, executor, cancel_on_deadline)
\ No newline at end of file
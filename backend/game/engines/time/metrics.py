@@ -0,0 +1,215 @@
+# backend/game/engines/time/metrics.py
+"""
+TELEMETRIA DO RELÓGIO (Orçamento de Tick)
+
+Mede quanto cada tick do agendador e cada tarefa/inscrito custam, quantas
+vezes estouraram o orçamento, o atraso (lag) em relação ao cronograma ideal
+e qual foi o callback mais lento (com o local onde foi definido).
+Tudo em memória, com histogramas de baldes fixos: observar é O(1).
+"""
+import bisect
+import inspect
+import time
+from typing import Any, Callable, Dict, List, Optional
+
+# Limites superiores dos baldes, em milissegundos (o último é +inf)
+BUCKETS_MS = (0.1, 0.25, 0.5, 1, 2.5, 5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000)
+
+# Quantos callbacks lentos guardar no ranking
+SLOWEST_KEEP = 10
+
+
+class LatencyHistogram:
+    """Histograma de latência com baldes logarítmicos fixos."""
+    __slots__ = ("counts", "count", "total_ms", "max_ms")
+
+    def __init__(self):
+        self.counts = [0] * (len(BUCKETS_MS) + 1)
+        self.count = 0
+        self.total_ms = 0.0
+        self.max_ms = 0.0
+
+    def observe(self, seconds: float):
+        ms = seconds * 1000.0
+        self.counts[bisect.bisect_left(BUCKETS_MS, ms)] += 1
+        self.count += 1
+        self.total_ms += ms
+        if ms > self.max_ms:
+            self.max_ms = ms
+
+    def percentile(self, pct: float) -> float:
+        """Aproximação pelo limite superior do balde (ms)."""
+        if not self.count:
+            return 0.0
+        target = self.count * pct / 100.0
+        seen = 0
+        for idx, n in enumerate(self.counts):
+            seen += n
+            if seen >= target:
+                return min(BUCKETS_MS[idx], round(self.max_ms, 3)) if idx < len(BUCKETS_MS) else self.max_ms
+        return self.max_ms
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "count": self.count,
+            "avg_ms": round(self.total_ms / self.count, 3) if self.count else 0.0,
+            "p50_ms": self.percentile(50),
+            "p95_ms": self.percentile(95),
+            "p99_ms": self.percentile(99),
+            "max_ms": round(self.max_ms, 3),
+            "buckets": {
+                (f"<={b}" if i < len(BUCKETS_MS) else f">{BUCKETS_MS[-1]}"): n
+                for i, (b, n) in enumerate(zip(BUCKETS_MS + (None,), self.counts)) if n
+            },
+        }
+
+
+class CallbackStats:
+    """Duração, estouros de orçamento e lag de uma tarefa ou inscrito."""
+    __slots__ = ("name", "duration", "lag", "overruns", "errors", "skips", "deadline_misses", "origin")
+
+    def __init__(self, name: str, origin: str = ""):
+        self.name = name
+        self.duration = LatencyHistogram()
+        self.lag = LatencyHistogram()
+        self.overruns = 0
+        self.errors = 0
+        self.skips = 0              # tick pulado: execução anterior ainda rodando
+        self.deadline_misses = 0    # o tick parou de esperar (prazo estourado)
+        self.origin = origin
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "origin": self.origin,
+            "duration": self.duration.to_dict(),
+            "lag": self.lag.to_dict(),
+            "overruns": self.overruns,
+            "errors": self.errors,
+            "skips": self.skips,
+            "deadline_misses": self.deadline_misses,
+        }
+
+
+class TickMetrics:
+    """Agregador usado pelo Scheduler (tarefas) e pelo TimeEngine (inscritos)."""
+
+    def __init__(self):
+        self.started_at = time.time()
+        self.tick = LatencyHistogram()        # custo de cada passada do driver
+        self.tick_overruns = 0                # passadas mais longas que um tick
+        self.lag = LatencyHistogram()         # atraso de cada disparo vs. o ideal
+        self.max_lag_ms = 0.0
+        self.tasks: Dict[str, CallbackStats] = {}
+        self.subscribers: Dict[str, CallbackStats] = {}
+        self.slowest: List[Dict[str, Any]] = []
+
+    # ==========================================================================
+    # OBSERVAÇÃO
+    # ==========================================================================
+
+    def observe_tick(self, seconds: float, budget: float):
+        self.tick.observe(seconds)
+        if seconds > budget:
+            self.tick_overruns += 1
+
+    def observe_task(self, name: str, callback: Callable, seconds: float, lag: float,
+                     budget: Optional[float] = None, failed: bool = False):
+        stats = self._stats(self.tasks, name, callback)
+        stats.duration.observe(seconds)
+        stats.lag.observe(max(0.0, lag))
+        self.lag.observe(max(0.0, lag))
+        self.max_lag_ms = max(self.max_lag_ms, lag * 1000.0)
+        self._account(stats, seconds, budget, failed)
+
+    def observe_subscriber(self, group: str, callback: Callable, seconds: float,
+                           budget: Optional[float] = None, failed: bool = False):
+        name = f"{group}:{callback_name(callback)}"
+        stats = self._stats(self.subscribers, name, callback)
+        stats.duration.observe(seconds)
+        self._account(stats, seconds, budget, failed)
+
+    def observe_skip(self, group: str, callback: Callable, task_name: Optional[str] = None):
+        stats = self._named_stats(group, callback, task_name)
+        stats.skips += 1
+
+    def observe_deadline_miss(self, group: str, callback: Callable):
+        stats = self._named_stats(group, callback)
+        stats.deadline_misses += 1
+
+    def _named_stats(self, group: str, callback: Callable, task_name: Optional[str] = None) -> CallbackStats:
+        if task_name is not None:
+            return self._stats(self.tasks, task_name, callback)
+        return self._stats(self.subscribers, f"{group}:{callback_name(callback)}", callback)
+
+    def _account(self, stats: CallbackStats, seconds: float, budget: Optional[float], failed: bool):
+        if failed:
+            stats.errors += 1
+        if budget is not None and seconds > budget:
+            stats.overruns += 1
+        self._rank_slowest(stats, seconds)
+
+    def _stats(self, table: Dict[str, CallbackStats], name: str, callback: Callable) -> CallbackStats:
+        stats = table.get(name)
+        if stats is None:
+            stats = table[name] = CallbackStats(name, callback_origin(callback))
+        return stats
+
+    def _rank_slowest(self, stats: CallbackStats, seconds: float):
+        ms = seconds * 1000.0
+        if len(self.slowest) >= SLOWEST_KEEP and ms <= self.slowest[-1]["ms"]:
+            return
+        self.slowest.append({"name": stats.name, "origin": stats.origin,
+                             "ms": round(ms, 3), "at": time.time()})
+        self.slowest.sort(key=lambda entry: entry["ms"], reverse=True)
+        del self.slowest[SLOWEST_KEEP:]
+
+    # ==========================================================================
+    # RELATÓRIOS
+    # ==========================================================================
+
+    def snapshot(self) -> Dict[str, Any]:
+        return {
+            "uptime_seconds": round(time.time() - self.started_at, 1),
+            "tick": self.tick.to_dict(),
+            "tick_overruns": self.tick_overruns,
+            "lag": self.lag.to_dict(),
+            "max_lag_ms": round(self.max_lag_ms, 3),
+            "tasks": {name: s.to_dict() for name, s in sorted(self.tasks.items())},
+            "subscribers": {name: s.to_dict() for name, s in sorted(self.subscribers.items())},
+            "slowest": list(self.slowest),
+        }
+
+    def format_report(self) -> str:
+        """Texto para o comando de administrador."""
+        lines = [
+            "⏱️ TELEMETRIA DO RELÓGIO",
+            f"Tick: p50 {self.tick.percentile(50)}ms | p99 {self.tick.percentile(99)}ms | "
+            f"máx {self.tick.max_ms:.1f}ms | estouros {self.tick_overruns}",
+            f"Lag: p50 {self.lag.percentile(50)}ms | p99 {self.lag.percentile(99)}ms | máx {self.max_lag_ms:.1f}ms",
+            "-" * 40,
+        ]
+        rows = list(self.tasks.values()) + list(self.subscribers.values())
+        rows.sort(key=lambda s: s.duration.max_ms, reverse=True)
+        for s in rows:
+            lines.append(
+                f"{s.name:<36} n={s.duration.count:<6} p95={s.duration.percentile(95):<6}ms "
+                f"máx={s.duration.max_ms:.1f}ms estouros={s.overruns} prazos={s.deadline_misses} "
+                f"pulos={s.skips} erros={s.errors}"
+            )
+        if self.slowest:
+            worst = self.slowest[0]
+            lines += ["-" * 40, f"🐢 Mais lento: {worst['name']} ({worst['ms']}ms) em {worst['origin']}"]
+        return "\n".join(lines)
+
+
+def callback_name(callback: Callable) -> str:
+    return getattr(callback, "__qualname__", None) or repr(callback)
+
+
+def callback_origin(callback: Callable) -> str:
+    """'arquivo:linha' onde o callback foi definido (para achar o culpado)."""
+    func = getattr(callback, "__func__", callback)
+    try:
+        return f"{inspect.getsourcefile(func)}:{inspect.getsourcelines(func)[1]}"
+    except (TypeError, OSError):
+        return getattr(func, "__module__", "") or ""
@@ -0,0 +1,208 @@
+# backend/game/engines/time/scheduler.py
+"""
+AGENDADOR DO MUNDO (Roda de Tempo Hierárquica)
+
+Substitui os loops `while` de cada motor por tarefas registradas numa única
+roda de tempo. Um único driver assíncrono acorda a cada TICK_SECONDS, avança
+a roda pelos ticks reais decorridos e dispara o que venceu. Agendar, cancelar
+e reagendar custam O(1), então dezenas de milhares de timers não pesam.
+
+Tarefas periódicas seguem o cronograma ideal (sem deriva); se o servidor
+engasgar, execuções perdidas são aglutinadas em uma só. Cada disparo vira uma
+asyncio.Task: uma tarefa lenta não segura o driver, e enquanto ela não termina
+os disparos seguintes da MESMA tarefa são pulados.
+"""
+import asyncio
+import inspect
+import logging
+import random
+import time
+from typing import Callable, Optional, Set
+
+from backend.game.utils.timing_wheel import HierarchicalTimingWheel, TimerHandle
+from backend.game.engines.time.metrics import TickMetrics, callback_name
+
+logger = logging.getLogger(__name__)
+
+# Resolução do agendador (segundos reais por tick da roda)
+TICK_SECONDS = 0.1
+
+
+class ScheduledTask:
+    """Handle público de uma tarefa agendada (única ou periódica)."""
+    __slots__ = ("name", "callback", "args", "interval_ticks", "jitter_ticks",
+                 "deadline", "timer", "cancelled", "runs", "in_flight")
+
+    def __init__(self, name: str, callback: Callable, args: tuple,
+                 interval_ticks: int = 0, jitter_ticks: int = 0):
+        self.name = name
+        self.callback = callback
+        self.args = args
+        self.interval_ticks = interval_ticks
+        self.jitter_ticks = jitter_ticks
+        # Prazo ideal (sem jitter): base do próximo agendamento periódico
+        self.deadline = 0
+        self.timer: Optional[TimerHandle] = None
+        self.cancelled = False
+        self.runs = 0
+        self.in_flight: Optional[asyncio.Task] = None
+
+    @property
+    def periodic(self) -> bool:
+        return self.interval_ticks > 0
+
+    def __repr__(self) -> str:
+        kind = f"a cada {self.interval_ticks * TICK_SECONDS:g}s" if self.periodic else "única"
+        return f"<ScheduledTask {self.name} ({kind})>"
+
+
+class Scheduler:
+    def __init__(self, tick_seconds: float = TICK_SECONDS, rng: Optional[random.Random] = None):
+        self.tick_seconds = tick_seconds
+        self.wheel = HierarchicalTimingWheel(slots_per_level=64, levels=4)
+        self.rng = rng or random.Random()
+        self._start_monotonic: Optional[float] = None
+        self._running = False
+        # Tick real que o driver está alcançando (coalescência após engasgos)
+        self._catchup_tick = 0
+        self.metrics = TickMetrics()
+        # Execuções em andamento (mantém referência forte às asyncio.Task)
+        self._runs: Set[asyncio.Task] = set()
+
+    # ==========================================================================
+    # API
+    # ==========================================================================
+
+    def to_ticks(self, seconds: float) -> int:
+        return max(0, int(round(seconds / self.tick_seconds)))
+
+    @property
+    def now_ticks(self) -> int:
+        return self.wheel.current_tick
+
+    def schedule(self, delay: float, callback: Callable, *args, name: Optional[str] = None) -> ScheduledTask:
+        """Executa uma vez daqui a `delay` segundos reais."""
+        task = ScheduledTask(name or callback_name(callback), callback, args)
+        self._arm(task, self.now_ticks + max(1, self.to_ticks(delay)))
+        return task
+
+    def schedule_every(self, interval: float, callback: Callable, *args,
+                       jitter: float = 0.0, stagger: bool = False,
+                       first_delay: Optional[float] = None,
+                       name: Optional[str] = None) -> ScheduledTask:
+        """
+        Executa a cada `interval` segundos reais.
+        jitter: desvio aleatório (±segundos) em cada disparo, sem acumular deriva.
+        stagger: primeira execução numa fase aleatória do intervalo, para espalhar
+                 muitas tarefas de mesmo período (ex: uma por zona).
+        """
+        interval_ticks = max(1, self.to_ticks(interval))
+        task = ScheduledTask(name or callback_name(callback), callback, args,
+                             interval_ticks=interval_ticks, jitter_ticks=self.to_ticks(jitter))
+        if first_delay is not None:
+            first = max(1, self.to_ticks(first_delay))
+        elif stagger:
+            first = self.rng.randint(1, interval_ticks)
+        else:
+            first = interval_ticks
+        self._arm(task, self.now_ticks + first)
+        return task
+
+    def cancel(self, task: Optional[ScheduledTask]) -> bool:
+        if task is None or task.cancelled:
+            return False
+        task.cancelled = True
+        self.wheel.cancel(task.timer)
+        task.timer = None
+        return True
+
+    def __len__(self) -> int:
+        return len(self.wheel)
+
+    # ==========================================================================
+    # DRIVER
+    # ==========================================================================
+
+    async def run(self):
+        """Loop único: avança a roda conforme o relógio real e dispara o que venceu."""
+        self._running = True
+        self._start_monotonic = time.monotonic() - self.now_ticks * self.tick_seconds
+        while self._running:
+            target = int((time.monotonic() - self._start_monotonic) / self.tick_seconds)
+            if target > self.now_ticks:
+                started = time.perf_counter()
+                await self.advance(target - self.now_ticks)
+                self.metrics.observe_tick(time.perf_counter() - started, self.tick_seconds)
+
+            next_boundary = self._start_monotonic + (self.now_ticks + 1) * self.tick_seconds
+            await asyncio.sleep(max(0.0, next_boundary - time.monotonic()))
+
+    def stop(self):
+        self._running = False
+
+    async def advance(self, ticks: int = 1) -> int:
+        """Avança a roda tick a tick, disparando as tarefas vencidas. Retorna quantas dispararam."""
+        ran = 0
+        self._catchup_tick = self.now_ticks + max(0, int(ticks))
+        for _ in range(max(0, int(ticks))):
+            for timer in self.wheel.advance(1):
+                task = timer.args[0]
+                if task.cancelled:
+                    continue
+                task.timer = None
+                if task.periodic:
+                    self._rearm(task)
+                if task.in_flight is not None and not task.in_flight.done():
+                    self.metrics.observe_skip("scheduler", task.callback, task_name=task.name)
+                    continue
+                task.in_flight = asyncio.create_task(self._run_task(task))
+                self._runs.add(task.in_flight)
+                task.in_flight.add_done_callback(self._runs.discard)
+                ran += 1
+        return ran
+
+    async def drain(self):
+        """Espera as execuções em andamento (testes e desligamento)."""
+        if self._runs:
+            await asyncio.gather(*list(self._runs), return_exceptions=True)
+
+    async def _run_task(self, task: ScheduledTask):
+        task.runs += 1
+        started = time.perf_counter()
+        lag = 0.0
+        if self._start_monotonic is not None:
+            lag = time.monotonic() - (self._start_monotonic + task.deadline * self.tick_seconds)
+        failed = False
+        try:
+            result = task.callback(*task.args)
+            if inspect.isawaitable(result):
+                await result
+        except Exception as e:
+            failed = True
+            logger.error(f"Erro na tarefa agendada '{task.name}': {e}")
+
+        # Orçamento de uma tarefa periódica = o próprio intervalo
+        budget = task.interval_ticks * self.tick_seconds if task.periodic else None
+        self.metrics.observe_task(task.name, task.callback, time.perf_counter() - started,
+                                  lag, budget, failed)
+
+    # ==========================================================================
+    # INTERNOS
+    # ==========================================================================
+
+    def _arm(self, task: ScheduledTask, deadline: int):
+        task.deadline = deadline
+        fire_at = deadline
+        if task.jitter_ticks:
+            fire_at += self.rng.randint(-task.jitter_ticks, task.jitter_ticks)
+        task.timer = self.wheel.schedule_at(fire_at, None, task)
+
+    def _rearm(self, task: ScheduledTask):
+        # Cronograma ideal; execuções atrasadas demais são aglutinadas
+        deadline = task.deadline + task.interval_ticks
+        now = max(self.now_ticks, self._catchup_tick)
+        if deadline <= now:
+            missed = (now - deadline) // task.interval_ticks + 1
+            deadline += missed * task.interval_ticks
+        self._arm(task, deadline)
+
@@ -0,0 +1,120 @@
+# backend/game/engines/time/weather.py
+"""
+TEMPO POR ZONA (Máquina de Estados Climática)
+
+O clima de cada zona é derivado UMA vez das flags das salas (ARCTIC, DESERT...).
+O tempo corrente de cada zona fica em cache e só muda nos eventos do calendário:
+- Virada de estação: sorteia de novo em todas as zonas.
+- Virada de hora: cada zona tem WEATHER_CHANGE_CHANCE de trocar de tempo,
+  sorteando entre as opções da matriz Estação x Clima (pesos pré-calculados).
+`look`, `clima` e a ecologia só leem as strings prontas.
+"""
+import logging
+from collections import Counter
+from dataclasses import dataclass
+from typing import Dict, Optional
+
+from .calendar import CAL_HOUR, CAL_SEASON, GameDate
+from .climate import CLIMATE_TEMPERATE, CLIMATE_TYPES, UNKNOWN_WEATHER, WEATHER_MATRIX
+
+logger = logging.getLogger(__name__)
+
+# Chance de o tempo de uma zona mudar a cada hora de jogo
+WEATHER_CHANGE_CHANCE = 0.2
+
+PRECIP_ICONS = {
+    "none": "🌤️", "rain": "🌧️", "storm": "⛈️", "snow": "🌨️",
+    "wind": "🌬️", "fog": "🌫️", "sandstorm": "🌪️",
+}
+
+
+@dataclass
+class ZoneWeather:
+    zone_id: int
+    climate: str
+    weather: Dict[str, str]
+    line: str = ""          # Texto pronto para o 'look' e o 'clima'
+    changed_at: str = ""    # Data (texto) da última troca
+
+    def set(self, weather: Dict[str, str], date: Optional[GameDate] = None):
+        self.weather = weather
+        self.line = f"{PRECIP_ICONS.get(weather['precip'], '🌤️')} {weather['desc']}"
+        if date is not None:
+            self.changed_at = str(date)
+
+
+class WeatherEngine:
+    def __init__(self, world_manager, time_engine=None):
+        self.world = world_manager
+        self.time = time_engine
+        self.zones: Dict[int, ZoneWeather] = {}
+        self.season: Optional[str] = None
+
+        if time_engine is not None:
+            time_engine.on_calendar(CAL_SEASON, self._on_season_change)
+            time_engine.on_calendar(CAL_HOUR, self._on_hour_change)
+
+    # ==========================================================================
+    # CONSULTA (cache)
+    # ==========================================================================
+
+    def get(self, zone_id: int) -> Optional[ZoneWeather]:
+        return self.zones.get(zone_id)
+
+    def describe(self, zone_id: int) -> str:
+        state = self.zones.get(zone_id)
+        return state.weather["desc"] if state else "Céu limpo"
+
+    def line(self, zone_id: int) -> str:
+        state = self.zones.get(zone_id)
+        return state.line if state else ""
+
+    # ==========================================================================
+    # CLIMA DAS ZONAS
+    # ==========================================================================
+
+    def derive_climates(self):
+        """Clima de cada zona = flag de clima mais comum entre suas salas (padrão: temperado)."""
+        votes: Dict[int, Counter] = {}
+        for room in self.world.rooms.values():
+            counter = votes.setdefault(room.zone_id, Counter())
+            for flag in room.flags:
+                if flag.upper() in CLIMATE_TYPES:
+                    counter[flag.upper()] += 1
+
+        for zone_id, counter in votes.items():
+            climate = counter.most_common(1)[0][0] if counter else CLIMATE_TEMPERATE
+            state = self.zones.get(zone_id)
+            if state is None:
+                self.zones[zone_id] = ZoneWeather(zone_id, climate, UNKNOWN_WEATHER)
+            else:
+                state.climate = climate
+
+    # ==========================================================================
+    # TRANSIÇÕES (eventos do calendário)
+    # ==========================================================================
+
+    def _on_season_change(self, date: GameDate):
+        if not self.zones:
+            self.derive_climates()
+        self.season = date.season_name
+        for state in self.zones.values():
+            self._roll(state, date)
+
+    def _on_hour_change(self, date: GameDate):
+        if self.season is None:
+            return
+        rng = self.world.rng.stream("weather")
+        for state in self.zones.values():
+            if rng.random() < WEATHER_CHANGE_CHANCE:
+                self._roll(state, date)
+
+    def _roll(self, state: ZoneWeather, date: GameDate):
+        entry = WEATHER_MATRIX.get((self.season, state.climate))
+        if entry is None:
+            state.set(UNKNOWN_WEATHER, date)
+            return
+        options, cum_weights = entry
+        weather = self.world.rng.stream("weather").choices(options, cum_weights=cum_weights)[0]
+        if weather is not state.weather:
+            state.set(weather, date)
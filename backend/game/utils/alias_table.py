@@ -0,0 +1,49 @@
+# backend/game/utils/alias_table.py
+"""
+TABELA DE ALIAS (Método de Vose)
+
+Amostragem ponderada em O(1): montada uma vez em O(n), cada sorteio usa um
+único número aleatório (coluna + moeda enviesada da coluna).
+"""
+import random
+from typing import Generic, List, Sequence, TypeVar
+
+T = TypeVar("T")
+
+
+class AliasTable(Generic[T]):
+    __slots__ = ("items", "_prob", "_alias", "total_weight")
+
+    def __init__(self, items: Sequence[T], weights: Sequence[float]):
+        if len(items) != len(weights):
+            raise ValueError("items e weights precisam ter o mesmo tamanho")
+        pairs = [(item, float(w)) for item, w in zip(items, weights) if w > 0]
+        if not pairs:
+            raise ValueError("AliasTable precisa de ao menos um peso positivo")
+
+        self.items: List[T] = [item for item, _ in pairs]
+        self.total_weight = sum(w for _, w in pairs)
+        n = len(pairs)
+        scaled = [w * n / self.total_weight for _, w in pairs]
+        self._prob = [1.0] * n
+        self._alias = list(range(n))
+
+        small = [i for i, p in enumerate(scaled) if p < 1.0]
+        large = [i for i, p in enumerate(scaled) if p >= 1.0]
+        while small and large:
+            s, l = small.pop(), large.pop()
+            self._prob[s] = scaled[s]
+            self._alias[s] = l
+            scaled[l] -= 1.0 - scaled[s]
+            (small if scaled[l] < 1.0 else large).append(l)
+        # Sobras (erro de arredondamento) ficam com probabilidade 1
+
+    def __len__(self) -> int:
+        return len(self.items)
+
+    def sample(self, rng: random.Random) -> T:
+        u = rng.random() * len(self.items)
+        column = int(u)
+        if u - column < self._prob[column]:
+            return self.items[column]
+        return self.items[self._alias[column]]
@@ -0,0 +1,151 @@
+# backend/game/utils/indexed_heap.py
+"""
+HEAP INDEXADO (fila de prioridade com chave)
+
+Min-heap binário que sabe onde cada chave está: inserir, remover a menor,
+reagendar (mudar prioridade) e remover uma chave arbitrária custam O(log n),
+e consultar a prioridade de uma chave custa O(1). Empates de prioridade saem
+na ordem de inserção (determinístico).
+"""
+import heapq
+from typing import Any, Dict, Hashable, Iterator, List, Optional, Tuple
+
+
+class IndexedHeap:
+    __slots__ = ("_heap", "_pos", "_counter")
+
+    def __init__(self):
+        # Entradas: [prioridade, ordem de inserção, chave]
+        self._heap: List[List[Any]] = []
+        self._pos: Dict[Hashable, int] = {}
+        self._counter = 0
+
+    def __len__(self) -> int:
+        return len(self._heap)
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._pos
+
+    def __iter__(self) -> Iterator[Hashable]:
+        return iter(list(self._pos))
+
+    def priority(self, key: Hashable) -> Optional[Any]:
+        idx = self._pos.get(key)
+        return self._heap[idx][0] if idx is not None else None
+
+    def push(self, key: Hashable, priority: Any):
+        """Insere ou atualiza a prioridade de `key`."""
+        idx = self._pos.get(key)
+        if idx is not None:
+            old = self._heap[idx][0]
+            self._heap[idx][0] = priority
+            if priority < old:
+                self._sift_up(idx)
+            else:
+                self._sift_down(idx)
+            return
+        self._counter += 1
+        self._heap.append([priority, self._counter, key])
+        self._pos[key] = len(self._heap) - 1
+        self._sift_up(len(self._heap) - 1)
+
+    def peek(self) -> Optional[Tuple[Hashable, Any]]:
+        if not self._heap:
+            return None
+        priority, _, key = self._heap[0]
+        return key, priority
+
+    def pop(self) -> Tuple[Hashable, Any]:
+        """Remove e devolve (chave, prioridade) de menor prioridade."""
+        if not self._heap:
+            raise IndexError("pop de heap vazio")
+        priority, _, key = self._heap[0]
+        self._remove_at(0)
+        return key, priority
+
+    def remove(self, key: Hashable) -> bool:
+        idx = self._pos.get(key)
+        if idx is None:
+            return False
+        self._remove_at(idx)
+        return True
+
+    def pop_due(self, limit: Any, max_items: Optional[int] = None) -> List[Tuple[Hashable, Any]]:
+        """Remove todas as entradas com prioridade <= limit (até max_items)."""
+        out = []
+        while self._heap and self._heap[0][0] <= limit:
+            if max_items is not None and len(out) >= max_items:
+                break
+            out.append(self.pop())
+        return out
+
+    def smallest(self, k: int) -> List[Tuple[Hashable, Any]]:
+        """As k menores entradas em ordem, sem remover. Custo O(k log k)."""
+        heap = self._heap
+        out: List[Tuple[Hashable, Any]] = []
+        if not heap or k <= 0:
+            return out
+        # Fronteira de índices do heap, ordenada pelas próprias entradas
+        frontier = [(heap[0], 0)]
+        while frontier and len(out) < k:
+            entry, idx = heapq.heappop(frontier)
+            out.append((entry[2], entry[0]))
+            for child in (2 * idx + 1, 2 * idx + 2):
+                if child < len(heap):
+                    heapq.heappush(frontier, (heap[child], child))
+        return out
+
+    def clear(self):
+        self._heap.clear()
+        self._pos.clear()
+
+    # ==========================================================================
+    # INTERNOS
+    # ==========================================================================
+
+    def _remove_at(self, idx: int):
+        heap = self._heap
+        last = heap.pop()
+        del self._pos[heap[idx][2] if idx < len(heap) else last[2]]
+        if idx < len(heap):
+            heap[idx] = last
+            self._pos[last[2]] = idx
+            self._sift_up(idx)
+            self._sift_down(self._pos[last[2]])
+
+    # Entradas são listas [prioridade, ordem, chave]: a comparação nativa de listas
+    # decide por prioridade e desempata pela ordem (única), sem chegar à chave.
+
+    def _sift_up(self, idx: int):
+        heap, pos = self._heap, self._pos
+        entry = heap[idx]
+        while idx > 0:
+            parent = (idx - 1) >> 1
+            parent_entry = heap[parent]
+            if not entry < parent_entry:
+                break
+            heap[idx] = parent_entry
+            pos[parent_entry[2]] = idx
+            idx = parent
+        heap[idx] = entry
+        pos[entry[2]] = idx
+
+    def _sift_down(self, idx: int):
+        heap, pos = self._heap, self._pos
+        n = len(heap)
+        entry = heap[idx]
+        while True:
+            child = 2 * idx + 1
+            if child >= n:
+                break
+            right = child + 1
+            if right < n and heap[right] < heap[child]:
+                child = right
+            child_entry = heap[child]
+            if not child_entry < entry:
+                break
+            heap[idx] = child_entry
+            pos[child_entry[2]] = idx
+            idx = child
+        heap[idx] = entry
+        pos[entry[2]] = idx
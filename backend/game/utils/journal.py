@@ -0,0 +1,214 @@
+# backend/game/utils/journal.py
+"""
+JOURNAL APPEND-ONLY + SNAPSHOT (Persistência Incremental)
+
+Cada mutação vira um registro numerado (seq) acrescentado ao journal; o custo da
+escrita é o da mudança, não o do estado inteiro.
+
+- append: só entra na fila em memória (chamado no loop, barato).
+- flush: grava a fila no fim do arquivo + fsync numa thread de trabalho
+  (lotes pequenos, a cada tick do relógio).
+- compact: o estado inteiro vira snapshot (JsonStore, escrita atômica) com o
+  seq do último registro que ele já contém; o journal é zerado.
+- load: snapshot + registros do journal com seq maior que o do snapshot.
+
+Linha do journal: "<crc32 hex> <json>\n". Uma linha rasgada por crash (sem
+"\n" ou com CRC errado) encerra o replay e é cortada do arquivo.
+Um crash entre gravar o snapshot e zerar o journal só deixa registros com seq
+já coberto pelo snapshot, que o replay pula.
+"""
+import asyncio
+import json
+import logging
+import os
+import zlib
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Tuple, Union
+
+from backend.game.utils.persistence import JsonStore
+
+logger = logging.getLogger(__name__)
+
+# Compacta quando o journal passa de qualquer um dos limites
+JOURNAL_COMPACT_BYTES = 8 * 1024 * 1024
+JOURNAL_COMPACT_RECORDS = 200_000
+
+
+def encode_record(record: Dict[str, Any]) -> bytes:
+    payload = json.dumps(record, separators=(",", ":"), ensure_ascii=False, default=str).encode("utf-8")
+    return b"%08x " % zlib.crc32(payload) + payload + b"\n"
+
+
+def decode_record(line: bytes) -> Optional[Dict[str, Any]]:
+    """Registro da linha, ou None se ela está rasgada/corrompida."""
+    if not line.endswith(b"\n") or len(line) < 10 or line[8:9] != b" ":
+        return None
+    payload = line[9:-1]
+    try:
+        if int(line[:8], 16) != zlib.crc32(payload):
+            return None
+        return json.loads(payload.decode("utf-8"))
+    except ValueError:
+        return None
+
+
+class Journal:
+    """
+    Journal de um motor. `snapshot_fn()` devolve o estado inteiro (montado no
+    loop); `apply_fn(record)` reaplica um registro no load. Enquanto o load
+    reaplica, `append` é ignorado (as mutações já estão no disco).
+    """
+
+    def __init__(self, path: Union[str, Path], snapshot_store: JsonStore,
+                 snapshot_fn: Callable[[], Dict[str, Any]],
+                 apply_fn: Callable[[Dict[str, Any]], Any]):
+        self.path = Path(path)
+        self.store = snapshot_store
+        self.snapshot_fn = snapshot_fn
+        self.apply_fn = apply_fn
+
+        self.seq = 0                  # último seq emitido
+        self._pending: List[Tuple[int, bytes]] = []
+        self._replaying = False
+        self._lock: Optional[asyncio.Lock] = None
+
+        self.bytes_on_disk = 0
+        self.records_on_disk = 0
+        self.compactions = 0
+
+    # ==========================================================================
+    # ESCRITA
+    # ==========================================================================
+
+    def append(self, op: str, **fields):
+        if self._replaying:
+            return
+        self.seq += 1
+        fields["s"] = self.seq
+        fields["op"] = op
+        self._pending.append((self.seq, encode_record(fields)))
+
+    def needs_compaction(self) -> bool:
+        return (self.bytes_on_disk >= JOURNAL_COMPACT_BYTES
+                or self.records_on_disk >= JOURNAL_COMPACT_RECORDS)
+
+    def _write(self, lines: List[bytes]):
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        blob = b"".join(lines)
+        with open(self.path, "ab") as f:
+            f.write(blob)
+            f.flush()
+            os.fsync(f.fileno())
+        self.bytes_on_disk += len(blob)
+        self.records_on_disk += len(lines)
+
+    def flush_sync(self):
+        """Grava a fila agora (desligamento / testes)."""
+        pending, self._pending = self._pending, []
+        if pending:
+            self._write([line for _, line in pending])
+
+    async def flush(self):
+        """Tick do relógio: grava o lote numa thread; compacta se o journal cresceu demais."""
+        if self._lock is None:
+            self._lock = asyncio.Lock()
+        async with self._lock:
+            pending, self._pending = self._pending, []
+            if pending:
+                await asyncio.to_thread(self._write, [line for _, line in pending])
+            if self.needs_compaction():
+                await self._compact_locked()
+
+    # ==========================================================================
+    # COMPACTAÇÃO
+    # ==========================================================================
+
+    def _snapshot(self) -> Dict[str, Any]:
+        # O estado contém tudo até self.seq (mutação e append acontecem juntos no loop)
+        return {"journal_seq": self.seq, "state": self.snapshot_fn()}
+
+    def _truncate(self):
+        with open(self.path, "wb") as f:
+            f.flush()
+            os.fsync(f.fileno())
+        self.bytes_on_disk = 0
+        self.records_on_disk = 0
+
+    def compact_sync(self):
+        """Snapshot + journal zerado, tudo no chamador (desligamento)."""
+        self._pending = []
+        self.store.save(self._snapshot())
+        self._truncate()
+        self.compactions += 1
+
+    async def compact(self):
+        if self._lock is None:
+            self._lock = asyncio.Lock()
+        async with self._lock:
+            await self._compact_locked()
+
+    async def _compact_locked(self):
+        # Com o lock, o arquivo só tem registros com seq <= snapshot; o que for
+        # acrescentado durante a gravação fica na fila e vai para o journal novo.
+        snapshot = self._snapshot()
+        covered = snapshot["journal_seq"]
+        self._pending = [(seq, line) for seq, line in self._pending if seq > covered]
+        await asyncio.to_thread(self.store.save, snapshot)
+        await asyncio.to_thread(self._truncate)
+        self.compactions += 1
+        logger.info(f"📓 Journal {self.path.name} compactado no snapshot (seq {covered}).")
+
+    # ==========================================================================
+    # LEITURA
+    # ==========================================================================
+
+    def load(self) -> Optional[Dict[str, Any]]:
+        """
+        Lê o snapshot e devolve seu estado (None se não há); o chamador aplica
+        o estado e em seguida chama replay() para o rabo do journal.
+        """
+        data = self.store.load()
+        if not data:
+            return None
+        if "journal_seq" not in data:
+            # Save anterior ao journal: o arquivo inteiro é o estado
+            return data
+        self.seq = data["journal_seq"]
+        return data["state"]
+
+    def replay(self) -> int:
+        """Reaplica os registros posteriores ao snapshot. Retorna quantos."""
+        if not self.path.exists():
+            return 0
+        covered = self.seq
+        applied = 0
+        good_bytes = 0
+        self._replaying = True
+        try:
+            with open(self.path, "rb") as f:
+                for line in f:
+                    record = decode_record(line)
+                    if record is None:
+                        logger.warning(f"📓 Journal {self.path.name}: registro rasgado no byte {good_bytes}; descartando o resto.")
+                        break
+                    good_bytes += len(line)
+                    self.records_on_disk += 1
+                    seq = record.get("s", 0)
+                    if seq <= covered:
+                        continue
+                    try:
+                        self.apply_fn(record)
+                    except Exception as e:
+                        logger.error(f"📓 Journal {self.path.name}: falha ao reaplicar seq {seq}: {e}")
+                    self.seq = max(self.seq, seq)
+                    applied += 1
+        finally:
+            self._replaying = False
+
+        if good_bytes < self.path.stat().st_size:
+            with open(self.path, "r+b") as f:
+                f.truncate(good_bytes)
+                f.flush()
+                os.fsync(f.fileno())
+        self.bytes_on_disk = good_bytes
+        return applied
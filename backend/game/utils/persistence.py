@@ -0,0 +1,132 @@
+# backend/game/utils/persistence.py
+"""
+PERSISTÊNCIA ATÔMICA DE ESTADO (JSON)
+
+Arquivos de estado (relógio, grimório) são gravados assim:
+1. Serialização compacta (e gzip opcional) numa thread de trabalho.
+2. Escrita num arquivo temporário no mesmo diretório + fsync.
+3. os.replace sobre o arquivo final (atômico): um crash no meio da escrita
+   deixa o arquivo antigo intacto, nunca um arquivo truncado.
+
+Formato: uma linha de cabeçalho "AEJS1 <js|gz> <sha256>\n" seguida do conteúdo.
+A leitura confere o checksum e ainda aceita o JSON puro dos saves antigos.
+"""
+import asyncio
+import gzip
+import hashlib
+import json
+import logging
+import os
+import tempfile
+from pathlib import Path
+from typing import Any, Optional, Union
+
+logger = logging.getLogger(__name__)
+
+MAGIC = b"AEJS1"
+ENCODING_JSON = b"js"
+ENCODING_GZIP = b"gz"
+
+
+class CorruptStateError(ValueError):
+    """Arquivo de estado com checksum ou formato inválido."""
+
+
+def encode_state(data: Any, compress: bool = False) -> bytes:
+    payload = json.dumps(data, separators=(",", ":"), ensure_ascii=False, default=str).encode("utf-8")
+    encoding = ENCODING_JSON
+    if compress:
+        # mtime=0: mesmo estado -> mesmos bytes (checksum estável)
+        payload = gzip.compress(payload, compresslevel=6, mtime=0)
+        encoding = ENCODING_GZIP
+    digest = hashlib.sha256(payload).hexdigest().encode("ascii")
+    return b" ".join((MAGIC, encoding, digest)) + b"\n" + payload
+
+
+def decode_state(blob: bytes) -> Any:
+    if not blob.startswith(MAGIC):
+        # Save legado: JSON puro (indentado)
+        return json.loads(blob.decode("utf-8"))
+
+    header, _, payload = blob.partition(b"\n")
+    try:
+        _magic, encoding, digest = header.split(b" ")
+    except ValueError:
+        raise CorruptStateError("Cabeçalho de estado inválido")
+    if hashlib.sha256(payload).hexdigest().encode("ascii") != digest:
+        raise CorruptStateError("Checksum não confere (arquivo corrompido)")
+    if encoding == ENCODING_GZIP:
+        payload = gzip.decompress(payload)
+    elif encoding != ENCODING_JSON:
+        raise CorruptStateError(f"Codificação desconhecida: {encoding!r}")
+    return json.loads(payload.decode("utf-8"))
+
+
+def write_atomic(path: Union[str, Path], blob: bytes):
+    """Grava `blob` em `path` via arquivo temporário + os.replace."""
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(prefix=f".{path.name}.", suffix=".tmp", dir=path.parent)
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(blob)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, path)
+    except BaseException:
+        try:
+            os.unlink(tmp_path)
+        except OSError:
+            pass
+        raise
+
+    # Garante que a renomeação em si chegou ao disco (POSIX)
+    try:
+        dir_fd = os.open(path.parent, os.O_RDONLY)
+    except OSError:
+        return
+    try:
+        os.fsync(dir_fd)
+    except OSError:
+        pass
+    finally:
+        os.close(dir_fd)
+
+
+class JsonStore:
+    """
+    Um arquivo de estado. `save` é síncrono (desligamento); `save_async` roda
+    na thread de trabalho e nunca bloqueia o loop. Gravações concorrentes são
+    serializadas na ordem de chegada.
+    """
+
+    def __init__(self, path: Union[str, Path], compress: bool = False):
+        self.path = Path(path)
+        self.compress = compress
+        self._lock: Optional[asyncio.Lock] = None
+
+    def exists(self) -> bool:
+        return self.path.exists()
+
+    def load(self) -> Optional[Any]:
+        """Lê o estado. None se o arquivo não existe ou está vazio."""
+        if not self.path.exists():
+            return None
+        blob = self.path.read_bytes()
+        if not blob.strip():
+            logger.warning(f"💾 Estado vazio em {self.path}; ignorando.")
+            return None
+        return decode_state(blob)
+
+    def save(self, data: Any):
+        write_atomic(self.path, encode_state(data, self.compress))
+
+    async def save_async(self, data: Any):
+        """
+        `data` deve ser um instantâneo (estruturas novas, montadas no loop):
+        a serialização acontece em outra thread enquanto o jogo continua.
+        """
+        if self._lock is None:
+            self._lock = asyncio.Lock()
+        async with self._lock:
+            await asyncio.to_thread(self.save, data)
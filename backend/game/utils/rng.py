@@ -0,0 +1,59 @@
+# backend/game/utils/rng.py
+"""
+FLUXOS DE ALEATORIEDADE (RNG Streams)
+
+Cada subsistema (combate, ecologia, pesquisa arcana...) tem seu próprio
+random.Random, derivado de uma semente raiz + nome do fluxo. Assim uma sessão
+pode ser reproduzida sem que a ordem de chamadas de outro subsistema altere
+os números sorteados, e benchmarks deixam de depender do módulo global.
+"""
+import hashlib
+import logging
+import os
+import random
+from typing import Dict, Optional
+
+logger = logging.getLogger(__name__)
+
+SEED_BITS = 64
+
+
+def derive_seed(root_seed: int, *names) -> int:
+    """Semente estável (64 bits) para um fluxo nomeado. Não depende de PYTHONHASHSEED."""
+    key = ":".join([str(root_seed)] + [str(n) for n in names]).encode("utf-8")
+    return int.from_bytes(hashlib.blake2b(key, digest_size=8).digest(), "little")
+
+
+def new_seed() -> int:
+    return int.from_bytes(os.urandom(8), "little")
+
+
+class RngStreams:
+    """
+    Registro de geradores por subsistema.
+    stream(nome) é sempre o mesmo objeto; spawn(nome) cria um gerador novo
+    (ex: um por sessão de combate) e devolve a semente para registro/replay.
+    """
+
+    def __init__(self, root_seed: Optional[int] = None):
+        self.root_seed = root_seed if root_seed is not None else new_seed()
+        self._streams: Dict[str, random.Random] = {}
+        logger.info(f"🎲 RNG: semente raiz {self.root_seed}")
+
+    def stream(self, name: str) -> random.Random:
+        rng = self._streams.get(name)
+        if rng is None:
+            rng = self._streams[name] = random.Random(derive_seed(self.root_seed, name))
+        return rng
+
+    def spawn_seed(self, name: str) -> int:
+        """Próxima semente filha do fluxo `name` (determinística dada a raiz)."""
+        return self.stream(name).getrandbits(SEED_BITS)
+
+    def spawn(self, name: str) -> random.Random:
+        return random.Random(self.spawn_seed(name))
+
+    def reseed(self, root_seed: int):
+        """Reinicia todos os fluxos a partir de uma nova raiz."""
+        self.root_seed = root_seed
+        self._streams.clear()
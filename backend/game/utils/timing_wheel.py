@@ -0,0 +1,141 @@
+# backend/game/utils/timing_wheel.py
+"""
+RODA DE TEMPO HIERÁRQUICA (Hierarchical Timing Wheel)
+
+Agenda milhares de timers com custo O(1) para inserir e cancelar, e custo
+amortizado O(1) por timer para expirar. O tempo é medido em ticks inteiros;
+quem usa a roda decide quanto vale um tick (1s de efeito, 100ms de scheduler).
+
+Cada nível tem N slots e cobre N vezes o alcance do nível anterior. Timers
+distantes descem de nível (cascata) quando seu bloco se aproxima, e timers
+além do último nível aguardam numa lista de overflow.
+"""
+from typing import Any, Callable, List, Optional, Tuple
+
+
+class TimerHandle:
+    """Um timer agendado. Cancelamento é preguiçoso (marcado e ignorado)."""
+    __slots__ = ("deadline", "callback", "args", "cancelled", "fired")
+
+    def __init__(self, deadline: int, callback: Optional[Callable], args: Tuple = ()):
+        self.deadline = deadline
+        self.callback = callback
+        self.args = args
+        self.cancelled = False
+        self.fired = False
+
+    @property
+    def pending(self) -> bool:
+        return not (self.cancelled or self.fired)
+
+    def fire(self) -> Any:
+        if self.callback is not None:
+            return self.callback(*self.args)
+        return None
+
+
+class HierarchicalTimingWheel:
+    def __init__(self, slots_per_level: int = 64, levels: int = 4):
+        self.slots = slots_per_level
+        self.levels = levels
+        self.current_tick = 0
+
+        self._wheels: List[List[List[TimerHandle]]] = [
+            [[] for _ in range(slots_per_level)] for _ in range(levels)
+        ]
+        # Alcance (em ticks) de cada nível: S, S^2, S^3...
+        self._spans = [slots_per_level ** (level + 1) for level in range(levels)]
+        self._overflow: List[TimerHandle] = []
+        self._active = 0
+
+    def __len__(self) -> int:
+        return self._active
+
+    # ==========================================================================
+    # AGENDAMENTO
+    # ==========================================================================
+
+    def schedule(self, delay_ticks: int, callback: Optional[Callable] = None, *args) -> TimerHandle:
+        """Agenda para daqui a `delay_ticks` ticks (mínimo 1)."""
+        return self.schedule_at(self.current_tick + max(1, int(delay_ticks)), callback, *args)
+
+    def schedule_at(self, deadline: int, callback: Optional[Callable] = None, *args) -> TimerHandle:
+        """Agenda para um tick absoluto. Prazos já vencidos disparam no próximo tick."""
+        handle = TimerHandle(max(int(deadline), self.current_tick + 1), callback, args)
+        self._place(handle)
+        self._active += 1
+        return handle
+
+    def cancel(self, handle: Optional[TimerHandle]) -> bool:
+        if handle is None or not handle.pending:
+            return False
+        handle.cancelled = True
+        self._active -= 1
+        return True
+
+    def _place(self, handle: TimerHandle):
+        # delta == 0 só acontece na cascata: o timer cai no slot que está
+        # prestes a ser expirado neste mesmo tick.
+        delta = handle.deadline - self.current_tick
+        if delta < 0:
+            delta = 1
+            handle.deadline = self.current_tick + 1
+
+        for level, span in enumerate(self._spans):
+            if delta < span:
+                slot = (handle.deadline // (self.slots ** level)) % self.slots
+                self._wheels[level][slot].append(handle)
+                return
+        self._overflow.append(handle)
+
+    # ==========================================================================
+    # AVANÇO
+    # ==========================================================================
+
+    def advance(self, ticks: int = 1) -> List[TimerHandle]:
+        """Avança o relógio e devolve os timers vencidos, em ordem de tick."""
+        due: List[TimerHandle] = []
+        for _ in range(max(0, int(ticks))):
+            self._tick(due)
+        return due
+
+    def _tick(self, due: List[TimerHandle]):
+        self.current_tick += 1
+        t = self.current_tick
+        S = self.slots
+
+        # Overflow volta para a roda quando a roda de cima completa uma volta
+        if self._overflow and t % self._spans[-1] == 0:
+            pending, self._overflow = self._overflow, []
+            for handle in pending:
+                if not handle.cancelled:
+                    self._place(handle)
+
+        # Cascata: do nível mais alto que completou um bloco até o nível 1
+        top = 0
+        while top + 1 < self.levels and t % (S ** (top + 1)) == 0:
+            top += 1
+        for level in range(top, 0, -1):
+            slot = (t // (S ** level)) % S
+            bucket = self._wheels[level][slot]
+            if bucket:
+                self._wheels[level][slot] = []
+                for handle in bucket:
+                    if not handle.cancelled:
+                        self._place(handle)
+
+        # Expiração do nível 0
+        slot = t % S
+        bucket = self._wheels[0][slot]
+        if not bucket:
+            return
+        self._wheels[0][slot] = []
+        for handle in bucket:
+            if handle.cancelled:
+                continue
+            if handle.deadline <= t:
+                handle.fired = True
+                self._active -= 1
+                due.append(handle)
+            else:
+                self._place(handle)
@@ -0,0 +1,92 @@
+# backend/game/world/entities.py
+"""
+REGISTRO DE ENTIDADES
+Handles tipados e compactos (tipo + índice + geração) com resolução O(1).
+
+Substitui as heurísticas de string (isdigit/isinstance) usadas para decidir
+se um ID pertence a um jogador ou a um NPC. O índice de um slot liberado é
+reaproveitado, e a geração impede que um handle antigo resolva para a nova
+entidade que ocupou o mesmo slot.
+"""
+from enum import IntEnum
+from typing import Any, List, NamedTuple, Optional
+
+
+class EntityKind(IntEnum):
+    PLAYER = 0
+    NPC = 1
+
+
+class EntityHandle(NamedTuple):
+    """Referência imutável e hashável para uma entidade viva no mundo."""
+    kind: EntityKind
+    index: int
+    generation: int
+
+    @property
+    def is_player(self) -> bool:
+        return self.kind is EntityKind.PLAYER
+
+    @property
+    def is_npc(self) -> bool:
+        return self.kind is EntityKind.NPC
+
+    def __str__(self) -> str:
+        return f"{self.kind.name}#{self.index}.{self.generation}"
+
+
+class EntityRegistry:
+    """
+    Tabela de slots por tipo de entidade.
+    register/release/resolve são todos O(1).
+    """
+
+    def __init__(self):
+        self._slots: List[List[Any]] = [[] for _ in EntityKind]
+        self._generations: List[List[int]] = [[] for _ in EntityKind]
+        self._free: List[List[int]] = [[] for _ in EntityKind]
+        self._live: List[int] = [0 for _ in EntityKind]
+
+    def register(self, kind: EntityKind, entity: Any) -> EntityHandle:
+        """Aloca um slot para a entidade e grava o handle nela."""
+        slots = self._slots[kind]
+        generations = self._generations[kind]
+        free = self._free[kind]
+
+        if free:
+            index = free.pop()
+            slots[index] = entity
+        else:
+            index = len(slots)
+            slots.append(entity)
+            generations.append(0)
+
+        handle = EntityHandle(kind, index, generations[index])
+        entity.handle = handle
+        self._live[kind] += 1
+        return handle
+
+    def release(self, handle: Optional[EntityHandle]) -> None:
+        """Libera o slot; handles antigos passam a resolver para None."""
+        if handle is None or not self.is_valid(handle):
+            return
+        kind, index = handle.kind, handle.index
+        self._slots[kind][index] = None
+        self._generations[kind][index] += 1
+        self._free[kind].append(index)
+        self._live[kind] -= 1
+
+    def resolve(self, handle: Optional[EntityHandle]) -> Optional[Any]:
+        if handle is None:
+            return None
+        kind, index, generation = handle
+        generations = self._generations[kind]
+        if index < len(generations) and generations[index] == generation:
+            return self._slots[kind][index]
+        return None
+
+    def is_valid(self, handle: Optional[EntityHandle]) -> bool:
+        return self.resolve(handle) is not None
+
+    def count(self, kind: EntityKind) -> int:
+        return self._live[kind]
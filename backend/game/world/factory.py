@@ -8,6 +8,7 @@ from backend.game.utils.vnum import VNum
 from backend.models.item import ItemTemplate, ItemInstance, ItemDamage, ItemAttribute
 from backend.models.npc import NPCTemplate, NPCInstance, BodyPartInstance, NaturalAttack
 from backend.models.room import Room, RoomExit, RoomSensory
+from backend.models.area import Area
 
 logger = logging.getLogger(__name__)
 
@@ -18,6 +19,7 @@ class ObjectFactory:
         self._npc_templates: Dict[int, NPCTemplate] = {}
         self._anatomy_templates: Dict[str, Any] = {} 
         self._room_templates: Dict[int, Room] = {} 
+        self._area_templates: Dict[int, Area] = {}
 
     def load_all_data(self):
         logger.info("Iniciando carregamento do mundo...")
@@ -25,6 +27,7 @@ class ObjectFactory:
         self._load_items()
         self._load_npcs()
         self._load_rooms()
+        self._load_areas()
         logger.info(f"Mundo carregado: {len(self._item_templates)} Itens, {len(self._npc_templates)} NPCs, {len(self._room_templates)} Salas.")
 
     # ... (Outros loaders iguais) ...
@@ -53,7 +56,7 @@ class ObjectFactory:
                     name=data["name"],
                     description=data["description"],
                     type=data["type"],
-                    rarity=data["rarity"],
+                    rarity=data.get("rarity", "common"),
                     slot=data.get("slot"),
                     damage=damage_obj,
                     armor_value=data.get("armor_value", 0),
@@ -79,7 +82,7 @@ class ObjectFactory:
                     nat_attacks.append(NaturalAttack(
                         name=nat["name"],
                         damage_type=nat["damage_type"],
-                        verb=nat["verb"],
+                        verb=nat.get("verb", "ataca"),
                         damage_mult=nat.get("damage_mult", 1.0)
                     ))
 
@@ -94,11 +97,43 @@ class ObjectFactory:
                     flags=data.get("flags", []),
                     loot_table=data.get("loot_table", {}),
                     sensory_auditory=data.get("sensory_auditory"),
-                    natural_attacks=nat_attacks # <--- Carregando ataques naturais
+                    natural_attacks=nat_attacks, # <--- Carregando ataques naturais
+                    habitat=[h.upper() for h in data.get("habitat", [])]
                 )
                 self._npc_templates[vnum] = template
             except Exception as e: logger.error(f"Erro NPC {vnum_str}: {e}")
 
+    @staticmethod
+    def _parse_spawns(entries, room_vnum: int = 0) -> Dict[int, float]:
+        """
+        [{"npc_id": 100010, "count": 2}, ...] -> {100010: 2.0} ("weight" tem precedência).
+        Entrada inválida (id não numérico, peso ruim) é pulada com aviso: nunca derruba a sala.
+        """
+        spawns: Dict[int, float] = {}
+        for entry in entries:
+            try:
+                vnum = int(entry.get("npc_id") or entry.get("npc_vnum"))
+                weight = float(entry.get("weight", entry.get("count", 1)))
+                if not weight >= 0:
+                    raise ValueError(f"peso {weight}")
+            except (AttributeError, TypeError, ValueError):
+                logger.warning(f"Room {room_vnum}: spawn inválido ignorado: {entry!r}")
+                continue
+            spawns[vnum] = spawns.get(vnum, 0.0) + weight
+        return spawns
+
+    def _load_areas(self):
+        data = self._load_json("areas.json")
+        for zone_str, data in data.items():
+            try:
+                zone_id = int(zone_str)
+                self._area_templates[zone_id] = Area(
+                    id=zone_id,
+                    name=data.get("name", f"Zona {zone_id}"),
+                    description=data.get("description", "")
+                )
+            except Exception as e: logger.error(f"Erro Area {zone_str}: {e}")
+
     def _load_rooms(self):
         data = self._load_json("rooms.json")
         for vnum_str, data in data.items():
@@ -134,7 +169,8 @@ class ObjectFactory:
                     description_night=data.get("description_night"),
                     sensory=sensory,
                     flags=data.get("flags", []),
-                    exits=exits
+                    exits=exits,
+                    spawns=self._parse_spawns(data.get("spawns", []), vnum)
                 )
                 self._room_templates[vnum] = room
             except Exception as e: logger.error(f"Erro Room {vnum_str}: {e}")
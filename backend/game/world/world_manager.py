@@ -1,14 +1,20 @@
 # backend/game/world/world_manager.py
 import logging
-from typing import Dict, List, Optional, Any
+from typing import Any, Callable, Dict, List, Optional
 from datetime import datetime
 
 from backend.game.world.factory import ObjectFactory
+from backend.game.world.entities import EntityRegistry, EntityKind, EntityHandle
+from backend.game.world.zones import ZoneRegistry
+from backend.game.engines.events.bus import EventBus
+from backend.game.engines.events.types import NPCProgressed
 from backend.models.room import Room
 from backend.models.character import Character
 from backend.models.npc import NPCInstance
 from backend.models.item import ItemInstance
 from backend.game.utils.vnum import VNum
+from backend.game.utils.rng import RngStreams
+from backend.config.server_config import WORLD_SEED
 
 # IMPORTAÇÃO DO GERENTE DE MAGIA
 from backend.game.engines.magic.manager import MagicManager
@@ -31,12 +37,36 @@ class WorldManager:
         self.players: Dict[str, Character] = {}   # PlayerID (str) -> Character Object
         self.active_npcs: Dict[str, NPCInstance] = {}    # UUID -> NPC Object
         self.active_items: Dict[str, ItemInstance] = {}  # UUID -> Item Object
+
+        # Registro unificado de handles tipados (Players e NPCs)
+        self.entities = EntityRegistry()
         
-        # Estado das Zonas (Ecossistema)
-        self.zone_states: Dict[int, Dict[str, Any]] = {}
+        # Estado das Zonas (Ecossistema): Areas tipadas + rankings Nemesis
+        self.zones = ZoneRegistry()
+
+        # Partição predador/presa por sala (dicts como conjuntos ordenados:
+        # iteração determinística para o RNG) e salas disputadas
+        # (>= 1 predador + outro NPC), mantidas em spawn/move/kill
+        self.room_predators: Dict[int, Dict[str, None]] = {}
+        self.room_prey: Dict[int, Dict[str, None]] = {}
+        self.contested_rooms: Dict[int, None] = {}
+        # Salas com >= 2 NPCs (onde histórias podem ser contadas)
+        self.populated_rooms: Dict[int, None] = {}
+
+        # Ouvintes de entrada/saída de NPCs do mundo (ex: agenda de decisões da IA)
+        self.npc_added_handlers: List[Callable[[NPCInstance], Any]] = []
+        self.npc_removed_handlers: List[Callable[[str], Any]] = []
 
-        # Estado Global
+        # Estado Global (atualizado pelos eventos de amanhecer/anoitecer do TimeEngine)
         self.is_daytime: bool = True
+
+        # Barramento de eventos entre motores (combate, grimório, ecologia, nemesis)
+        self.events = EventBus()
+        # Rankings: abates do tick fundidos por NPC, aplicados no flush
+        self.events.subscribe(NPCProgressed, self._on_npc_progressed, wants_list=True)
+
+        # Aleatoriedade por subsistema ("combat", "ecology", "research"...)
+        self.rng = RngStreams(WORLD_SEED)
         
         # O Motor Mágico
         self.magic_manager = MagicManager(self)
@@ -72,15 +102,14 @@ class WorldManager:
 
     def _init_zones(self):
         """Identifica todas as zonas presentes e cria seus estados ecológicos."""
+        for zone_id, area in self.factory._area_templates.items():
+            self.zones.ensure(zone_id, area)
         for vnum in self.rooms.keys():
-            zone_id, _ = VNum.parse(vnum)
-            if zone_id not in self.zone_states:
-                self.zone_states[zone_id] = {
-                    "threat_level": 1,
-                    "current_alpha_uid": None, 
-                    "alpha_title": None,
-                    "population_count": 0
-                }
+            self.zones.add_room(vnum)
+
+    def update_daylight(self, date):
+        """Ouvinte de amanhecer/anoitecer: descrições de sala seguem a fase do dia."""
+        self.is_daytime = date.is_daytime
 
     # =========================================================================
     # GERENCIAMENTO DE ENTIDADES
@@ -98,17 +127,25 @@ class WorldManager:
     def get_item(self, uid: str) -> Optional[ItemInstance]:
         return self.active_items.get(uid)
 
+    def get_entity(self, handle: Optional[EntityHandle]):
+        """Resolve um handle tipado (Player ou NPC) em O(1)."""
+        return self.entities.resolve(handle)
+
     def add_player(self, character: Character):
         """Loga o jogador no mundo."""
         # Garante que o ID é string
         str_id = str(character.id)
         self.players[str_id] = character
+
+        if self.entities.resolve(character.handle) is not character:
+            self.entities.register(EntityKind.PLAYER, character)
         
         # Coloca na sala
         room = self.get_room(character.location_vnum)
         if room:
             if character.id not in room.players_here:
                 room.players_here.append(character.id)
+                self._count_zone_player(room.vnum, +1)
         else:
             logger.error(f"Jogador {character.name} logou em sala inexistente: {character.location_vnum}")
             character.location_vnum = 100001 
@@ -120,8 +157,52 @@ class WorldManager:
             room = self.get_room(char.location_vnum)
             if room and char.id in room.players_here:
                 room.players_here.remove(char.id)
+                self._count_zone_player(room.vnum, -1)
+            self.entities.release(char.handle)
             del self.players[str(player_id)]
 
+    def _count_zone_player(self, room_vnum: int, delta: int):
+        zone_id, _ = VNum.parse(room_vnum)
+        area = self.zones.get(zone_id)
+        if area is not None:
+            area.ecology.player_count = max(0, area.ecology.player_count + delta)
+
+    def zone_player_count(self, zone_id: int) -> int:
+        """Jogadores presentes na zona (mantido em add/remove/move, O(1))."""
+        area = self.zones.get(zone_id)
+        return area.ecology.player_count if area else 0
+
+    # =========================================================================
+    # ALPHAS E RANKINGS (NEMESIS)
+    # =========================================================================
+
+    def get_zone_alpha(self, zone_id: int) -> Optional[NPCInstance]:
+        uid = self.zones.alpha_uid(zone_id)
+        return self.active_npcs.get(uid) if uid else None
+
+    def set_zone_alpha(self, zone_id: int, npc: NPCInstance):
+        """Coroa o Alpha da zona; o anterior (se vivo) perde a coroa."""
+        previous = self.active_npcs.get(self.zones.set_alpha(zone_id, npc) or "")
+        if previous and previous.has_flag("ZONE_ALPHA"):
+            previous.flags = [f for f in previous.flags if f.upper() != "ZONE_ALPHA"]
+
+    def record_npc_progress(self, npc: NPCInstance):
+        """Chamar após abates/evolução: atualiza os rankings em O(log n)."""
+        zone_id, _ = VNum.parse(npc.room_vnum)
+        self.zones.record(npc, zone_id)
+
+    def _on_npc_progressed(self, events: List[NPCProgressed]):
+        for event in events:
+            npc = self.active_npcs.get(event.npc_uid)
+            if npc:
+                self.record_npc_progress(npc)
+
+    def top_npcs(self, k: int = 10, zone_id: Optional[int] = None, by: str = "kills") -> List[NPCInstance]:
+        """Os k NPCs mais perigosos (por abates ou evolução), global ou por zona."""
+        ranked = (self.zones.top_evolved(k, zone_id) if by == "evolution"
+                  else self.zones.top_killers(k, zone_id))
+        return [self.active_npcs[uid] for uid, _ in ranked if uid in self.active_npcs]
+
     # =========================================================================
     # SPAWNING E DESPAWNING
     # =========================================================================
@@ -134,15 +215,28 @@ class WorldManager:
         if not npc: return None
 
         npc.room_vnum = room_vnum
-        self.active_npcs[npc.uid] = npc
-        room.npcs_here.append(npc.uid)
+        self.add_npc(npc)
         
         zone_id, _ = VNum.parse(room_vnum)
-        if zone_id in self.zone_states:
-            self.zone_states[zone_id]["population_count"] += 1
+        area = self.zones.get(zone_id)
+        if area is not None:
+            area.ecology.population_count += 1
 
         return npc
 
+    def add_npc(self, npc: NPCInstance):
+        """Insere um NPC já construído (spawn, replay) em npc.room_vnum."""
+        self.active_npcs[npc.uid] = npc
+        self.entities.register(EntityKind.NPC, npc)
+        room = self.get_room(npc.room_vnum)
+        if room and npc.uid not in room.npcs_here:
+            room.npcs_here.append(npc.uid)
+            self._index_npc(npc, room.vnum)
+        if npc.progression.kills_count or npc.progression.evolution_stage:
+            self.record_npc_progress(npc)
+        for handler in self.npc_added_handlers:
+            handler(npc)
+
     def kill_npc(self, uid: str):
         npc = self.active_npcs.get(uid)
         if not npc: return
@@ -150,8 +244,19 @@ class WorldManager:
         room = self.get_room(npc.room_vnum)
         if room and uid in room.npcs_here:
             room.npcs_here.remove(uid)
+            self._unindex_npc(uid, room.vnum)
         
+        self.entities.release(npc.handle)
         del self.active_npcs[uid]
+        self.zones.forget(uid)
+        for handler in self.npc_removed_handlers:
+            handler(uid)
+
+    def on_npc_added(self, handler: Callable[[NPCInstance], Any]):
+        self.npc_added_handlers.append(handler)
+
+    def on_npc_removed(self, handler: Callable[[str], Any]):
+        self.npc_removed_handlers.append(handler)
 
     def spawn_item(self, template_vnum: int, room_vnum: int) -> Optional[ItemInstance]:
         room = self.get_room(room_vnum)
@@ -180,9 +285,11 @@ class WorldManager:
         old_room = self.get_room(char.location_vnum)
         if old_room and char.id in old_room.players_here:
             old_room.players_here.remove(char.id)
+            self._count_zone_player(old_room.vnum, -1)
         
         char.location_vnum = target_vnum
         target_room.players_here.append(char.id)
+        self._count_zone_player(target_vnum, +1)
         
         return True
 
@@ -196,8 +303,98 @@ class WorldManager:
         old_room = self.get_room(npc.room_vnum)
         if old_room and npc_uid in old_room.npcs_here:
             old_room.npcs_here.remove(npc_uid)
+            self._unindex_npc(npc_uid, old_room.vnum)
             
         npc.room_vnum = target_vnum
         target_room.npcs_here.append(npc_uid)
+        self._index_npc(npc, target_vnum)
+        self.zones.relocate(npc_uid, target_vnum)
         
-        return True
\ No newline at end of file
+        return True
+
+    def move_npcs(self, moves) -> int:
+        """
+        Move vários NPCs de uma vez: [(uid, sala_destino), ...].
+        Listas de ocupação e salas disputadas são refeitas uma vez por sala
+        tocada (e não uma vez por NPC). Retorna quantos se moveram.
+        """
+        touched = set()
+        arrivals: Dict[int, List[str]] = {}
+        moved = 0
+        for uid, target_vnum in moves:
+            npc = self.active_npcs.get(uid)
+            if not npc or npc.room_vnum == target_vnum or target_vnum not in self.rooms:
+                continue
+            self._unindex_npc(uid, npc.room_vnum, update=False)
+            touched.add(npc.room_vnum)
+            npc.room_vnum = target_vnum
+            self._index_npc(npc, target_vnum, update=False)
+            self.zones.relocate(uid, target_vnum)
+            arrivals.setdefault(target_vnum, []).append(uid)
+            touched.add(target_vnum)
+            moved += 1
+
+        for vnum in touched:
+            room = self.rooms.get(vnum)
+            if room is None:
+                continue
+            # Quem saiu (inclusive de passagem no mesmo lote) não aponta mais para cá
+            kept = [uid for uid in room.npcs_here
+                    if uid in self.active_npcs and self.active_npcs[uid].room_vnum == vnum]
+            present = set(kept)
+            for uid in arrivals.get(vnum, ()):
+                if uid not in present and self.active_npcs[uid].room_vnum == vnum:
+                    kept.append(uid)
+                    present.add(uid)
+            room.npcs_here[:] = kept
+            self._update_room_sets(vnum)
+        return moved
+
+    # =========================================================================
+    # PREDADORES, PRESAS E SALAS DISPUTADAS
+    # =========================================================================
+
+    @staticmethod
+    def is_predator(npc: NPCInstance) -> bool:
+        return npc.has_flag("PREDATOR") or npc.has_flag("AGGRESSIVE")
+
+    def get_room_partition(self, room_vnum: int):
+        """(uids de predadores, uids de presas) da sala, sem resolver objetos."""
+        return (list(self.room_predators.get(room_vnum, ())),
+                list(self.room_prey.get(room_vnum, ())))
+
+    def reclassify_npc(self, uid: str):
+        """Chamar quando as flags de um NPC mudarem (ex: virou PREDATOR)."""
+        npc = self.active_npcs.get(uid)
+        if npc:
+            self._unindex_npc(uid, npc.room_vnum)
+            self._index_npc(npc, npc.room_vnum)
+
+    def _index_npc(self, npc: NPCInstance, room_vnum: int, update: bool = True):
+        index = self.room_predators if self.is_predator(npc) else self.room_prey
+        index.setdefault(room_vnum, {})[npc.uid] = None
+        if update:
+            self._update_room_sets(room_vnum)
+
+    def _unindex_npc(self, uid: str, room_vnum: int, update: bool = True):
+        for index in (self.room_predators, self.room_prey):
+            members = index.get(room_vnum)
+            if members and uid in members:
+                del members[uid]
+                if not members:
+                    del index[room_vnum]
+        if update:
+            self._update_room_sets(room_vnum)
+
+    def _update_room_sets(self, room_vnum: int):
+        """Salas disputadas e povoadas, a partir dos tamanhos da partição."""
+        predators = len(self.room_predators.get(room_vnum, ()))
+        total = predators + len(self.room_prey.get(room_vnum, ()))
+        if predators and total >= 2:
+            self.contested_rooms[room_vnum] = None
+        else:
+            self.contested_rooms.pop(room_vnum, None)
+        if total >= 2:
+            self.populated_rooms[room_vnum] = None
+        else:
+            self.populated_rooms.pop(room_vnum, None)
@@ -0,0 +1,178 @@
+# backend/game/world/zones.py
+"""
+REGISTRO DE ZONAS E RANKINGS NEMESIS
+
+Cada zona é uma Area tipada (ameaça, Alpha, contagens, salas).
+Os NPCs notáveis (com abates ou evoluídos) ficam em rankings indexados, globais e
+por zona: atualizar no abate, mover de zona ou remover na morte custa O(log n), e
+o top-k sai em O(k log k) sem varrer o mundo.
+"""
+from typing import Dict, Iterator, List, Optional, Tuple
+
+from backend.game.utils.indexed_heap import IndexedHeap
+from backend.game.utils.vnum import VNum
+from backend.models.area import Area
+
+
+class Leaderboard:
+    """Ranking por pontuação (maior primeiro). Pontuação <= 0 sai do ranking."""
+    __slots__ = ("_heap",)
+
+    def __init__(self):
+        # Min-heap com pontuação negativa: o topo é o maior; empate = quem chegou antes
+        self._heap = IndexedHeap()
+
+    def __len__(self) -> int:
+        return len(self._heap)
+
+    def __contains__(self, uid: str) -> bool:
+        return uid in self._heap
+
+    def update(self, uid: str, score: int):
+        if score > 0:
+            self._heap.push(uid, -score)
+        else:
+            self._heap.remove(uid)
+
+    def remove(self, uid: str):
+        self._heap.remove(uid)
+
+    def score(self, uid: str) -> int:
+        priority = self._heap.priority(uid)
+        return -priority if priority is not None else 0
+
+    def top(self, k: int) -> List[Tuple[str, int]]:
+        return [(uid, -priority) for uid, priority in self._heap.smallest(k)]
+
+
+class ZoneRegistry:
+    def __init__(self):
+        self.areas: Dict[int, Area] = {}
+
+        # Rankings globais e por zona (só NPCs notáveis)
+        self.kills = Leaderboard()
+        self.evolution = Leaderboard()
+        self.zone_kills: Dict[int, Leaderboard] = {}
+        self.zone_evolution: Dict[int, Leaderboard] = {}
+        self._ranked_zone: Dict[str, int] = {}   # uid -> zona em que está ranqueado
+        self._alpha_zone: Dict[str, int] = {}    # uid do Alpha -> zona que ele domina
+
+    # ==========================================================================
+    # ÁREAS
+    # ==========================================================================
+
+    def __contains__(self, zone_id: int) -> bool:
+        return zone_id in self.areas
+
+    def __iter__(self) -> Iterator[int]:
+        return iter(self.areas)
+
+    def __len__(self) -> int:
+        return len(self.areas)
+
+    def get(self, zone_id: int) -> Optional[Area]:
+        return self.areas.get(zone_id)
+
+    def ensure(self, zone_id: int, template: Optional[Area] = None) -> Area:
+        area = self.areas.get(zone_id)
+        if area is None:
+            area = template or Area(id=zone_id, name=f"Zona {zone_id}", description="")
+            self.areas[zone_id] = area
+        return area
+
+    def add_room(self, room_vnum: int) -> Area:
+        zone_id, _ = VNum.parse(room_vnum)
+        area = self.ensure(zone_id)
+        if room_vnum not in area.room_vnums:
+            area.room_vnums.append(room_vnum)
+        return area
+
+    # ==========================================================================
+    # ALPHA
+    # ==========================================================================
+
+    def alpha_uid(self, zone_id: int) -> Optional[str]:
+        area = self.areas.get(zone_id)
+        return area.get_alpha_uid() if area else None
+
+    def set_alpha(self, zone_id: int, npc) -> Optional[str]:
+        """Coroa `npc`. Retorna o uid do Alpha anterior (se havia outro)."""
+        area = self.ensure(zone_id)
+        previous = area.get_alpha_uid()
+        if previous is not None:
+            self._alpha_zone.pop(previous, None)
+        area.set_alpha(npc)
+        self._alpha_zone[npc.uid] = zone_id
+        return previous if previous != npc.uid else None
+
+    def clear_alpha(self, zone_id: int):
+        area = self.areas.get(zone_id)
+        if area:
+            self._alpha_zone.pop(area.get_alpha_uid(), None)
+            area.clear_alpha()
+
+    # ==========================================================================
+    # RANKINGS
+    # ==========================================================================
+
+    def record(self, npc, zone_id: int):
+        """Chamar quando kills_count ou evolution_stage de um NPC mudar."""
+        kills = npc.progression.kills_count
+        stage = npc.progression.evolution_stage
+        if kills <= 0 and stage <= 0:
+            self.forget(npc.uid)
+            return
+        current = self._ranked_zone.get(npc.uid)
+        if current is not None and current != zone_id:
+            self._zone_boards(current)[0].remove(npc.uid)
+            self._zone_boards(current)[1].remove(npc.uid)
+        self._ranked_zone[npc.uid] = zone_id
+
+        zone_kills, zone_evolution = self._zone_boards(zone_id)
+        for board, score in ((self.kills, kills), (zone_kills, kills),
+                             (self.evolution, stage), (zone_evolution, stage)):
+            board.update(npc.uid, score)
+
+    def relocate(self, uid: str, room_vnum: int):
+        """NPC mudou de sala: só os ranqueados que trocam de zona custam algo."""
+        current = self._ranked_zone.get(uid)
+        if current is None:
+            return
+        zone_id, _ = VNum.parse(room_vnum)
+        if zone_id == current:
+            return
+        old_kills, old_evolution = self._zone_boards(current)
+        new_kills, new_evolution = self._zone_boards(zone_id)
+        new_kills.update(uid, old_kills.score(uid))
+        new_evolution.update(uid, old_evolution.score(uid))
+        old_kills.remove(uid)
+        old_evolution.remove(uid)
+        self._ranked_zone[uid] = zone_id
+
+    def forget(self, uid: str):
+        """NPC saiu do mundo: deixa os rankings (e o posto de Alpha, se tinha)."""
+        zone_id = self._ranked_zone.pop(uid, None)
+        if zone_id is not None:
+            self.kills.remove(uid)
+            self.evolution.remove(uid)
+            zone_kills, zone_evolution = self._zone_boards(zone_id)
+            zone_kills.remove(uid)
+            zone_evolution.remove(uid)
+        alpha_zone = self._alpha_zone.get(uid)
+        if alpha_zone is not None:
+            self.clear_alpha(alpha_zone)
+
+    def top_killers(self, k: int = 10, zone_id: Optional[int] = None) -> List[Tuple[str, int]]:
+        board = self.kills if zone_id is None else self.zone_kills.get(zone_id)
+        return board.top(k) if board else []
+
+    def top_evolved(self, k: int = 10, zone_id: Optional[int] = None) -> List[Tuple[str, int]]:
+        board = self.evolution if zone_id is None else self.zone_evolution.get(zone_id)
+        return board.top(k) if board else []
+
+    def _zone_boards(self, zone_id: int) -> Tuple[Leaderboard, Leaderboard]:
+        kills = self.zone_kills.get(zone_id)
+        if kills is None:
+            kills = self.zone_kills[zone_id] = Leaderboard()
+            self.zone_evolution[zone_id] = Leaderboard()
+        return kills, self.zone_evolution[zone_id]
@@ -13,6 +13,8 @@ from backend.game.commands.core import (
 from backend.game.commands.progression import cmd_remort
 from backend.game.commands.magic_commands import register_magic_commands
 from backend.game.commands.catalyst_commands import register_catalyst_commands
+from backend.game.commands.admin import register_admin_commands
+from backend.game.commands.ecology import register_ecology_commands
 
 logger = logging.getLogger(__name__)
 
@@ -67,6 +69,12 @@ class CommandHandler:
         register_magic_commands(self)
         register_catalyst_commands(self)
 
+        # --- ECOLOGIA E CLIMA ---
+        register_ecology_commands(self)
+
+        # --- ADMINISTRAÇÃO ---
+        register_admin_commands(self)
+
     async def process(self, player_id: int, command_text: str) -> str:
         # Nota: player_id vem como int do endpoint, mas no sistema interno usamos str para UUID
         # Se seu sistema usa int, converta aqui. Se usa str, ok.
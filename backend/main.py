@@ -13,6 +13,8 @@ from backend.db.base import get_db
 from backend.db.queries import get_player_by_id, save_player_state
 from backend.game.world.world_manager import WorldManager
 from backend.game.engines.time.manager import TimeEngine
+from backend.game.engines.time.calendar import CAL_DAWN, CAL_DUSK
+from backend.game.engines.time.weather import WeatherEngine
 from backend.game.engines.combat.manager import CombatManager
 from backend.handlers.command_handler import CommandHandler
 from backend.models.player import Player 
@@ -23,6 +25,11 @@ from backend.api.routes import router as api_router
 # [NOVO] Importações de IA e Ecologia
 from backend.ai.ollama_service import OllamaService
 from backend.game.engines.ecology.ecology_engine import EcologyEngine
+from backend.game.engines.movement.migration import MigrationEngine
+from backend.game.engines.ai.brain import BrainEngine
+from backend.game.engines.ai.nemesis import NemesisEngine
+from backend.game.engines.events.bus import EVENT_FLUSH_INTERVAL
+from backend.game.engines.lore.grimoire import GrimoireEngine, GrimoireIntegration
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
@@ -42,10 +49,24 @@ async def lifespan(app: FastAPI):
 
     # 3. WIRING: Conecta o Mundo ao Tempo
     time_engine.set_world_manager(world_manager)
+    world_manager.time = time_engine
+    time_engine.on_calendar(CAL_DAWN, world_manager.update_daylight)
+    time_engine.on_calendar(CAL_DUSK, world_manager.update_daylight)
+
+    # Lotes do barramento de eventos entregues a cada flush
+    time_engine.schedule_every(EVENT_FLUSH_INTERVAL, world_manager.events.flush, name="events:flush")
+
+    # Tempo por zona (muda nos eventos do calendário)
+    world_manager.weather = WeatherEngine(world_manager, time_engine)
     
     # 4. [NOVO] Instancia Motor Ecológico e Injeta no Mundo
-    # O Grimoire reside dentro do world_manager nas versões recentes, passamos ele se existir
-    grimoire_ref = getattr(world_manager, 'grimoire', None)
+    # Grimório: snapshot + journal reaplicados no boot, journal gravado a cada segundo
+    grimoire_ref = GrimoireEngine(world_manager, ollama_service, time_engine)
+    grimoire_ref.load_grimoire()
+    world_manager.grimoire = grimoire_ref
+    GrimoireIntegration.subscribe(world_manager.events, grimoire_ref)
+    # Nemesis: NPCs que matam jogadores ganham títulos e evoluem (via EntityKilled)
+    world_manager.nemesis = NemesisEngine(world_manager)
     
     ecology_engine = EcologyEngine(
         world_manager=world_manager,
@@ -56,13 +77,26 @@ async def lifespan(app: FastAPI):
     # Torna a ecologia acessível globalmente via world_manager
     world_manager.ecology = ecology_engine
     
-    # Registra o "Tick Ecológico" no relógio do tempo
-    time_engine.register_global_subscriber(ecology_engine.run_ecology_tick)
+    # O ciclo ecológico roda nos slots agendados pelo próprio motor (ecology:zones)
+
     logger.info("🌿 Ecossistema: SINCRONIZADO")
 
     # 5. Motores de Jogo
     combat_manager = CombatManager(world_manager)
     command_handler = CommandHandler(world_manager, combat_manager)
+
+    # Rounds de combate (e efeitos de status) a cada tick de combate (2s)
+    time_engine.register_combat_subscriber(combat_manager.process_round)
+
+    # Migração de NPCs pelo grafo de salas (zonas agregadas pelo LOD e NPCs em combate ficam de fora)
+    world_manager.migration = MigrationEngine(
+        world_manager, time_engine,
+        is_zone_blocked=ecology_engine.lod.is_aggregated,
+        is_busy=combat_manager.is_fighting,
+    )
+
+    # Decisões dos NPCs (agenda por heap: só acorda quem está vencido)
+    world_manager.brain = BrainEngine(world_manager, time_engine, combat_manager, ollama_service)
     
     # 6. Salva referências no estado da App
     app.state.world = world_manager
@@ -73,6 +107,9 @@ async def lifespan(app: FastAPI):
     
     # 7. Inicialização do Mundo (Carrega JSONs)
     await world_manager.start_up()
+    # Uids de NPC são novos a cada boot: conhecimento de quem não existe mais sai do grimório
+    if grimoire_ref.prune_absent_npcs():
+        await grimoire_ref.save_grimoire_async()
     
     # 8. Loop de Tempo
     asyncio.create_task(time_engine.start_loop())
@@ -86,6 +123,7 @@ async def lifespan(app: FastAPI):
     
     # SHUTDOWN
     logger.info("🛑 DESLIGANDO AETERNUS...")
+    grimoire_ref.save_grimoire()
     # Aqui poderia ter time_engine.stop() ou similar
 
 app = FastAPI(lifespan=lifespan)
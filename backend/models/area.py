@@ -3,6 +3,8 @@ from dataclasses import dataclass, field
 from typing import List, Optional, Dict
 from datetime import datetime
 
+MAX_THREAT_LEVEL = 10
+
 @dataclass
 class AreaEcology:
     """
@@ -20,6 +22,9 @@ class AreaEcology:
     # Balança Ecológica
     # Se predator_count cair muito -> prey_count explode
     population_count: int = 0
+
+    # Jogadores presentes (acelera o ciclo ecológico e define o LOD)
+    player_count: int = 0
     
     # Balança de tipos (opcional para futuro)
     population_balance: Dict[str, int] = field(default_factory=lambda: {
@@ -48,7 +53,13 @@ class Area:
         self.ecology.alpha_title = npc_instance.full_name
         self.ecology.alpha_since = datetime.utcnow()
         # Aumenta o nível de ameaça da zona
-        self.ecology.threat_level += 1
+        self.ecology.threat_level = min(MAX_THREAT_LEVEL, self.ecology.threat_level + 1)
+
+    def clear_alpha(self):
+        """O Alpha morreu ou sumiu: o posto fica vago (a ameaça acumulada permanece)."""
+        self.ecology.current_alpha_uid = None
+        self.ecology.alpha_title = None
+        self.ecology.alpha_since = None
 
     def get_alpha_uid(self):
         return self.ecology.current_alpha_uid
\ No newline at end of file
@@ -1,8 +1,10 @@
 # backend/models/character.py
 from dataclasses import dataclass, field
-from typing import Dict, List, Optional
+from typing import Any, Dict, List, Optional
 from datetime import datetime
 
+from backend.models.player import PlayerSettings
+
 @dataclass
 class ResourcePool:
     """Gerencia recursos vitais e flutuantes (HP, Mana, Sanidade)."""
@@ -112,6 +114,16 @@ class Character:
     flags: List[str] = field(default_factory=list)
     location_vnum: int = 1
 
+    # Conta: preferências de interface (combate compacto, modo breve) e papel de admin
+    settings: PlayerSettings = field(default_factory=PlayerSettings)
+    is_admin: bool = False
+
+    # Handle tipado atribuído pelo WorldManager (EntityRegistry)
+    handle: Optional[Any] = field(default=None, repr=False, compare=False)
+
+    def is_alive(self) -> bool:
+        return self.hp.current > 0
+
     def log_event(self, type: str, desc: str, importance: int = 1):
         """Registra um feito na tapeçaria desta vida."""
         self.life_journal.append(LifeEvent(datetime.utcnow(), type, desc, importance))
@@ -1,6 +1,6 @@
 # backend/models/npc.py
 from dataclasses import dataclass, field
-from typing import Dict, List, Optional
+from typing import Any, Dict, List, Optional
 import uuid
 
 # --- ESTRUTURAS DE BLUEPRINT ---
@@ -39,6 +39,9 @@ class NPCTemplate:
     # --- NOVO CAMPO: Lista de Ataques Naturais ---
     natural_attacks: List[NaturalAttack] = field(default_factory=list)
 
+    # Tags de habitat (casam com flags de sala: FOREST, CAVE...). Vazio = qualquer sala ao ar livre
+    habitat: List[str] = field(default_factory=list)
+
     @property
     def is_ancient(self) -> bool:
         return self.vnum <= 99999
@@ -83,7 +86,11 @@ class NPCInstance:
     progression: NPCProgression = field(default_factory=NPCProgression)
     kill_history: List[NPCKillRecord] = field(default_factory=list)
     room_vnum: int = 0
-    aggro_list: Dict[int, int] = field(default_factory=dict)
+    # Ódio acumulado: EntityHandle do agressor -> dano recebido
+    aggro_list: Dict[Any, int] = field(default_factory=dict)
+
+    # Handle tipado atribuído pelo WorldManager (EntityRegistry)
+    handle: Optional[Any] = field(default=None, repr=False, compare=False)
 
     @property
     def full_name(self) -> str:
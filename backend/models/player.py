@@ -1,8 +1,10 @@
 # backend/models/player.py
-from dataclasses import dataclass, field
-from typing import List, Dict, Optional
+from dataclasses import asdict, dataclass, field, fields
+from typing import Any, List, Dict, Optional
 from datetime import datetime
 
+from backend.config.server_config import ADMIN_PLAYERS
+
 @dataclass
 class PlayerSettings:
     """Preferências de interface e jogabilidade."""
@@ -12,6 +14,12 @@ class PlayerSettings:
     screen_width: int = 80         
     auto_loot: bool = False        
 
+    @classmethod
+    def from_dict(cls, data: Optional[Dict[str, Any]]) -> "PlayerSettings":
+        """Restaura do JSON salvo (chaves desconhecidas são ignoradas)."""
+        known = {f.name for f in fields(cls)}
+        return cls(**{k: v for k, v in (data or {}).items() if k in known})
+
 @dataclass
 class Player:
     """
@@ -47,6 +55,12 @@ class Player:
     created_at: datetime = field(default_factory=datetime.now)
     last_login: datetime = field(default_factory=datetime.now)
 
+    # Handle tipado atribuído pelo WorldManager (EntityRegistry)
+    handle: Optional[Any] = field(default=None, repr=False, compare=False)
+
+    def is_alive(self) -> bool:
+        return not self.is_dead and self.hp > 0
+
     @classmethod
     def from_orm(cls, db_player) -> "Player":
         """
@@ -57,6 +71,7 @@ class Player:
         return cls(
             id=str(db_player.id),
             name=db_player.name, # Mapeia direto do DB (que já é 'name')
+            is_admin=db_player.name.lower() in ADMIN_PLAYERS,
             
             race=db_player.race,
             player_class=db_player.player_class,
@@ -72,6 +87,7 @@ class Player:
             
             inventory=db_player.inventory or [],
             equipment=db_player.equipment or {},
+            settings=PlayerSettings.from_dict(attrs.get("settings")),
             
             is_dead=db_player.is_dead,
             created_at=db_player.created_at or datetime.now(),
@@ -84,10 +100,7 @@ class Player:
             "max_hp": self.max_hp,
             "mana": self.mana,
             "max_mana": self.max_mana,
-            "settings": {
-                "brief_mode": self.settings.brief_mode,
-                "auto_loot": self.settings.auto_loot
-            }
+            "settings": asdict(self.settings)
         }
 
     def __repr__(self):
@@ -49,6 +49,9 @@ class Room:
     npcs_here: List[str] = field(default_factory=list)   # Lista de UUIDs de NPCs
     players_here: List[int] = field(default_factory=list) # Lista de IDs de Players
 
+    # Pontos de spawn declarados nos dados: template VNUM -> peso
+    spawns: Dict[int, float] = field(default_factory=dict)
+
     def has_flag(self, flag: str) -> bool:
         """Verifica se a sala possui uma característica específica."""
         return flag.upper() in [f.upper() for f in self.flags]
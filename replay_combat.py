@@ -0,0 +1,121 @@
+"""
+RE-SIMULADOR DE REPLAYS DE COMBATE
+
+Lê um arquivo .arp gravado pelo CombatManager (COMBAT_REPLAY=true), recria os
+participantes a partir dos instantâneos e roda a sessão com a mesma semente,
+conferindo o CRC de cada round contra o original. Uma divergência indica que
+o código ou os dados mudaram desde a gravação.
+
+Serve para perfilar sessões patológicas da produção offline, sem anexar um
+profiler ao servidor vivo.
+
+Uso:
+    python replay_combat.py replays/combat_100001_1a2b3c4d5e6f7a8b.arp
+    python replay_combat.py replays/*.arp --repeat 200 --profile
+"""
+import argparse
+import asyncio
+import cProfile
+import logging
+import os
+import pstats
+import sys
+import time
+from typing import Dict, Optional
+
+# Configura path
+sys.path.append(os.getcwd())
+
+from backend.game.world.world_manager import WorldManager
+from backend.game.engines.combat.manager import CombatSession
+from backend.game.engines.combat.replay import CombatReplay, load_replay, restore_entity, state_digest
+from simulate_battle import HeadlessCombatManager
+
+logger = logging.getLogger("ReplayCombate")
+
+
+def build_world() -> WorldManager:
+    world = WorldManager()
+    world.factory.load_all_data()
+    world.rooms = world.factory._room_templates
+    world._init_zones()
+    return world
+
+
+async def run_replay(replay: CombatReplay, world: Optional[WorldManager] = None) -> Optional[int]:
+    """
+    Re-simula a sessão. Retorna o primeiro round divergente, ou None se o
+    replay reproduziu a luta bit a bit.
+    """
+    world = world or build_world()
+    world.rng.reseed(replay.root_seed)
+    combat = HeadlessCombatManager(world)
+    combat.replay_enabled = False
+
+    session = CombatSession(replay.room_vnum, seed=replay.session_seed)
+    combat.sessions[replay.room_vnum] = session
+
+    ordinals: Dict[int, object] = {}
+    for round_no in range(replay.rounds):
+        for joined_at, ordinal, _kind, snapshot in replay.entities:
+            if joined_at == round_no:
+                ordinals[ordinal] = restore_entity(world, snapshot, combat.effects)
+        for engaged_at, att, dfn in replay.engagements:
+            if engaged_at == round_no:
+                session.add_participant(ordinals[att].handle, ordinals[dfn].handle)
+        if replay.room_vnum not in combat.sessions:
+            combat.sessions[replay.room_vnum] = session
+
+        await combat.process_round()
+
+        expected_crc, _events = replay.checkpoints.get(round_no + 1, (None, 0))
+        entities = [ordinals[i] for i in sorted(ordinals)]
+        if expected_crc is not None and state_digest(entities, session.round_log) != expected_crc:
+            return round_no + 1
+
+        # Deixa o _handle_death (criado via create_task) concluir, como no servidor
+        await asyncio.sleep(0)
+    return None
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Re-simula replays de combate gravados")
+    parser.add_argument("paths", nargs="+", help="Arquivos .arp")
+    parser.add_argument("--repeat", type=int, default=1, help="Re-simula N vezes (para medir/perfilar)")
+    parser.add_argument("--profile", action="store_true", help="Roda sob cProfile e mostra os 25 mais caros")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.WARNING, format='%(message)s')
+
+    profiler = cProfile.Profile() if args.profile else None
+    failures = 0
+    for path in args.paths:
+        replay = load_replay(path)
+        print(f"🎞️ {path}: sala {replay.room_vnum}, semente {replay.session_seed:016x}, "
+              f"{len(replay.entities)} entidades, {replay.rounds} rounds")
+
+        elapsed = 0.0
+        diverged = None
+        for _ in range(args.repeat):
+            world = build_world()
+            start = time.perf_counter()
+            if profiler: profiler.enable()
+            diverged = asyncio.run(run_replay(replay, world))
+            if profiler: profiler.disable()
+            elapsed += time.perf_counter() - start
+            if diverged is not None:
+                break
+
+        if diverged is None:
+            print(f"   ✅ Reproduzido bit a bit ({elapsed / args.repeat * 1000:.2f} ms por execução)")
+        else:
+            failures += 1
+            print(f"   ❌ Divergência no round {diverged}")
+
+    if profiler:
+        pstats.Stats(profiler).sort_stats("cumulative").print_stats(25)
+    sys.exit(1 if failures else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,377 @@
+"""
+SIMULADOR DE COMBATE HEADLESS (Monte Carlo)
+
+Roda duelos semeados (Classe x Template de NPC x Nível) usando o CombatManager,
+o CombatFormulas e o LevelingEngine reais, espalhados por um pool de processos.
+
+Relata taxa de vitória, distribuição do tempo-até-matar, XP/hora, taxas de
+Fatality e de membros decepados, e a vazão em lutas por segundo — o que faz
+dele também o benchmark de regressão do caminho quente do combate.
+
+Uso:
+    python simulate_battle.py --fights 1000000 --workers 8 --seed 42
+    python simulate_battle.py --classes warrior,mage --npcs 100001 --levels 1,5 --json bench.json
+"""
+import argparse
+import asyncio
+import json
+import logging
+import os
+import random
+import sys
+import time
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Tuple
+
+# Configura path
+sys.path.append(os.getcwd())
+
+from backend.config.game_config import CLASS_STATS
+from backend.game.world.world_manager import WorldManager
+from backend.game.engines.combat.manager import CombatManager, CombatSession
+from backend.game.engines.combat.narration import EV_FATALITY
+from backend.game.engines.leveling.leveling import LevelingEngine
+from backend.models.character import Character, Attribute, ResourcePool
+
+logger = logging.getLogger("SimulacaoCombate")
+
+# Intervalo do tick de combate do TimeEngine (segundos reais por round)
+ROUND_SECONDS = 2.0
+ARENA_VNUM = 100001
+CHUNK_SIZE = 2000
+
+ATTRIBUTE_NAMES = {
+    "strength": "Força", "dexterity": "Destreza", "constitution": "Constituição",
+    "intelligence": "Inteligência", "wisdom": "Sabedoria", "charisma": "Carisma",
+    "luck": "Sorte", "perception": "Percepção", "willpower": "Vontade"
+}
+
+# ==============================================================================
+# ESTATÍSTICAS
+# ==============================================================================
+
+@dataclass
+class CellStats:
+    """Resultado agregado de uma célula da grade (classe, npc, nível)."""
+    class_id: str
+    npc_vnum: int
+    level: int
+    fights: int = 0
+    wins: int = 0
+    losses: int = 0
+    timeouts: int = 0
+    rounds_total: int = 0
+    xp_total: int = 0
+    fatalities: int = 0
+    severs: int = 0
+    ttk_rounds: Counter = field(default_factory=Counter)  # rounds -> vitórias
+
+    def merge(self, other: "CellStats"):
+        self.fights += other.fights
+        self.wins += other.wins
+        self.losses += other.losses
+        self.timeouts += other.timeouts
+        self.rounds_total += other.rounds_total
+        self.xp_total += other.xp_total
+        self.fatalities += other.fatalities
+        self.severs += other.severs
+        self.ttk_rounds.update(other.ttk_rounds)
+
+    def ttk_percentile(self, pct: float) -> Optional[float]:
+        """Percentil do tempo-até-matar (segundos), calculado sobre o histograma."""
+        total = sum(self.ttk_rounds.values())
+        if not total:
+            return None
+        threshold = total * pct
+        acc = 0
+        for rounds in sorted(self.ttk_rounds):
+            acc += self.ttk_rounds[rounds]
+            if acc >= threshold:
+                return rounds * ROUND_SECONDS
+        return max(self.ttk_rounds) * ROUND_SECONDS
+
+    @property
+    def xp_per_hour(self) -> float:
+        hours = (self.rounds_total * ROUND_SECONDS) / 3600
+        return self.xp_total / hours if hours else 0.0
+
+    def to_dict(self) -> Dict:
+        fights = self.fights or 1
+        return {
+            "class_id": self.class_id,
+            "npc_vnum": self.npc_vnum,
+            "level": self.level,
+            "fights": self.fights,
+            "win_rate": self.wins / fights,
+            "loss_rate": self.losses / fights,
+            "timeout_rate": self.timeouts / fights,
+            "ttk_p50": self.ttk_percentile(0.50),
+            "ttk_p90": self.ttk_percentile(0.90),
+            "ttk_p99": self.ttk_percentile(0.99),
+            "xp_per_hour": self.xp_per_hour,
+            "fatality_rate": self.fatalities / fights,
+            "sever_rate": self.severs / fights,
+        }
+
+# ==============================================================================
+# MUNDO HEADLESS (Um por processo)
+# ==============================================================================
+
+class HeadlessCombatManager(CombatManager):
+    """CombatManager real, sem ninguém para ouvir os gritos."""
+
+    def _broadcast_to_room(self, room_vnum: int, message: str):
+        pass
+
+    def _send_to_player(self, player, message: str):
+        pass
+
+_WORLD: Optional[WorldManager] = None
+_COMBAT: Optional[HeadlessCombatManager] = None
+
+def _init_worker():
+    """Carrega os blueprints uma única vez por processo."""
+    global _WORLD, _COMBAT
+    logging.getLogger().setLevel(logging.WARNING)
+    world = WorldManager()
+    world.factory.load_all_data()
+    world.rooms = world.factory._room_templates
+    world._init_zones()
+    _WORLD = world
+    _COMBAT = HeadlessCombatManager(world)
+
+def _load_class_stats() -> Dict[str, Dict[str, int]]:
+    """Classes do balanceamento + classes definidas em data/classes.json."""
+    stats = {k: dict(v) for k, v in CLASS_STATS.items()}
+    path = os.path.join("data", "classes.json")
+    if os.path.exists(path):
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                for class_id, data in json.load(f).items():
+                    stats[class_id] = data.get("attributes", {})
+        except Exception as e:
+            logger.warning(f"Falha ao ler classes.json: {e}")
+    return stats
+
+def build_player(class_id: str, level: int, attrs: Dict[str, int], player_id: int) -> Character:
+    """Monta um personagem de nível N como se tivesse subido nível a nível."""
+    attributes = {
+        key: Attribute(label, attrs.get(key, 10))
+        for key, label in ATTRIBUTE_NAMES.items()
+    }
+    con = attributes["constitution"].total
+    inte = attributes["intelligence"].total
+    # Mesma progressão do LevelingEngine.award_xp
+    max_hp = 100 + (level - 1) * (10 + int(con / 2))
+    max_mana = 50 + (level - 1) * (5 + int(inte / 2))
+
+    return Character(
+        id=player_id,
+        player_id=player_id,
+        name=f"Sim-{class_id}",
+        race_id="human",
+        class_id=class_id,
+        level=level,
+        hp=ResourcePool(max_hp, max_hp, 1.0),
+        mana=ResourcePool(max_mana, max_mana, 0.5),
+        attributes=attributes,
+        location_vnum=ARENA_VNUM
+    )
+
+def _total_xp(level: int, experience: int, remort: int = 0) -> int:
+    """XP absoluto acumulado (desfaz o desconto dos level ups)."""
+    return experience + sum(LevelingEngine.get_xp_required(l, remort) for l in range(1, level))
+
+async def _run_duel(world: WorldManager, combat: HeadlessCombatManager, class_id: str,
+                    attrs: Dict[str, int], npc_vnum: int, level: int,
+                    weapon_vnum: Optional[int], max_rounds: int, stats: CellStats):
+    player = build_player(class_id, level, attrs, player_id=1)
+    if weapon_vnum:
+        item = world.factory.create_item_instance(weapon_vnum)
+        if item:
+            world.active_items[item.uid] = item
+            player.equipment["main_hand"] = item.uid
+    world.add_player(player)
+
+    npc = world.spawn_npc(npc_vnum, ARENA_VNUM)
+    if not npc:
+        world.remove_player(player.id)
+        raise ValueError(f"Template de NPC {npc_vnum} inexistente.")
+
+    xp_before = _total_xp(player.level, player.experience)
+
+    session = CombatSession(ARENA_VNUM)
+    session.add_participant(combat._get_id(player), combat._get_id(npc))
+    combat.sessions[ARENA_VNUM] = session
+
+    rounds = 0
+    fatalities = 0
+    while rounds < max_rounds and combat._is_alive(player) and combat._is_alive(npc):
+        await combat.process_round()
+        rounds += 1
+        for event in session.round_log:
+            if event.kind == EV_FATALITY:
+                fatalities += 1
+
+    # Deixa o _handle_death (criado via create_task) concluir
+    await asyncio.sleep(0)
+
+    stats.fights += 1
+    stats.rounds_total += rounds
+    stats.fatalities += fatalities
+    stats.severs += sum(1 for part in npc.anatomy_state.values() if part.is_severed)
+    stats.xp_total += _total_xp(player.level, player.experience) - xp_before
+
+    if not combat._is_alive(npc):
+        stats.wins += 1
+        stats.ttk_rounds[rounds] += 1
+    elif not combat._is_alive(player):
+        stats.losses += 1
+    else:
+        stats.timeouts += 1
+
+    # Limpeza da arena
+    combat.sessions.clear()
+    combat.effects.clear(player.handle)
+    combat.effects.clear(npc.handle)
+    world.kill_npc(npc.uid)
+    world.remove_player(player.id)
+    if player.equipment.get("main_hand"):
+        world.active_items.pop(player.equipment["main_hand"], None)
+
+def run_chunk(task: Tuple) -> CellStats:
+    """Executa um lote de duelos semeados de uma célula (dentro do worker)."""
+    class_id, attrs, npc_vnum, level, weapon_vnum, fights, seed, max_rounds = task
+    if _WORLD is None:
+        _init_worker()
+
+    stats = CellStats(class_id, npc_vnum, level)
+
+    async def _batch():
+        for i in range(fights):
+            random.seed(seed + i)
+            await _run_duel(_WORLD, _COMBAT, class_id, attrs, npc_vnum, level,
+                            weapon_vnum, max_rounds, stats)
+
+    asyncio.run(_batch())
+    return stats
+
+# ==============================================================================
+# ORQUESTRAÇÃO
+# ==============================================================================
+
+def _parse_list(raw: Optional[str], cast=str) -> Optional[List]:
+    if not raw:
+        return None
+    return [cast(x.strip()) for x in raw.split(",") if x.strip()]
+
+def build_tasks(args) -> Tuple[List[Tuple], List[Tuple[str, int, int]]]:
+    class_stats = _load_class_stats()
+    classes = _parse_list(args.classes) or sorted(class_stats.keys())
+
+    if args.npcs:
+        npcs = _parse_list(args.npcs, int)
+    else:
+        _init_worker()
+        npcs = sorted(_WORLD.factory._npc_templates.keys())
+    levels = _parse_list(args.levels, int) or [1, 5, 10]
+
+    cells = [(c, n, l) for c in classes for n in npcs for l in levels]
+    if not cells:
+        return [], []
+
+    per_cell = max(1, args.fights // len(cells))
+    tasks = []
+    for cell_idx, (class_id, npc_vnum, level) in enumerate(cells):
+        attrs = class_stats.get(class_id, {})
+        remaining = per_cell
+        chunk_idx = 0
+        while remaining > 0:
+            n = min(CHUNK_SIZE, remaining)
+            seed = args.seed * 1_000_003 + cell_idx * 10_000_019 + chunk_idx * CHUNK_SIZE
+            tasks.append((class_id, attrs, npc_vnum, level, args.weapon, n, seed, args.max_rounds))
+            remaining -= n
+            chunk_idx += 1
+    return tasks, cells
+
+def report(results: Dict[Tuple[str, int, int], CellStats], elapsed: float):
+    total_fights = sum(s.fights for s in results.values())
+    print("\n⚔️  --- RESULTADOS DA SIMULAÇÃO DE COMBATE --- ⚔️\n")
+    header = f"{'Classe':<10} {'NPC':>7} {'Nv':>3} {'Lutas':>8} {'Vitória':>8} {'TTK p50':>8} {'p90':>7} {'p99':>7} {'XP/h':>10} {'Fatal.':>7} {'Decep.':>7}"
+    print(header)
+    print("-" * len(header))
+
+    def fmt(v):
+        return f"{v:.0f}s" if v is not None else "-"
+
+    for key in sorted(results):
+        s = results[key].to_dict()
+        print(
+            f"{s['class_id']:<10} {s['npc_vnum']:>7} {s['level']:>3} {s['fights']:>8} "
+            f"{s['win_rate']*100:>7.1f}% {fmt(s['ttk_p50']):>8} {fmt(s['ttk_p90']):>7} {fmt(s['ttk_p99']):>7} "
+            f"{s['xp_per_hour']:>10.0f} {s['fatality_rate']*100:>6.2f}% {s['sever_rate']*100:>6.2f}%"
+        )
+
+    rate = total_fights / elapsed if elapsed else 0.0
+    print("-" * len(header))
+    print(f"Total: {total_fights} lutas em {elapsed:.2f}s -> {rate:,.0f} lutas/s\n")
+    return rate
+
+def main():
+    parser = argparse.ArgumentParser(description="Simulação de Combate Headless (Monte Carlo)")
+    parser.add_argument("--fights", type=int, default=100_000, help="Total de duelos (dividido pela grade)")
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1, help="Processos no pool")
+    parser.add_argument("--seed", type=int, default=42, help="Semente mestre")
+    parser.add_argument("--classes", help="Lista de classes (ex: warrior,mage)")
+    parser.add_argument("--npcs", help="Lista de VNUMs de NPC (ex: 100001,100002)")
+    parser.add_argument("--levels", help="Lista de níveis do jogador (ex: 1,5,10)")
+    parser.add_argument("--weapon", type=int, default=None, help="VNUM da arma equipada (padrão: desarmado)")
+    parser.add_argument("--max-rounds", type=int, default=500, help="Rounds antes de declarar empate")
+    parser.add_argument("--json", dest="json_path", help="Salva os resultados (benchmark) em JSON")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.WARNING, format='%(message)s')
+
+    tasks, cells = build_tasks(args)
+    if not tasks:
+        print("Nada a simular: grade vazia (verifique classes/NPCs carregados).")
+        return
+
+    print(f"🎲 {len(cells)} células, {sum(t[5] for t in tasks)} duelos, {args.workers} processos...")
+
+    results: Dict[Tuple[str, int, int], CellStats] = {}
+    start = time.perf_counter()
+    if args.workers <= 1:
+        chunks = map(run_chunk, tasks)
+        for chunk in chunks:
+            _merge(results, chunk)
+    else:
+        with ProcessPoolExecutor(max_workers=args.workers, initializer=_init_worker) as pool:
+            for chunk in pool.map(run_chunk, tasks, chunksize=1):
+                _merge(results, chunk)
+    elapsed = time.perf_counter() - start
+
+    rate = report(results, elapsed)
+
+    if args.json_path:
+        payload = {
+            "seed": args.seed,
+            "workers": args.workers,
+            "elapsed_seconds": elapsed,
+            "fights_per_second": rate,
+            "cells": [results[k].to_dict() for k in sorted(results)]
+        }
+        with open(args.json_path, "w", encoding="utf-8") as f:
+            json.dump(payload, f, indent=2, ensure_ascii=False)
+        print(f"📊 Benchmark salvo em {args.json_path}")
+
+def _merge(results: Dict, chunk: CellStats):
+    key = (chunk.class_id, chunk.npc_vnum, chunk.level)
+    if key not in results:
+        results[key] = CellStats(*key)
+    results[key].merge(chunk)
+
+if __name__ == "__main__":
+    main()
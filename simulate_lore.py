@@ -37,8 +37,7 @@ async def run_simulation():
         # Dando Cérebro ao Bardo (Skill 100)
         world.grimoire.npc_memories[bardo.uid] = NPCMemory(
             npc_uid=bardo.uid,
-            storytelling_skill=100, 
-            known_legends=[]
+            storytelling_skill=100
         )
         print(f"✨ NPC CRIADO: {bardo.name} (Skill de História: 100/100)")
     else:
@@ -71,9 +70,7 @@ async def run_simulation():
     lenda = legends[0]
 
     # 5. O Bardo Aprende
-    memoria_bardo = world.grimoire.npc_memories[bardo.uid]
-    memoria_bardo.known_legends.append(lenda.id)
-    lenda.believers.append(bardo.uid)
+    world.grimoire.teach(bardo.uid, lenda.id)
     
     # 6. O Bardo Conta
     print(f"\n🎤 OUVINDO {bardo.name.upper()}:")
@@ -0,0 +1,38 @@
+# tests/test_admin_commands.py
+"""Comandos de admin exigem o papel de admin (nunca o modo debug)."""
+import asyncio
+from types import SimpleNamespace
+
+from backend.game.commands import admin
+from backend.models import player as player_module
+from backend.models.character import Character
+from backend.models.player import Player
+
+
+def _db_player(name: str):
+    return SimpleNamespace(
+        id="p1", name=name, race="humano", player_class="novice", level=1, experience=0,
+        current_room_vnum="10001", attributes={}, inventory=[], equipment={}, is_dead=False,
+        created_at=None, updated_at=None,
+    )
+
+
+def _ctx(player):
+    report = SimpleNamespace(format_report=lambda: "RELATORIO")
+    world = SimpleNamespace(time=SimpleNamespace(metrics=report), events=report)
+    return SimpleNamespace(player=player, world=world)
+
+
+def test_regular_character_cannot_run_admin_commands():
+    character = Character(id=1, player_id=1, name="Ana", race_id="human", class_id="warrior")
+    assert asyncio.run(admin.cmd_lag(_ctx(character))) == "Comando desconhecido."
+    assert asyncio.run(admin.cmd_eventos(_ctx(character))) == "Comando desconhecido."
+
+
+def test_admin_role_comes_from_admin_players(monkeypatch):
+    monkeypatch.setattr(player_module, "ADMIN_PLAYERS", {"ana"})
+    ana = Player.from_orm(_db_player("Ana"))
+    bia = Player.from_orm(_db_player("Bia"))
+    assert ana.is_admin and not bia.is_admin
+    assert asyncio.run(admin.cmd_lag(_ctx(ana))) == "RELATORIO"
+    assert asyncio.run(admin.cmd_lag(_ctx(bia))) == "Comando desconhecido."
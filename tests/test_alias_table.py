@@ -0,0 +1,41 @@
+# tests/test_alias_table.py
+"""Tabela de alias (Vose): distribuição empírica segue os pesos."""
+import random
+from collections import Counter
+
+import pytest
+
+from backend.game.utils.alias_table import AliasTable
+
+
+@pytest.mark.parametrize("weights", [
+    [1, 2, 3, 4],
+    [0.5, 10, 0.1, 3, 3, 7.4],
+    [1] * 9,
+    [100, 1],
+])
+def test_empirical_distribution_matches_weights(weights):
+    items = [f"i{n}" for n in range(len(weights))]
+    table = AliasTable(items, weights)
+    rng = random.Random(42)
+    draws = 200_000
+    counts = Counter(table.sample(rng) for _ in range(draws))
+
+    total = sum(weights)
+    for item, weight in zip(items, weights):
+        expected = weight / total
+        assert abs(counts[item] / draws - expected) < 0.01, (item, counts[item] / draws, expected)
+
+
+def test_zero_weights_never_drawn():
+    table = AliasTable(["a", "b", "c"], [0, 1, 0])
+    rng = random.Random(1)
+    assert {table.sample(rng) for _ in range(1000)} == {"b"}
+    assert len(table) == 1
+
+
+def test_invalid_weights_rejected():
+    with pytest.raises(ValueError):
+        AliasTable(["a"], [0])
+    with pytest.raises(ValueError):
+        AliasTable(["a", "b"], [1])
@@ -0,0 +1,65 @@
+# tests/test_combat_settings.py
+"""Preferências do jogador (PlayerSettings) chegam à renderização do round."""
+from types import SimpleNamespace
+
+from backend.game.engines.combat.manager import CombatManager, CombatSession
+from backend.game.engines.combat.narration import EV_HIT, EV_MISS, NarrationEvent, render_round
+from backend.game.world.world_manager import WorldManager
+from backend.models.character import Character
+from backend.models.player import Player, PlayerSettings
+from backend.models.room import Room
+
+ROOM = 100001
+
+
+def _world():
+    world = WorldManager()
+    world.rooms = {ROOM: Room(vnum=ROOM, zone_id=1, title="Arena", description_day="", exits={})}
+    world._init_zones()
+    return world
+
+
+def _character(pid: int, name: str, settings: PlayerSettings) -> Character:
+    return Character(id=pid, player_id=pid, name=name, race_id="human", class_id="warrior",
+                     location_vnum=ROOM, settings=settings)
+
+
+def test_from_orm_restores_saved_settings():
+    db_player = SimpleNamespace(
+        id="p1", name="Ana", race="humano", player_class="novice", level=1, experience=0,
+        current_room_vnum="10001", inventory=[], equipment={}, is_dead=False,
+        created_at=None, updated_at=None,
+        attributes={"hp": 100, "settings": {"compact_combat": True, "brief_mode": True, "obsoleto": 1}},
+    )
+    player = Player.from_orm(db_player)
+    assert player.settings.compact_combat and player.settings.brief_mode
+    assert player.get_stats_dict()["settings"]["compact_combat"] is True
+
+
+def test_round_rendered_with_each_recipient_settings():
+    world = _world()
+    compact = _character(1, "Ana", PlayerSettings(compact_combat=True))
+    brief = _character(2, "Bia", PlayerSettings(brief_mode=True))
+    plain = _character(3, "Caio", PlayerSettings())
+    for player in (compact, brief, plain):
+        world.add_player(player)
+
+    combat = CombatManager(world)
+    sent = {}
+    combat._send_to_player = lambda player, text: sent.__setitem__(player.name, text)
+
+    session = CombatSession(ROOM)
+    session.round_log.append(NarrationEvent(EV_HIT, compact.handle, plain.handle, "Ana", "Caio",
+                                            verb="corta", part="o braço", damage=12))
+    session.round_log.append(NarrationEvent(EV_MISS, compact.handle, plain.handle, "Ana", "Caio",
+                                            weapon="espada"))
+    combat._deliver_round(session)
+
+    log = session.round_log
+    assert sent["Ana"] == render_round(log, compact.handle, compact=True)
+    assert sent["Bia"] == render_round(log, brief.handle, brief=True)
+    assert sent["Caio"] == render_round(log, plain.handle)
+    # Estilos diferentes de fato: compacto != completo; breve esconde o erro alheio
+    assert sent["Ana"] != render_round(log, compact.handle)
+    assert len(sent["Bia"].splitlines()) == 1
+    assert len(sent["Caio"].splitlines()) == 2
@@ -0,0 +1,112 @@
+# tests/test_journal.py
+"""Journal append-only: linhas rasgadas/corrompidas, compactação e replay."""
+import asyncio
+
+from backend.game.utils.journal import Journal, encode_record
+from backend.game.utils.persistence import JsonStore
+
+
+class Counter:
+    """Estado mínimo: 'add' não é idempotente, então replay em dobro aparece."""
+
+    def __init__(self, tmp_path):
+        self.values = {}
+        self.journal = Journal(tmp_path / "state.journal", JsonStore(tmp_path / "state.json"),
+                               self.snapshot, self.apply)
+
+    def add(self, key, amount):
+        self.values[key] = self.values.get(key, 0) + amount
+        self.journal.append("add", key=key, amount=amount)
+
+    def snapshot(self):
+        return {"values": dict(self.values)}
+
+    def apply(self, record):
+        if record["op"] == "add":
+            self.add(record["key"], record["amount"])
+
+    def load(self):
+        state = self.journal.load()
+        if state:
+            self.values = dict(state["values"])
+        return self.journal.replay()
+
+
+def _reload(tmp_path):
+    fresh = Counter(tmp_path)
+    fresh.load()
+    return fresh
+
+
+def test_replay_restores_state(tmp_path):
+    c = Counter(tmp_path)
+    for i in range(50):
+        c.add(f"k{i % 5}", i)
+    c.journal.flush_sync()
+    fresh = _reload(tmp_path)
+    assert fresh.values == c.values
+    assert fresh.journal.seq == c.journal.seq
+
+
+def test_torn_last_line_is_skipped_and_cut(tmp_path):
+    c = Counter(tmp_path)
+    c.add("a", 1)
+    c.add("b", 2)
+    c.journal.flush_sync()
+    good_size = c.journal.path.stat().st_size
+    with open(c.journal.path, "ab") as f:
+        f.write(encode_record({"s": 3, "op": "add", "key": "a", "amount": 100})[:-7])
+
+    fresh = _reload(tmp_path)
+    assert fresh.values == {"a": 1, "b": 2}
+    assert fresh.journal.path.stat().st_size == good_size
+
+    # O que vier depois do corte continua legível
+    fresh.add("c", 3)
+    fresh.journal.flush_sync()
+    assert _reload(tmp_path).values == {"a": 1, "b": 2, "c": 3}
+
+
+def test_bad_crc_last_line_is_skipped(tmp_path):
+    c = Counter(tmp_path)
+    c.add("a", 1)
+    c.journal.flush_sync()
+    line = encode_record({"s": 2, "op": "add", "key": "a", "amount": 100})
+    corrupted = line[:9] + line[9:].replace(b"100", b"999")
+    with open(c.journal.path, "ab") as f:
+        f.write(corrupted)
+    assert _reload(tmp_path).values == {"a": 1}
+
+
+def test_replay_after_compaction_matches_state(tmp_path):
+    c = Counter(tmp_path)
+    for i in range(20):
+        c.add("x", i)
+
+    async def compact_while_writing():
+        async def writer():
+            for i in range(10):
+                c.add("y", i)
+                await asyncio.sleep(0)
+        await asyncio.gather(c.journal.compact(), writer())
+        await c.journal.flush()
+
+    asyncio.run(compact_while_writing())
+    c.add("z", 7)
+    c.journal.flush_sync()
+
+    fresh = _reload(tmp_path)
+    assert fresh.values == c.values == {"x": sum(range(20)), "y": sum(range(10)), "z": 7}
+
+
+def test_crash_between_snapshot_and_truncate_does_not_double_apply(tmp_path):
+    c = Counter(tmp_path)
+    for i in range(10):
+        c.add("x", 1)
+    c.journal.flush_sync()
+    # Snapshot gravado, journal ainda com os mesmos registros (truncate não aconteceu)
+    c.journal.store.save(c.journal._snapshot())
+    c.add("x", 1)
+    c.journal.flush_sync()
+
+    assert _reload(tmp_path).values == {"x": 11}
@@ -0,0 +1,48 @@
+# tests/test_legend_diffusion.py
+"""Difusão de lendas: a volta pela fila de salas atravessa ticks sem pular salas."""
+from types import SimpleNamespace
+
+from backend.game.engines.lore.diffusion import LegendDiffusion
+from backend.game.engines.lore.knowledge import LegendKnowledge
+from backend.game.utils.rng import RngStreams
+
+ROOMS = 10
+
+
+def _setup():
+    knowledge = LegendKnowledge()
+    rooms = {
+        vnum: SimpleNamespace(vnum=vnum, title=f"sala {vnum}", npcs_here=[f"a{vnum}", f"b{vnum}"])
+        for vnum in range(ROOMS)
+    }
+    world = SimpleNamespace(rooms=rooms, populated_rooms=dict.fromkeys(rooms), rng=RngStreams(7))
+    memories = {uid: SimpleNamespace(storytelling_skill=100)
+                for room in rooms.values() for uid in room.npcs_here}
+    grimoire = SimpleNamespace(knowledge=knowledge, npc_memories=memories,
+                               teach=lambda uid, legend_id: knowledge.learn(uid, legend_id))
+    return knowledge, LegendDiffusion(grimoire, world)
+
+
+def test_rooms_before_the_cursor_are_reached_in_the_same_tick():
+    knowledge, diffusion = _setup()
+    knowledge.learn("a0", "L")          # Só a sala 0 tem novidade
+    diffusion._queue = list(range(ROOMS))
+    diffusion._cursor = ROOMS // 2      # Tick começa no meio da volta, depois da sala 0
+
+    assert diffusion.tick() == 1
+    assert knowledge.knows("b0", "L")
+
+
+def test_quiet_tick_visits_each_room_once_then_stops():
+    knowledge, diffusion = _setup()
+    for room in diffusion.world.rooms.values():
+        for uid in room.npcs_here:
+            knowledge.learn(uid, "L")    # Todos já sabem: nenhuma novidade
+    diffusion._queue = list(range(ROOMS))
+    diffusion._cursor = 3
+    assert diffusion.tick() == 0
+    assert diffusion._cursor == 3        # Uma volta exata, a partir de onde parou
+
+    knowledge.learn("a2", "M")           # Novidade logo antes do cursor
+    assert diffusion.tick() == 1
+    assert knowledge.knows("b2", "M")
@@ -0,0 +1,72 @@
+# tests/test_lod_lore.py
+"""LOD: colapsar e rematerializar uma zona não apaga as lendas que seus NPCs conheciam."""
+from types import SimpleNamespace
+
+from backend.game.engines.ecology.lod import PopulationLOD
+from backend.game.engines.lore.grimoire import GrimoireEngine
+from backend.game.utils.rng import RngStreams
+from backend.game.world.world_manager import WorldManager
+from backend.models.npc import NPCTemplate
+from backend.models.room import Room
+
+ZONE = 1
+RATO, LOBO = 100001, 100002
+
+
+def _setup(monkeypatch, tmp_path):
+    monkeypatch.chdir(tmp_path)    # Journal do grimório fora do data/ do repositório
+    world = WorldManager()
+    world.rng = RngStreams(7)
+    for vnum in (RATO, LOBO):
+        world.factory._npc_templates[vnum] = NPCTemplate(
+            vnum=vnum, name=f"npc {vnum}", description="", level=1, base_hp=10,
+            body_type="quadruped", sensory_visual="",
+        )
+    for vnum in (100001, 100002):
+        world.rooms[vnum] = Room(vnum=vnum, zone_id=ZONE, title=f"sala {vnum}", description_day="")
+        world.zones.add_room(vnum)
+    grimoire = world.grimoire = GrimoireEngine(world)
+    resources = SimpleNamespace(aggregates={}, spawn_tables=SimpleNamespace(table=lambda zone, vnum: None))
+    return world, grimoire, PopulationLOD(world, resources)
+
+
+def _legend(grimoire, name):
+    legend = grimoire._create_legend("death", {"player_name": name}, 50)
+    grimoire.add_legend(legend)
+    return legend.id
+
+
+def test_collapse_then_materialize_keeps_believers(monkeypatch, tmp_path):
+    world, grimoire, lod = _setup(monkeypatch, tmp_path)
+    ratos = [world.spawn_npc(RATO, 100001) for _ in range(3)]
+    lobo = world.spawn_npc(LOBO, 100002)
+    ana, bia = _legend(grimoire, "Ana"), _legend(grimoire, "Bia")
+    for npc in ratos[:2] + [lobo]:
+        grimoire.teach(npc.uid, ana)
+    grimoire.teach(ratos[0].uid, bia)
+    spread = {legend_id: grimoire.legends[legend_id].spread_count for legend_id in (ana, bia)}
+
+    assert lod.collapse(ZONE) == 4
+    assert grimoire.believer_count(ana) == 0
+    assert lod.materialize(ZONE) == 4
+
+    assert grimoire.believer_count(ana) == 3
+    assert grimoire.believer_count(bia) == 1
+    assert all(uid in world.active_npcs for uid in grimoire.knowledge.believers_of(ana))
+    # Relembrar não é contar a história de novo
+    assert {legend_id: grimoire.legends[legend_id].spread_count for legend_id in (ana, bia)} == spread
+
+
+def test_recall_survives_journal_replay(monkeypatch, tmp_path):
+    world, grimoire, lod = _setup(monkeypatch, tmp_path)
+    rato = world.spawn_npc(RATO, 100001)
+    ana = _legend(grimoire, "Ana")
+    grimoire.teach(rato.uid, ana)
+    lod.collapse(ZONE)
+    lod.materialize(ZONE)
+    grimoire.journal.flush_sync()
+
+    reloaded = GrimoireEngine(WorldManager())
+    reloaded.load_grimoire()
+    assert reloaded.believer_count(ana) == 1
+    assert reloaded.legends[ana].spread_count == grimoire.legends[ana].spread_count
@@ -0,0 +1,36 @@
+# tests/test_rng_streams.py
+"""Títulos Nemesis e lendas saem dos fluxos semeados do mundo (reprodutíveis)."""
+from backend.game.engines.ai.nemesis import NemesisEngine
+from backend.game.engines.lore.grimoire import GrimoireEngine
+from backend.game.utils.rng import RngStreams
+from backend.game.world.world_manager import WorldManager
+
+
+def _world(seed: int) -> WorldManager:
+    world = WorldManager()
+    world.rng = RngStreams(seed)
+    return world
+
+
+def _run(seed: int):
+    world = _world(seed)
+    nemesis = NemesisEngine(world)
+    titles = [nemesis._generate_title(kind, "Ana") for kind in ("slash", "fire", "bite") * 10]
+    grimoire = GrimoireEngine(world)
+    legends = [grimoire._create_legend("fatality", {"player_name": "Ana"}, 70) for _ in range(5)]
+    return titles, [l.title for l in legends]
+
+
+def test_same_seed_same_titles_and_legends():
+    assert _run(1234) == _run(1234)
+
+
+def test_legend_ids_do_not_repeat_across_boots():
+    # Mesma semente em dois boots não pode reusar o id de uma lenda já gravada
+    ids = [GrimoireEngine(_world(1234))._create_legend("death", {"player_name": "Ana"}, 50).id
+           for _ in range(2)]
+    assert ids[0] != ids[1]
+
+
+def test_different_seed_diverges():
+    assert _run(1234) != _run(4321)
@@ -0,0 +1,47 @@
+# tests/test_timing_wheel.py
+"""Roda de tempo hierárquica: disparo no tick exato, através das cascatas."""
+from backend.game.utils.timing_wheel import HierarchicalTimingWheel
+
+
+def _run_until(wheel, last_tick):
+    fired = []
+    for _ in range(last_tick):
+        for handle in wheel.advance(1):
+            fired.append((wheel.current_tick, handle.args[0]))
+    return fired
+
+
+def test_timers_fire_on_their_tick_across_levels_and_overflow():
+    # 4 slots x 3 níveis: alcance 4, 16, 64; além disso vai para o overflow
+    wheel = HierarchicalTimingWheel(slots_per_level=4, levels=3)
+    delays = list(range(1, 200)) + [63, 64, 65, 255, 256, 257]
+    for delay in delays:
+        wheel.schedule(delay, None, delay)
+    assert len(wheel) == len(delays)
+
+    fired = _run_until(wheel, 300)
+    assert sorted(fired) == sorted((d, d) for d in delays)
+    assert all(tick == delay for tick, delay in fired)
+    assert len(wheel) == 0
+
+
+def test_timers_scheduled_mid_run_and_cancelled():
+    wheel = HierarchicalTimingWheel(slots_per_level=4, levels=2)
+    wheel.advance(37)
+    keep = [wheel.schedule(d, None, 37 + d) for d in (1, 3, 15, 16, 17, 40)]
+    dropped = wheel.schedule(20, None, -1)
+    assert wheel.cancel(dropped)
+    assert not wheel.cancel(dropped)
+
+    fired = _run_until(wheel, 100)
+    assert [label for _, label in fired] == sorted(h.deadline for h in keep)
+    assert all(tick == label for tick, label in fired)
+    assert all(h.fired for h in keep) and not dropped.fired
+
+
+def test_past_deadline_fires_next_tick():
+    wheel = HierarchicalTimingWheel(slots_per_level=8, levels=2)
+    wheel.advance(10)
+    handle = wheel.schedule_at(3, None, "late")
+    assert [h.args[0] for h in wheel.advance(1)] == ["late"]
+    assert handle.fired
@@ -0,0 +1,35 @@
+# tests/test_world_factory.py
+"""Carga de salas: entrada de spawn ruim é pulada sem derrubar a sala."""
+import json
+
+from backend.game.world.factory import ObjectFactory
+
+
+def _room(title, spawns):
+    return {"title": title, "description_day": "...", "spawns": spawns}
+
+
+def test_string_npc_id_skips_entry_not_room(tmp_path):
+    rooms = {
+        "100001": _room("Praça", [{"npc_id": 100010, "count": 2}]),
+        "100002": _room("Mercado", [{"npc_id": "merchant", "count": 2, "respawn_time": 300},
+                                    {"npc_vnum": "100011", "weight": 1.5}]),
+    }
+    (tmp_path / "rooms.json").write_text(json.dumps(rooms), encoding="utf-8")
+    factory = ObjectFactory(str(tmp_path))
+    factory._load_rooms()
+
+    assert set(factory._room_templates) == {100001, 100002}
+    assert factory._room_templates[100001].spawns == {100010: 2.0}
+    assert factory._room_templates[100002].spawns == {100011: 1.5}
+
+
+def test_bad_weights_and_entries_are_skipped():
+    spawns = ObjectFactory._parse_spawns([
+        {"npc_id": 100010, "weight": "muito"},
+        {"npc_id": 100010, "count": -1},
+        {"count": 3},
+        "100012",
+        {"npc_id": 100010, "count": 1},
+    ], 100001)
+    assert spawns == {100010: 1.0}